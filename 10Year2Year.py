@@ -28,20 +28,24 @@ ZOOM: Set START_YEAR / END_YEAR
 """
 
 import pandas as pd
-import pandas_datareader.data as web
+from utils.providers import web
 import matplotlib.pyplot as plt
 from datetime import datetime
+from utils.download import download
+from utils.downsample import downsample
 
 # ———————————————— ZOOM SETTINGS ————————————————
 START_YEAR = 1980
 END_YEAR   = None  # None = today
+SHOW_REGIMES = True  # shade the HMM turbulent-regime probability (curve volatility)
+DOWNSAMPLE = 'minmax'  # None = plot every point | 'minmax' | 'lttb' (utils/downsample.py)
 # ———————————————————————————————————————————————
 
 start = datetime(START_YEAR, 1, 1)
 end   = datetime.now() if END_YEAR is None else datetime(END_YEAR, 12, 31)
 
-# Fetch data
-yield_curve = web.DataReader('T10Y2Y', 'fred', start, end)
+# Fetch data (45 years of daily points: chunked + resumable, see utils/download.py)
+yield_curve = download('T10Y2Y', start, end, lambda key, s, e: web.DataReader(key, 'fred', s, e))
 recession   = web.DataReader('USREC',  'fred', start, end)
 
 # ———————————————— DARK MODE STYLE ————————————————
@@ -63,8 +67,9 @@ plt.rcParams.update({
 
 fig, ax = plt.subplots(figsize=(14, 7))
 
-# Main spread line — thinner, elegant
-ax.plot(yield_curve.index, yield_curve['T10Y2Y'],
+# Main spread line — thinner, elegant (reduced to ~2k points, extremes kept)
+line = downsample(yield_curve['T10Y2Y'], DOWNSAMPLE)
+ax.plot(line.index, line,
         color='#cccccc', linewidth=1.4, label='10Y - 2Y Spread')
 
 # Recession shading — darker, richer red
@@ -88,6 +93,14 @@ if in_recession:
 # Zero line — slightly darker red, less aggressive
 ax.axhline(0, color='#ff6b6b', linestyle='--', linewidth=1.3, alpha=0.8, label='Inversion (0%)')
 
+# Regime band: P(turbulent) from a 2-state HMM, filtered online (utils/regimes.py)
+regimes = None
+if SHOW_REGIMES:
+    from utils.regimes import regime_band, regime_probabilities
+    regimes = regime_probabilities('yield_curve', yield_curve)
+    if regimes is not None:
+        regime_band(ax, regimes['turbulent'])
+
 # Title & labels
 ax.set_title(f'10-Year minus 2-Year Treasury Yield Spread ({START_YEAR}–{END_YEAR or "Now"})\n'
              f'Last: {yield_curve["T10Y2Y"].iloc[-1]:.2f}%',
@@ -109,4 +122,16 @@ plt.show()
 
 # ———————————————— FINAL SUMMARY ————————————————
 latest = yield_curve.iloc[-1]['T10Y2Y']
-print(f"Latest: {latest:.2f}% | Data Frequency: Daily (updated ~3:30 PM ET)")
\ No newline at end of file
+print(f"Latest: {latest:.2f}% | Data Frequency: Daily (updated ~3:30 PM ET)")
+if regimes is not None:
+    print(f"Regime: P(turbulent) = {regimes['turbulent'].iloc[-1]:.0%}")
+
+# Warning before recession starts, with a bootstrap CI over episodes (utils/bootstrap.py)
+from utils.bootstrap import describe, episode_stats, summarize
+leads = episode_stats({'T10Y2Y': yield_curve, 'USREC': recession}, ['Inversion lead'])
+print(f"Inversion lead: {describe(summarize(leads).iloc[0])}")
+
+# Forward: odds of the next inversion / un-inversion and the move needed (utils/scenarios.py)
+from utils.scenarios import describe as describe_scenario, project
+signal = 'uninversion' if latest < 0 else 'inversion'
+print(f"Scenarios: {describe_scenario(project(yield_curve['T10Y2Y'], signal))}")
\ No newline at end of file
@@ -26,21 +26,40 @@ DATA SOURCES (FRED)
 DATA FREQUENCY: Weekly, As of Wednesday (FRED update: H.4.1 Release)
 
 ZOOM: Set START_YEAR
+
+USAGE:
+  ./FedAssets.py               → total assets (WALCL)
+  ./FedAssets.py --components  → H.4.1 breakdown: stacked assets / liabilities + weekly change table
 ===============================================================================
 """
 
+import sys
 import pandas as pd
-import pandas_datareader.data as web
+from utils.providers import web
 import matplotlib.pyplot as plt
 from datetime import datetime
 
 # ———————————————— OPTIONS ————————————————
 START_YEAR = 2005 # Total assets became relevant with QE after 2008
+SHOW_COMPONENTS = '--components' in sys.argv
 # ———————————————————————————————————————————————
 
 start = datetime(START_YEAR, 1, 1)
 end   = datetime.now()
 
+# ———————————————— COMPONENTS MODE ————————————————
+if SHOW_COMPONENTS:
+    from utils import balance_sheet as bs
+    from utils.charts import recession_spans
+    from utils.store import SeriesStore
+
+    store = SeriesStore()
+    panel = bs.components(bs.load(store))
+    print('\n'.join(bs.format_attribution(panel, bs.attribution(panel))))
+    bs.plot(panel.loc[start:], recession_spans(store.get('USREC', start=bs.START)))
+    plt.show()
+    sys.exit(0)
+
 # Fetch data
 # WALCL: Assets: Total Assets: Total Assets (Less Eliminations from Consolidation): Wednesday Level (Millions of U.S. Dollars)
 fed_assets = web.DataReader('WALCL', 'fred', start, end)
@@ -28,6 +28,10 @@ DATA SOURCES
 DATA FREQUENCY: Daily (market close; updated ~4:00 PM ET)
 
 ZOOM: Auto-adapts to available data (GLD starts 2004)
+
+USAGE:
+  ./GLD_over_TLT.py         → 15-year daily history
+  ./GLD_over_TLT.py --live  → Today's 1-minute ratio, refreshed in place every LIVE_INTERVAL s
 ===============================================================================
 """
 
@@ -35,55 +39,94 @@ import os
 os.environ['MATPLOTLIB_NO_SECURE_CODING_WARNING'] = '1'
 
 import pandas as pd
-import yfinance as yf
-import pandas_datareader.data as web
+from utils.providers import yf
+from utils.providers import web
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+import sys
 import time
-import requests
+from utils.download import download, DownloadError
+from utils.downsample import downsample
+
+USE_LIVE = '--live' in sys.argv
+LIVE_INTERVAL = 60  # seconds between refreshes in --live mode
+EXCHANGE_TZ = 'America/New_York'  # live axis in NYSE time (bars are stored as UTC epoch ns)
+SHOW_REGIMES = True  # shade the HMM turbulent-regime probability (risk-off volatility)
+DOWNSAMPLE = 'minmax'  # None = plot every point | 'minmax' | 'lttb' (utils/downsample.py)
 
 # ----------------------------------------------------------------------
 # 1. CONFIG – 15 years
 # ----------------------------------------------------------------------
 end = datetime.now()
 start = end - timedelta(days=15 * 365)
-fallback_start = end - timedelta(days=365)
 
-print(f"Trying date range: {start.date()} → {end.date()}")
+print(f"Date range: {start.date()} → {end.date()}")
 
 # ----------------------------------------------------------------------
-# 2. FETCH PRICE DATA – WITH RETRY + TIMEOUT
+# 2. FETCH PRICE DATA – chunked, parallel, resumable (utils/download.py)
 # ----------------------------------------------------------------------
-def download_price(tickers, start, end, retries=2, timeout=60):
-    for attempt in range(retries + 1):
-        try:
-            df = yf.download(
-                tickers=tickers,
-                start=start,
-                end=end,
-                auto_adjust=False,
-                progress=False,
-                timeout=timeout
-            )['Adj Close']
-            if not df.empty:
-                return df
-        except Exception as e:
-            print(f"  yfinance attempt {attempt+1} failed: {e}")
-            time.sleep(5)
-    raise RuntimeError("All yfinance attempts failed")
+def fetch_prices(tickers, start, end):
+    df = yf.download(tickers=tickers, start=start, end=end, auto_adjust=False,
+                     progress=False, timeout=60)
+    if df.empty:
+        return pd.DataFrame(columns=tickers, dtype=float)
+    return df['Adj Close']
+
+# ----------------------------------------------------------------------
+# LIVE MODE – intraday ratio, figure built once, only line + title redrawn
+# ----------------------------------------------------------------------
+def run_live(interval=LIVE_INTERVAL):
+    from utils.charts import LiveChart
+    from utils.ticks import LiveMarket
+
+    market = LiveMarket(tick_capacity=5000, bar_capacity=1000)
+    chart = LiveChart({'ratio': dict(color='#ffcc00', linewidth=2, label='GLD / TLT Ratio')},
+                      ylabel='GLD / TLT', date_format='%H:%M')
+    seen = None
+    try:
+        while True:
+            try:
+                px = yf.download(tickers=['GLD', 'TLT'], period='1d', interval='1m',
+                                 auto_adjust=False, progress=False)['Close'].dropna()
+            except Exception as e:
+                print(f"  yfinance refresh failed: {e}")
+                px = pd.DataFrame(columns=['GLD', 'TLT'])
+            new = px if seen is None else px[px.index > seen]
+            for ts, row in new.iterrows():
+                market.on_tick('GLD', ts, row['GLD'])
+                market.on_tick('TLT', ts, row['TLT'])
+            if not new.empty:
+                seen = new.index[-1]
+
+            bars = market.bars('GLD/TLT', '1m')
+            if len(bars):
+                times = pd.to_datetime(bars['t'], utc=True).tz_convert(EXCHANGE_TZ).tz_localize(None)
+                chart.set_data('ratio', times, bars['close'])
+                chart.set_title(f'GLD / TLT Ratio – Live (1-min)\n'
+                                f'Latest: {bars["close"][-1]:.4f} | Updated {datetime.now():%H:%M}')
+                chart.redraw()
+                print(f"{datetime.now():%H:%M:%S} GLD/TLT: {bars['close'][-1]:.4f}")
+            chart.pause(interval)
+    except KeyboardInterrupt:
+        chart.close()
+
+if USE_LIVE:
+    run_live()
+    sys.exit(0)
 
 print("Fetching GLD & TLT from Yahoo Finance...")
-price = download_price(['GLD', 'TLT'], start, end)
+incomplete = False
+try:
+    price = download(['GLD', 'TLT'], start, end, fetch_prices, years=3, name='yahoo:GLD+TLT')
+except DownloadError as e:
+    # finished chunks are checkpointed; the next run only refetches the failed ones
+    print(f"  {e}")
+    price, incomplete = e.partial, True
 
 print(f"Raw price rows: {len(price)}")
 
-# ---- fallback -------------------------------------------------------
 if price.empty or 'GLD' not in price.columns or 'TLT' not in price.columns:
-    print("15y fetch failed – trying last 1 year...")
-    price = download_price(['GLD', 'TLT'], fallback_start, end)
-    print(f"Fallback rows: {len(price)}")
-    start = fallback_start
-
+    price = pd.DataFrame(columns=['GLD', 'TLT'], dtype=float)
 price = price.dropna()
 print(f"Rows after dropna: {len(price)}")
 
@@ -123,7 +166,8 @@ if ratio.empty:
             color='red', fontsize=16)
     ax.set_title('GLD / TLT Ratio – Error', color='white')
 else:
-    ax.plot(ratio.index, ratio, color='#ffcc00', linewidth=2,
+    line = downsample(ratio, DOWNSAMPLE)
+    ax.plot(line.index, line, color='#ffcc00', linewidth=2,
             label='GLD / TLT Ratio')
 
     in_rec = False
@@ -146,7 +190,16 @@ else:
         ax.axvspan(rec_start, ratio.index[-1], color='gray', alpha=0.3, label=lbl)
 
     ax.axhline(1.0, color='white', linestyle='--', linewidth=1.2, alpha=0.7)
-    period = "15-Year History" if (end - start).days > 1000 else "1-Year"
+
+    # Regime band: P(turbulent) from a 2-state HMM, filtered online (utils/regimes.py)
+    regimes = None
+    if SHOW_REGIMES and not incomplete:
+        from utils.regimes import regime_band, regime_probabilities
+        regimes = regime_probabilities('gld_tlt', ratio)
+        if regimes is not None:
+            regime_band(ax, regimes['turbulent'])
+
+    period = "15-Year History" + (" (incomplete – rerun to resume)" if incomplete else "")
     ax.set_title(f'GLD / TLT Ratio – {period}', color='white', fontsize=16, pad=15)
     ax.set_xlabel('Year', color='white')
     ax.set_ylabel('GLD / TLT', color='white')
@@ -164,5 +217,7 @@ plt.show()
 # ----------------------------------------------------------------------
 if not ratio.empty:
     print(f"\nLatest GLD/TLT: {ratio.iloc[-1]:.3f}  ({ratio.index[-1].date()})")
+    if regimes is not None:
+        print(f"Regime: P(turbulent) = {regimes['turbulent'].iloc[-1]:.0%}")
 else:
     print("\nNo data plotted.")
\ No newline at end of file
@@ -28,22 +28,30 @@ DATA FREQUENCY: Daily (published each business day ~8-9 AM ET for repo rates, ~4
 USAGE:
   ./repo_spread.py          → Full history (2016–Now) + 30-day MA
   ./repo_spread.py --30day  → Last 30 days only (no MA)
+  ./repo_spread.py --live   → Last 30 days, refreshed in place every LIVE_INTERVAL s
 ===============================================================================
 """
 
 import pandas as pd
-import pandas_datareader.data as web
+from utils.providers import web
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, timedelta
 import sys
 
-# ———————————————— CLI FLAG: --30day ————————————————
-USE_30DAY = '--30day' in sys.argv
+from utils.splice import REPO, FLOOR, combined_regime
+from utils.downsample import downsample
+
+# ———————————————— CLI FLAGS: --30day / --live ————————————————
+USE_LIVE  = '--live' in sys.argv                  # live mode always uses the 30-day window
+USE_30DAY = '--30day' in sys.argv or USE_LIVE
+LIVE_INTERVAL = 300  # seconds between refreshes in --live mode
 
 # ———————————————— ZOOM SETTINGS ————————————————
 DEFAULT_START_YEAR = 2016
 END_YEAR = None  # None = today
+SHOW_REGIMES = True  # shade the HMM turbulent-regime probability
+DOWNSAMPLE = 'minmax'  # None = plot every point | 'minmax' | 'lttb' (utils/downsample.py)
 
 if USE_30DAY:
     end   = datetime.now()
@@ -52,31 +60,60 @@ else:
     end   = datetime.now() if END_YEAR is None else datetime(END_YEAR, 12, 31)
     start = datetime(DEFAULT_START_YEAR, 1, 1)
 
-sofr_start = datetime(2018, 4, 3)
-iorb_start = datetime(2021, 7, 29)
+# Repo: OBFR → SOFR (2018-04-03) | Floor: IOER → IORB (2021-07-29)
+sofr_start = REPO.cutovers[1]
+iorb_start = FLOOR.cutovers[1]
 
-# Fetch data
-obfr = web.DataReader('OBFR', 'fred', start, end)
-sofr = web.DataReader('SOFR', 'fred', start, end)
-ioer = web.DataReader('IOER', 'fred', start, end)
-iorb = web.DataReader('IORB', 'fred', start, end)
+def build_spread(start, end):
+    """Fetch the four rates and return Repo, Floor, Spread_bp and Metric."""
+    rates = {key: web.DataReader(key, 'fred', start, end) for key in REPO.keys + FLOOR.keys}
 
-# Build repo & floor
-repo  = pd.concat([obfr, sofr], axis=1).max(axis=1).to_frame('Repo')
-floor = pd.concat([ioer, iorb], axis=1).max(axis=1).to_frame('Floor')
+    # Build repo & floor — each date uses the benchmark in force that day
+    data = pd.concat([REPO.resolve(rates), FLOOR.resolve(rates)], axis=1).dropna()
+    data['Spread_bp'] = (data['Repo'] - data['Floor']) * 100
 
-# Merge & compute
-data = pd.concat([repo, floor], axis=1).dropna()
-data['Spread_bp'] = (data['Repo'] - data['Floor']) * 100
+    # Label metric (categorical: one small code per row, labels stored once)
+    data['Metric'] = combined_regime(data.index, REPO, FLOOR)
+    return data
+
+# Fetch data
+data = build_spread(start, end)
 
 # Only compute MA in full history mode
 if not USE_30DAY:
     data['MA_30d'] = data['Spread_bp'].rolling(30, min_periods=1).mean()
 
-# Label metric
-data['Metric'] = 'OBFR – IOER'
-data.loc[data.index >= sofr_start, 'Metric'] = 'SOFR – IOER'
-data.loc[data.index >= iorb_start, 'Metric'] = 'SOFR – IORB'
+# ———————————————— LIVE MODE ————————————————
+# Figure + dark style are built once; each refresh only swaps the line data and
+# the title text, and LiveChart blits them over the cached background.
+if USE_LIVE:
+    from utils.charts import LiveChart
+
+    chart = LiveChart({'spread': dict(color='#4da6ff', linewidth=1.4, label='Daily Spread')},
+                      ylabel='Spread (basis points)', date_format='%m-%d')
+    chart.ax.axhspan(30, 10_000, color='#ff6b6b', alpha=0.12)            # stress zone, clipped by ylim
+    chart.ax.axhline(0, color='#888888', linestyle='--', linewidth=1.2, alpha=0.6)
+    try:
+        while True:
+            latest = data.iloc[-1]
+            chart.set_data('spread', data.index, data['Spread_bp'])
+            chart.set_title(f'Repo Spread vs. Fed Floor Rate (Live – Last 30 Days)\n'
+                            f'Current: {latest["Metric"]} | {latest["Spread_bp"]:.1f} bp '
+                            f'| Updated {datetime.now():%H:%M}')
+            chart.redraw()
+            print(f"{datetime.now():%H:%M:%S} Latest: {latest['Spread_bp']:.1f} bp | {latest['Metric']}")
+            chart.pause(LIVE_INTERVAL)
+
+            end   = datetime.now()
+            start = end - timedelta(days=30)
+            try:
+                data = build_spread(start, end)
+            except Exception as e:
+                print(f"  refresh failed, keeping last data: {e}")
+                continue
+    except KeyboardInterrupt:
+        chart.close()
+    sys.exit(0)
 
 # ———————————————— DARK MODE STYLE ————————————————
 plt.style.use('dark_background')
@@ -99,8 +136,9 @@ plt.rcParams.update({
 # Plot
 fig, ax = plt.subplots(figsize=(14, 7))
 
-# Daily spread
-ax.plot(data.index, data['Spread_bp'], color='#4da6ff', linewidth=1.4, label='Daily Spread')
+# Daily spread (reduced to ~2k points; min/max per bucket keeps every spike)
+line = downsample(data['Spread_bp'], DOWNSAMPLE)
+ax.plot(line.index, line, color='#4da6ff', linewidth=1.4, label='Daily Spread')
 
 # 30-day MA (only in full history)
 if not USE_30DAY:
@@ -116,6 +154,14 @@ if not USE_30DAY:
 # Stress zone
 ax.fill_between(data.index, 30, data['Spread_bp'].max(), color='#ff6b6b', alpha=0.12, label='Stress (>30 bp)')
 
+# Regime band: P(turbulent) from a 2-state HMM, filtered online (utils/regimes.py)
+regimes = None
+if SHOW_REGIMES:
+    from utils.regimes import regime_band, regime_probabilities
+    regimes = regime_probabilities('repo_spread', data)
+    if regimes is not None:
+        regime_band(ax, regimes['turbulent'])
+
 # Zero line
 ax.axhline(0, color='#888888', linestyle='--', linewidth=1.2, alpha=0.6)
 
@@ -148,4 +194,6 @@ plt.show()
 # ———————————————— FINAL SUMMARY ————————————————
 latest = data.iloc[-1]
 ma_text = f" | 30d MA: {data['MA_30d'].iloc[-1]:.1f} bp" if not USE_30DAY else ""
-print(f"Latest: {latest['Spread_bp']:.1f} bp{ma_text} | {latest['Metric']}")
\ No newline at end of file
+print(f"Latest: {latest['Spread_bp']:.1f} bp{ma_text} | {latest['Metric']}")
+if regimes is not None:
+    print(f"Regime: P(turbulent) = {regimes['turbulent'].iloc[-1]:.0%}")
\ No newline at end of file
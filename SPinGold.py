@@ -27,13 +27,15 @@ ZOOM: Set START_YEAR (data starts 2004 for GLD)
 """
 
 import pandas as pd
-import yfinance as yf
-import pandas_datareader.data as web
+from utils.providers import yf
+from utils.providers import web
 import matplotlib.pyplot as plt
 from datetime import datetime
+from utils.downsample import downsample
 
 # ———————————————— ZOOM SETTINGS ————————————————
 START_YEAR = 2004  # GLD starts Nov 2004
+DOWNSAMPLE = 'minmax'  # None = plot every point | 'minmax' | 'lttb' (utils/downsample.py)
 # ———————————————————————————————————————————————
 
 start = datetime(START_YEAR, 1, 1)
@@ -77,7 +79,8 @@ try:
     plt.style.use('dark_background')
     fig, ax = plt.subplots(figsize=(14, 7))
 
-    ax.plot(ratio.index, ratio, color='#4da6ff', linewidth=1.6, label='S&P 500 Priced in Gold')
+    line = downsample(ratio, DOWNSAMPLE)
+    ax.plot(line.index, line, color='#4da6ff', linewidth=1.6, label='S&P 500 Priced in Gold')
 
     # Recession shading
     in_rec = False
@@ -28,9 +28,11 @@ ZOOM: Set START_YEAR
 """
 
 import pandas as pd
-import pandas_datareader.data as web
+from utils.providers import web
 import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
+from datetime import datetime
+from utils.releases import status as release_status
+from utils.indicators import sahm_rule, sahm_status
 
 # ———————————————— OPTIONS ————————————————
 START_YEAR = 1950
@@ -45,17 +47,15 @@ unrate = web.DataReader('UNRATE', 'fred', start, end)
 recession = web.DataReader('USREC', 'fred', start, end)
 
 # ———————————————— SAHM RULE ————————————————
-unrate['3MMA'] = unrate['UNRATE'].rolling(3).mean()
-unrate['12M_Low'] = unrate['3MMA'].rolling(12).min().shift(1)
-unrate['Sahm_Rule'] = unrate['3MMA'] - unrate['12M_Low']
-unrate['Sahm_Trigger'] = unrate['Sahm_Rule'] >= 0.5
+# 3MMA, prior 12-month low, rise and trigger: the same rule the dashboard, backtest and scenarios use
+unrate = sahm_rule(unrate)
 
 triggers = unrate[unrate['Sahm_Trigger']].dropna()
 
 # Current Sahm status
 current_sahm = unrate['Sahm_Rule'].iloc[-1]
 current_unrate = unrate['UNRATE'].iloc[-1]
-status = "TRIGGERED" if current_sahm >= 0.5 else "Near Trigger" if current_sahm >= 0.35 else "Safe"
+status = sahm_status(current_sahm)
 
 # ———————————————— PRINT LAST 4 SAHM READINGS ————————————————
 print("\n=== LAST 4 SAHM RULE READINGS (Date | Unemployment | 3MMA | Sahm Rise) ===")
@@ -63,8 +63,10 @@ last_4 = unrate[['UNRATE', '3MMA', 'Sahm_Rule']].tail(4)
 for date, row in last_4.iterrows():
     print(f"{date.strftime('%b %Y')}: {row['UNRATE']:.1f}% | 3MMA = {row['3MMA']:.2f} | Sahm = {row['Sahm_Rule']:.2f} pp")
 
-if last_4.index[-1] < datetime.now() - timedelta(days=45):
-    print("(Note: Data may be stale — FRED lags after BLS releases)")
+freshness = release_status('UNRATE', last_4.index[-1])
+if freshness['status'] != 'fresh':
+    print(f"(Note: {freshness['next_obs']:%b %Y} reading was due {freshness['expected']:%a %b %d %H:%M} ET "
+          f"and isn't on FRED yet — {freshness['status']})")
 
 # ———————————————— DARK MODE PLOT ————————————————
 plt.style.use('dark_background')
@@ -116,4 +118,13 @@ if not triggers.empty:
     last = triggers.iloc[-1]
     print(f"Last Sahm Trigger: {last.name.strftime('%B %Y')} ({last['Sahm_Rule']:.2f} pp)")
 else:
-    print("No Sahm triggers in this period")
\ No newline at end of file
+    print("No Sahm triggers in this period")
+
+# Lag to recession starts, with a bootstrap CI over episodes (utils/bootstrap.py)
+from utils.bootstrap import describe, episode_stats, summarize
+lags = episode_stats({'UNRATE': unrate[['UNRATE']], 'USREC': recession}, ['Sahm trigger lag'])
+print(f"Sahm trigger vs. recession start: {describe(summarize(lags).iloc[0])}")
+
+# Forward: odds of a trigger and the rise that would cause one (utils/scenarios.py)
+from utils.scenarios import describe as describe_scenario, project
+print(f"Scenarios: {describe_scenario(project(unrate['UNRATE'], 'sahm'))}")
\ No newline at end of file
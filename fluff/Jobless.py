@@ -1,7 +1,12 @@
+import os, sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))   # repo root, for utils/
 import pandas as pd
-import pandas_datareader.data as web
+from utils.providers import web
 import matplotlib.pyplot as plt
 from datetime import datetime
+from utils.downsample import downsample
+
+DOWNSAMPLE = 'minmax'  # None = plot every point | 'minmax' | 'lttb' (utils/downsample.py)
 
 # Set the start and end dates
 start_date = datetime.now() - pd.DateOffset(years=30)
@@ -15,7 +20,7 @@ recession_data = web.DataReader('USREC', 'fred', start_date, end_date)
 
 # Plotting
 plt.figure(figsize=(10, 6))
-plt.plot(initial_jobless_claims, label='Initial Jobless Claims', color='blue')
+plt.plot(downsample(initial_jobless_claims, DOWNSAMPLE), label='Initial Jobless Claims', color='blue')
 
 # Add shading for recessions
 in_recession = False
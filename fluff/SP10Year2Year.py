@@ -1,8 +1,13 @@
+import os, sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))   # repo root, for utils/
 import pandas as pd
-import yfinance as yf
-import pandas_datareader.data as web
+from utils.providers import yf
+from utils.providers import web
 import matplotlib.pyplot as plt
 from datetime import datetime
+from utils.downsample import downsample
+
+DOWNSAMPLE = 'minmax'  # None = plot every point | 'minmax' | 'lttb' (utils/downsample.py)
 
 # Set the start and end dates
 start_date = datetime.now() - pd.DateOffset(years=30)
@@ -20,7 +25,7 @@ sp500 = yf.download('^GSPC', start=start_date, end=end_date)['Adj Close']
 # Plotting
 fig, ax1 = plt.subplots(figsize=(12, 8))
 
-ax1.plot(yield_curve, label='10-Year minus 2-Year Treasury Yield', color='blue')
+ax1.plot(downsample(yield_curve, DOWNSAMPLE), label='10-Year minus 2-Year Treasury Yield', color='blue')
 ax1.set_xlabel('Year')
 ax1.set_ylabel('Yield Difference (%)', color='blue')
 ax1.tick_params(axis='y', labelcolor='blue')
@@ -44,7 +49,7 @@ ax1.axhline(y=0, color='black', linewidth=2.0)
 
 # Create a secondary y-axis for the S&P 500
 ax2 = ax1.twinx()
-ax2.plot(sp500, label='S&P 500 Index', color='lightgray')
+ax2.plot(downsample(sp500, DOWNSAMPLE), label='S&P 500 Index', color='lightgray')
 ax2.set_ylabel('S&P 500 Index', color='gray')
 ax2.tick_params(axis='y', labelcolor='gray')
 
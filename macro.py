@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+
+"""
+===============================================================================
+MACRO | Command line for reports and analysis over the cached series
+===============================================================================
+
+WHAT IT DOES
+  One entry point for everything that works across indicators rather than
+  drawing a single chart. Data comes from the local SeriesStore
+  (utils/store.py), which is refreshed incrementally from FRED / Yahoo.
+
+USAGE:
+  ./macro.py report [--out reports] [--only yield_curve,unemployment] [--force]
+  ./macro.py scan   [--horizons 1,4] [--top 20] [--all]
+  ./macro.py recession [--link logit|probit] [--horizon 12] [--features T10Y2Y,SAHM] [--plot | --save FILE]
+  ./macro.py leadlag [--freq M|W|Q] [--max-lag 24] [--series T10Y2Y,UNRATE,...] [--top 15] [--plot | --save FILE]
+  ./macro.py export [--format csv|ndjson|parquet] [--out exports] [--only repo_spread,gld_tlt] [--full]
+  ./macro.py overview [--only yield_curve,repo_spread] [--since 2005] [--save FILE]
+  ./macro.py sahm   [--windows 1-6] [--lookbacks 6:24:2] [--thresholds 0.2:0.8:0.05] [--workers 4] [--top 20]
+  ./macro.py regimes [--only repo_spread,yield_curve,gld_tlt] [--refit]
+  ./macro.py validate [--only UNRATE,yahoo:GLD] [--all] [--json] [--strict]
+  ./macro.py events [--n 20000] [--ci 0.9] [--stat mean|median] [--workers 4]
+  ./macro.py scenarios [--signal sahm,inversion,uninversion] [--paths 10000] [--horizon 24] [--model ar|rw] [--shocks normal|bootstrap]
+  ./macro.py query  "SELECT quarter, MAX(Spread_bp) FROM repo_spread GROUP BY quarter" [--csv] [--max-rows 50] [--engine sqlite|duckdb] | --tables
+  ./macro.py fed    [--weeks 8] [--since 2008] [--plot | --save FILE]
+  ./macro.py ratios [--tickers GLD,TLT,SPY,UUP,BTC-USD] [--window 63] [--top 15] [--pair GLD/TLT --plot | --save FILE]
+  ./macro.py latest [--series T10Y2Y,UNRATE,yahoo:GLD] [--n 2]
+  ./macro.py dash   [--interval 60] [--once] [--offline]   (text only; never imports matplotlib)
+  ./macro.py schedule [--status | --once]   (default: run until interrupted, fetching as releases land)
+  ./macro.py charts [--mode replay|record|live] [--out charts] [--only FedAssets.py,...] [--no-cache]
+
+Heavy imports (matplotlib, pandas_datareader, yfinance) happen inside each
+command, so light commands start fast.
+===============================================================================
+"""
+
+import argparse
+import sys
+
+
+def _names(value):
+    return [n.strip() for n in value.split(',') if n.strip()] if value else None
+
+
+def _ints(value):
+    return tuple(int(v) for v in value.split(',') if v.strip())
+
+
+def _show_or_save(args, make_fig):
+    """Show the figure, or write it to --save (Agg, no window)."""
+    import matplotlib
+    if args.save:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    fig = make_fig()
+    if args.save:
+        fig.savefig(args.save, facecolor=fig.get_facecolor())
+        print(f"Saved {args.save}")
+    else:
+        plt.show()
+
+
+# ———————————————— COMMANDS ————————————————
+def cmd_report(args):
+    import html
+    from utils.deviations import format_table, scan_store
+    from utils.report import build_report
+    from utils.store import SeriesStore
+
+    store = SeriesStore()
+    sections = []
+    names = _names(args.only)
+    if names is None or len(names) > 1:
+        from utils.indicators import load_inputs
+        load_inputs(store, names)   # refresh first so the scan sees today's data
+        moves = format_table(scan_store(store, incremental=False, commit=False), top=10)
+        sections.append(('Largest moves', '<pre>' + html.escape('\n'.join(moves)) + '</pre>', moves))
+        events = _episode_summary(store)
+        sections.append(('Recession episodes (bootstrap)', '<pre>' + html.escape('\n'.join(events)) + '</pre>', events))
+    build_report(names=names, out_dir=args.out, store=store, workers=args.workers,
+                 force=args.force, extra_sections=sections)
+
+
+def cmd_scan(args):
+    from utils.deviations import format_table, scan_store
+    from utils.store import SeriesStore
+
+    result = scan_store(SeriesStore(), horizons=_ints(args.horizons),
+                        incremental=not args.all, commit=not args.dry_run)
+    print('\n'.join(format_table(result, top=args.top)))
+
+
+def cmd_recession(args):
+    import time
+    from utils import recession_model as rm
+
+    features = _names(args.features) or rm.DEFAULT_FEATURES
+    unknown = set(features) - set(rm.ALL_FEATURES)
+    if unknown:
+        sys.exit(f"Unknown feature(s): {', '.join(sorted(unknown))} (choose from {', '.join(rm.ALL_FEATURES)})")
+    t0 = time.perf_counter()
+    model, prob, matrix = rm.run(features=features, link=args.link, horizon=args.horizon)
+    elapsed = time.perf_counter() - t0
+
+    print(f"\n=== RECESSION PROBABILITY ({args.link}, next {args.horizon} months) ===")
+    print(f"Fitted on {model.n_obs} months | {model.iterations} Newton iterations | {elapsed * 1000:.0f} ms")
+    for name, coef in model.coefficients().items():
+        print(f"  {name:<16} {coef:+.3f}")
+    for date, p in prob.tail(4).items():
+        print(f"{date:%b %Y}: {p:.1%}")
+
+    if args.plot or args.save:
+        _show_or_save(args, lambda: rm.plot(prob, matrix['USREC'], args.horizon, args.link))
+
+
+def cmd_leadlag(args):
+    from utils.deviations import derived_series
+    from utils.leadlag import analyze, format_leads, plot_heatmap, top_leads
+    from utils.store import SeriesStore
+
+    store = SeriesStore()
+    cached = {k: df for k in store.keys() if (df := store.load(k)) is not None}
+    series = {**{k: v for k, v in cached.items() if k != 'USREC'}, **derived_series(cached)}
+    wanted = _names(args.series)
+    if wanted:
+        series = {k: v for k, v in series.items() if k in wanted}
+    _, lag, corr = analyze(series, freq=args.freq, max_lag=args.max_lag)
+    print('\n'.join(format_leads(top_leads(lag, corr, top=args.top), args.freq)))
+    if args.plot or args.save:
+        _show_or_save(args, lambda: plot_heatmap(lag, corr, args.freq, args.max_lag))
+
+
+def cmd_export(args):
+    from utils.export import export
+
+    written = export(names=_names(args.only), out_dir=args.out, fmt=args.format, full=args.full)
+    for name, rows in written.items():
+        print(f"{name:<16} {rows:>7} new row(s)")
+    print(f"Exported to {args.out}/ ({args.format})")
+
+
+def cmd_overview(args):
+    from utils.indicators import INDICATORS, RECESSION_KEY, compute, load_inputs
+    from utils.store import SeriesStore
+
+    names = _names(args.only) or list(INDICATORS)
+    unknown = set(names) - set(INDICATORS)
+    if unknown:
+        sys.exit(f"Unknown indicator(s): {', '.join(sorted(unknown))} (choose from {', '.join(INDICATORS)})")
+    inputs = load_inputs(SeriesStore(), names)
+    derived = {name: compute(name, inputs) for name in names}
+
+    def make_fig():
+        from utils.charts import recession_spans
+        from utils.panels import render_dashboard
+        spans = recession_spans(inputs[RECESSION_KEY])
+        return render_dashboard(names, derived, spans, since=f"{args.since}-01-01" if args.since else None)
+
+    _show_or_save(args, make_fig)
+
+
+def cmd_sahm(args):
+    import time
+    from utils import sahm_backtest as sb
+    from utils.store import SeriesStore
+
+    store = SeriesStore()
+    unrate, usrec = store.get('UNRATE', start='1948-01-01'), store.get('USREC', start='1948-01-01')
+    t0 = time.perf_counter()
+    result = sb.backtest(unrate, usrec,
+                         windows=sb.parse_grid(args.windows, int) or sb.WINDOWS,
+                         lookbacks=sb.parse_grid(args.lookbacks, int) or sb.LOOKBACKS,
+                         thresholds=sb.parse_grid(args.thresholds) or sb.THRESHOLDS,
+                         pre=args.pre, post=args.post, workers=args.workers)
+    print('\n'.join(sb.format_results(result, top=args.top, pre=args.pre, post=args.post)))
+    print(f"{time.perf_counter() - t0:.2f}s over {len(unrate)} months")
+
+
+def cmd_regimes(args):
+    from utils.indicators import compute, load_inputs
+    from utils.regimes import MIN_OBS, SPECS, current, regime_probabilities
+    from utils.store import SeriesStore
+
+    names = _names(args.only) or list(SPECS)
+    unknown = set(names) - set(SPECS)
+    if unknown:
+        sys.exit(f"No regime model for: {', '.join(sorted(unknown))} (choose from {', '.join(SPECS)})")
+    inputs = load_inputs(SeriesStore(), names)
+    print(f"\n=== HMM REGIMES (calm / turbulent) ===")
+    print(f"{'Indicator':<14} {'Latest':>9} {'Regime':<10} {'P':>5}  Since")
+    for name in names:
+        derived = compute(name, inputs)
+        prob = regime_probabilities(name, derived, refit=args.refit)
+        latest = derived[SPECS[name]['column']].dropna()
+        now = current(prob)
+        if now is None:
+            print(f"{name:<14} {'n/a':>9} (fewer than {MIN_OBS} observations)")
+            continue
+        state, p, since = now
+        print(f"{name:<14} {latest.iloc[-1]:>9.3f} {state:<10} {p:>5.0%}  {since:%Y-%m-%d}")
+
+
+def cmd_validate(args):
+    import json
+    from utils.store import SeriesStore
+    from utils.validate import format_reports, validate_store
+
+    reports = validate_store(SeriesStore(), _names(args.only))
+    if args.json:
+        print(json.dumps(reports, indent=1))
+    else:
+        print('\n'.join(format_reports(reports, show_ok=args.all)))
+    return 1 if any(r['status'] != 'ok' for r in reports.values()) and args.strict else 0
+
+
+def _episode_summary(store, n=None, ci=None, stat='mean', workers=None):
+    from utils import bootstrap as bt
+    keys = {'USREC'} | {k for keys, *_ in bt.EPISODES.values() for k in keys}
+    inputs = {}
+    for key in sorted(keys):
+        try:
+            inputs[key] = store.get(key, start='1950-01-01')
+        except Exception as e:       # one missing input only drops its statistics
+            print(f"  {key}: {e}")
+    if inputs.get('USREC') is None:
+        return ['No USREC data – recession episodes unavailable']
+    table = bt.summarize(bt.episode_stats(inputs), n=n or bt.N_BOOT, ci=ci or bt.CI,
+                         stat=stat, workers=workers)
+    return bt.format_summary(table)
+
+
+def cmd_events(args):
+    import time
+    from utils.store import SeriesStore
+
+    t0 = time.perf_counter()
+    print('\n'.join(_episode_summary(SeriesStore(), args.n, args.ci, args.stat, args.workers)))
+    print(f"{time.perf_counter() - t0:.2f}s")
+
+
+def cmd_scenarios(args):
+    from utils import scenarios as sc
+    from utils.store import SeriesStore
+
+    signals = _names(args.signal) or list(sc.SIGNALS)
+    unknown = set(signals) - set(sc.SIGNALS)
+    if unknown:
+        sys.exit(f"Unknown signal(s): {', '.join(sorted(unknown))} (choose from {', '.join(sc.SIGNALS)})")
+    store = SeriesStore()
+    for signal in signals:
+        series = store.get(sc.SIGNALS[signal]['key'], start='1948-01-01')
+        table = sc.project(series, signal, paths=args.paths, horizon=args.horizon, model=args.model,
+                           order=args.order, shocks=args.shocks, seed=args.seed)
+        print('\n'.join(sc.format_projection(table, [h for h in sc.SHOW_HORIZONS if h <= args.horizon]
+                                                   or [args.horizon])))
+        print()
+
+
+def cmd_query(args):
+    import time
+    from utils.query import MacroDB, format_result, format_tables
+
+    t0 = time.perf_counter()
+    with MacroDB(engine=args.engine) as db:
+        if db.rebuilt:
+            print(f"Synced {len(db.rebuilt)} table(s) from the cache in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+        if args.tables or not args.sql:
+            print('\n'.join(format_tables(db.tables())))
+            return 0
+        t0 = time.perf_counter()
+        try:
+            result = db.query(args.sql)
+        except Exception as e:         # sqlite3 / duckdb errors: report, don't trace back
+            sys.exit(f"Query failed: {e}")
+        elapsed = time.perf_counter() - t0
+    if args.csv:
+        result.to_csv(sys.stdout, index=False)
+    else:
+        print('\n'.join(format_result(result, args.max_rows, elapsed)))
+    return 0
+
+
+def cmd_fed(args):
+    from utils import balance_sheet as bs
+    from utils.store import SeriesStore
+
+    store = SeriesStore()
+    panel = bs.components(bs.load(store))
+    print('\n'.join(bs.format_attribution(panel, bs.attribution(panel), args.weeks)))
+    if args.plot or args.save:
+        from utils.charts import recession_spans
+        spans = recession_spans(store.get('USREC', start=bs.START))
+        _show_or_save(args, lambda: bs.plot(panel.loc[f'{args.since}-01-01':], spans))
+
+
+def cmd_ratios(args):
+    from utils.ratios import UNIVERSE, RatioMatrix, format_pairs, load_prices, plot_pair, top_pairs
+    from utils.store import SeriesStore
+
+    store = SeriesStore()
+    tickers = _names(args.tickers) or UNIVERSE
+    if args.pair:
+        a, b = args.pair.split('/')
+        tickers = list(dict.fromkeys(tickers + [a, b]))
+    matrix = RatioMatrix(load_prices(tickers, store=store))
+    print(f"{len(matrix.tickers)} tickers → {len(matrix.tickers) ** 2 - len(matrix.tickers)} ratios "
+          f"({store.fetches} download{'s' if store.fetches != 1 else ''})")
+    print('\n'.join(format_pairs(top_pairs(matrix, args.window, args.top), args.window)))
+
+    if args.pair and (args.plot or args.save):
+        from utils.charts import recession_spans
+        spans = recession_spans(store.get('USREC', start='2000-01-01'))
+        _show_or_save(args, lambda: plot_pair(matrix, a, b, spans, args.window))
+
+
+def cmd_latest(args):
+    from utils.latest import format_latest, latest
+
+    print('\n'.join(format_latest(latest(_names(args.series), n=args.n))))
+
+
+def cmd_dash(args):
+    from utils.terminal import run
+    run(interval=args.interval, once=args.once, offline=args.offline)
+
+
+def cmd_schedule(args):
+    import time
+    from datetime import datetime
+    from utils import releases
+    from utils.store import SeriesStore
+
+    store = SeriesStore()
+
+    def report():
+        rows = []
+        for key in store.keys():
+            df = store.load(key)
+            rows.append(releases.status(key, df.index[-1] if df is not None and len(df) else None,
+                                        store.meta(key)))
+        print('\n'.join(releases.format_status(rows)))
+
+    if args.status:
+        report()
+        return
+    while True:
+        before = store.fetches
+        for key in store.keys():
+            if store.is_stale(key):
+                store.refresh(key)
+                print(f"{datetime.now():%Y-%m-%d %H:%M} fetched {key}")
+        if args.once:
+            print(f"{store.fetches - before} request(s)")
+            report()
+            return
+        wake = releases.next_wakeup(store)
+        wait = min(max((wake - datetime.now(releases.ET)).total_seconds(), 60), 3600)
+        print(f"Next check {wake:%Y-%m-%d %H:%M} ET (sleeping {wait / 60:.0f} min)")
+        time.sleep(wait)
+
+
+CHART_SCRIPTS = ['10Year2Year.py', 'Unemployment.py', 'FedAssets.py', 'SOFR-IORB.py',
+                 'GLD_over_TLT.py', 'SPinGold.py', 'fluff/CreditCardDebt.py', 'fluff/Jobless.py',
+                 'fluff/IndustrialProd.py', 'fluff/Manufacturing.py', 'fluff/SP10Year2Year.py']
+
+
+def cmd_charts(args):
+    """Run every chart script in this process (Agg), saving each figure instead of showing it.
+
+    Figures are keyed by what they plot plus the script's source (RenderCache);
+    one that is unchanged since the last run is copied, not rasterized again.
+    """
+    import contextlib
+    import io
+    import os
+    import runpy
+    import shutil
+    import time
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from utils.providers import set_provider
+    from utils.render_cache import RenderCache, figure_inputs
+
+    if args.mode:
+        set_provider(args.mode)
+    root = os.path.dirname(os.path.abspath(__file__))
+    os.makedirs(args.out, exist_ok=True)
+    cache = None if args.no_cache else RenderCache()
+    with open(os.path.join(root, 'utils', 'charts.py')) as f:
+        helpers = f.read()                      # shared styling code the scripts call
+    failures = reused = 0
+    t_all = time.perf_counter()
+    for script in _names(args.only) or CHART_SCRIPTS:
+        name = os.path.splitext(os.path.basename(script))[0]
+        with open(os.path.join(root, script)) as f:
+            source = f.read()
+        saved = []
+
+        def show(*_, **__):
+            nonlocal reused
+            for num in plt.get_fignums():
+                fig = plt.figure(num)
+                path = os.path.join(args.out, f"{name}-{num}.png" if saved or len(plt.get_fignums()) > 1 else f"{name}.png")
+                if cache is None:
+                    fig.savefig(path, facecolor=fig.get_facecolor())
+                else:
+                    key = cache.key(*figure_inputs(fig), options={'script': source, 'helpers': helpers, 'num': num})
+                    hit = cache.get(key)
+                    reused += hit is not None
+                    shutil.copyfile(hit or cache.put(key, fig), path)
+                saved.append(path)
+            plt.close('all')
+
+        plt.show, real_show = show, plt.show
+        sys.argv, real_argv = [script], sys.argv
+        t0 = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                runpy.run_path(os.path.join(root, script), run_name='__main__')
+            status = 'ok'
+        except SystemExit as e:
+            status = 'ok' if not e.code else f"exit {e.code}"
+        except Exception as e:
+            status = f"{type(e).__name__}: {e}"
+        finally:
+            plt.show, sys.argv = real_show, real_argv
+            plt.close('all')
+        failures += status != 'ok'
+        print(f"{script:<26} {time.perf_counter() - t0:6.2f}s  {status}  {', '.join(saved)}")
+    print(f"{time.perf_counter() - t_all:.1f}s total ({args.mode or 'live'} data"
+          + (f", {reused} unchanged figure{'s' if reused != 1 else ''} reused)" if reused else ')'))
+    return 1 if failures else 0
+
+
+# ———————————————— CLI ————————————————
+def build_parser():
+    parser = argparse.ArgumentParser(prog='macro', description=__doc__.split('USAGE')[0],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('report', help='PDF + HTML report of every indicator')
+    p.add_argument('--out', default='reports', help='output directory (default: reports)')
+    p.add_argument('--only', help='comma-separated indicator names')
+    p.add_argument('--workers', type=int, default=None, help='process pool size')
+    p.add_argument('--force', action='store_true', help='recompute even if inputs are unchanged')
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser('scan', help='rank unusual moves across every cached series')
+    p.add_argument('--horizons', default='1', help='change horizons in observations (default: 1)')
+    p.add_argument('--top', type=int, default=20, help='rows to print (default: 20)')
+    p.add_argument('--all', action='store_true', help='score the latest point even if already scanned')
+    p.add_argument('--dry-run', action='store_true', help="don't advance the last-scanned state")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser('recession', help='logit/probit recession probability from the indicators')
+    p.add_argument('--link', choices=['logit', 'probit'], default='logit')
+    p.add_argument('--horizon', type=int, default=12, help='months ahead (default: 12)')
+    p.add_argument('--features', help='comma-separated feature names (default: long-history set)')
+    p.add_argument('--plot', action='store_true', help='show the probability chart')
+    p.add_argument('--save', help='write the chart to a file instead of showing it')
+    p.set_defaults(func=cmd_recession)
+
+    p = sub.add_parser('leadlag', help='FFT lead/lag cross-correlation matrix across indicators')
+    p.add_argument('--freq', choices=['M', 'W', 'Q'], default='M', help='common frequency (default: M)')
+    p.add_argument('--max-lag', type=int, default=24, help='largest lead/lag in periods (default: 24)')
+    p.add_argument('--series', help='comma-separated subset of cached series / derived indicators')
+    p.add_argument('--top', type=int, default=15, help='lead relationships to print (default: 15)')
+    p.add_argument('--plot', action='store_true', help='show the lag heatmap')
+    p.add_argument('--save', help='write the heatmap to a file instead of showing it')
+    p.set_defaults(func=cmd_leadlag)
+
+    p = sub.add_parser('export', help='write every computed indicator + inputs to csv/ndjson/parquet')
+    p.add_argument('--format', choices=['csv', 'ndjson', 'parquet'], default='csv')
+    p.add_argument('--out', default='exports', help='output directory (default: exports)')
+    p.add_argument('--only', help='comma-separated indicator names')
+    p.add_argument('--full', action='store_true', help='rewrite everything instead of appending new rows')
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser('overview', help='every indicator on one shared-axis wall-monitor figure')
+    p.add_argument('--only', help='comma-separated indicator names (default: all)')
+    p.add_argument('--since', type=int, default=2005, help='first year shown on the shared axis (default: 2005)')
+    p.add_argument('--save', help='write the figure to a file instead of showing it')
+    p.set_defaults(func=cmd_overview)
+
+    p = sub.add_parser('sahm', help='backtest a grid of Sahm Rule windows / lookbacks / thresholds')
+    p.add_argument('--windows', help="moving-average lengths, e.g. '1-6' or '2,3,4' (default: 1-6)")
+    p.add_argument('--lookbacks', help="prior-low lookbacks, e.g. '6:24:2' (default: 6-24 step 2)")
+    p.add_argument('--thresholds', help="trigger levels in pp, e.g. '0.2:0.8:0.05' (default)")
+    p.add_argument('--pre', type=int, default=12, help='months before a recession start that count as a hit (default: 12)')
+    p.add_argument('--post', type=int, default=6, help='months after a recession start that count as a hit (default: 6)')
+    p.add_argument('--workers', type=int, default=None, help='process pool size (default: auto for large grids)')
+    p.add_argument('--top', type=int, default=20, help='combinations to print (default: 20)')
+    p.set_defaults(func=cmd_sahm)
+
+    p = sub.add_parser('regimes', help='HMM calm / turbulent regimes for the spreads, filtered online')
+    p.add_argument('--only', help='comma-separated indicator names (default: repo_spread,yield_curve,gld_tlt)')
+    p.add_argument('--refit', action='store_true', help='refit the models instead of filtering new rows')
+    p.set_defaults(func=cmd_regimes)
+
+    p = sub.add_parser('validate', help='data-quality report (gaps, duplicates, NaN runs, ranges, jumps) of the cache')
+    p.add_argument('--only', help='comma-separated store keys (default: every cached series)')
+    p.add_argument('--all', action='store_true', help='list clean series too')
+    p.add_argument('--json', action='store_true', help='machine-readable report')
+    p.add_argument('--strict', action='store_true', help='exit 1 if any series is not clean')
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser('events', help='bootstrap CIs for recession lead times, Sahm lags and drawdowns')
+    p.add_argument('--n', type=int, default=20_000, help='bootstrap replicates (default: 20000)')
+    p.add_argument('--ci', type=float, default=0.90, help='interval coverage (default: 0.90)')
+    p.add_argument('--stat', choices=['mean', 'median'], default='mean', help='statistic resampled (default: mean)')
+    p.add_argument('--workers', type=int, default=None, help='process pool size; forces the pool at any --n (default: auto from 20000 on multi-core hosts, 1 = no pool)')
+    p.set_defaults(func=cmd_events)
+
+    p = sub.add_parser('scenarios', help='simulated forward paths: odds and size of the move that fires Sahm / curve signals')
+    p.add_argument('--signal', help='comma-separated: sahm, inversion, uninversion (default: all)')
+    p.add_argument('--paths', type=int, default=10_000, help='simulated paths (default: 10000)')
+    p.add_argument('--horizon', type=int, default=24, help='months ahead (default: 24)')
+    p.add_argument('--model', choices=['ar', 'rw'], default='ar', help='AR(p) on monthly changes, or a random walk (default: ar)')
+    p.add_argument('--order', type=int, default=2, help='AR order (default: 2)')
+    p.add_argument('--shocks', choices=['normal', 'bootstrap'], default='normal', help='Gaussian or resampled residuals (default: normal)')
+    p.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    p.set_defaults(func=cmd_scenarios)
+
+    p = sub.add_parser('query', help='SQL (window functions included) over every cached series and indicator, offline')
+    p.add_argument('sql', nargs='?', help='query to run (omit, or --tables, to list tables and examples)')
+    p.add_argument('--tables', action='store_true', help='list tables, their columns and example queries')
+    p.add_argument('--engine', choices=['sqlite', 'duckdb'], default='sqlite', help='query engine (duckdb needs the duckdb package)')
+    p.add_argument('--csv', action='store_true', help='write the result as CSV to stdout')
+    p.add_argument('--max-rows', type=int, default=50, help='rows printed before truncating (default: 50)')
+    p.set_defaults(func=cmd_query)
+
+    p = sub.add_parser('fed', help='H.4.1 balance-sheet components and weekly change attribution')
+    p.add_argument('--weeks', type=int, default=8, help='weekly changes to list (default: 8)')
+    p.add_argument('--since', type=int, default=2008, help='first year of the chart (default: 2008)')
+    p.add_argument('--plot', action='store_true', help='show the stacked-area chart')
+    p.add_argument('--save', help='write the chart to a file instead of showing it')
+    p.set_defaults(func=cmd_fed)
+
+    p = sub.add_parser('ratios', help='every pairwise ticker ratio from one batched download')
+    p.add_argument('--tickers', help='comma-separated Yahoo tickers (default: built-in universe)')
+    p.add_argument('--window', type=int, default=63, help='momentum / correlation window in days (default: 63)')
+    p.add_argument('--top', type=int, default=15, help='pairs to print (default: 15)')
+    p.add_argument('--pair', help='chart one ratio, e.g. GLD/TLT')
+    p.add_argument('--plot', action='store_true', help='show the --pair chart')
+    p.add_argument('--save', help='write the --pair chart to a file instead of showing it')
+    p.set_defaults(func=cmd_ratios)
+
+    p = sub.add_parser('latest', help='newest observations only, many series at once')
+    p.add_argument('--series', help='comma-separated FRED ids / yahoo:TICKER (default: headline set)')
+    p.add_argument('--n', type=int, default=2, help='observations per series (default: 2)')
+    p.set_defaults(func=cmd_latest)
+
+    p = sub.add_parser('dash', help='live terminal dashboard of every indicator (no matplotlib)')
+    p.add_argument('--interval', type=int, default=60, help='seconds between redraws (default: 60)')
+    p.add_argument('--once', action='store_true', help='print the table once and exit')
+    p.add_argument('--offline', action='store_true', help='cached data only, never touch the network')
+    p.set_defaults(func=cmd_dash)
+
+    p = sub.add_parser('schedule', help='fetch cached series when their next release is due')
+    p.add_argument('--status', action='store_true', help='print the data-freshness SLA table and exit')
+    p.add_argument('--once', action='store_true', help='one pass over due series, then exit')
+    p.set_defaults(func=cmd_schedule)
+
+    p = sub.add_parser('charts', help='run every chart script headless, saving PNGs')
+    p.add_argument('--mode', choices=['live', 'record', 'replay'], default=None,
+                   help='data provider (default: MACRO_DATA_MODE or live)')
+    p.add_argument('--out', default='charts', help='output directory (default: charts)')
+    p.add_argument('--only', help='comma-separated script paths')
+    p.add_argument('--no-cache', action='store_true', help='rasterize every figure, skipping the render cache')
+    p.set_defaults(func=cmd_charts)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+===============================================================================
+FED BALANCE SHEET | H.4.1 components and what drove each week's change
+===============================================================================
+
+WHAT IT SHOWS
+  Assets:       Treasuries, MBS, loans & facilities, repo, liquidity swaps, other
+  Liabilities:  currency, reserves, Treasury General Account, reverse repo,
+                other liabilities & capital
+  All Wednesday levels ($B), aligned on one W-WED calendar. "Other" on each
+  side is WALCL minus the listed components, so each side sums to the total.
+
+ATTRIBUTION
+  Week-over-week (and 4- / 52-week) changes for every component in one
+  vectorized diff; each component's share of the change in total assets.
+  On the liability side: did QT drain reserves, the TGA or reverse repo?
+
+DATA SOURCES (FRED, H.4.1 — weekly, as of Wednesday, released Thursday 4:30 PM ET)
+  WALCL TREAST WSHOMCB WLCFLL WORAL SWPT | WLFN WRBWFRBL WDTGAL WLRRAL
+
+  Components are fetched concurrently through the SeriesStore, so a weekly
+  update only downloads the newest observations of each series.
+===============================================================================
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+TOTAL = 'WALCL'
+ASSETS = {
+    'Treasuries':         'TREAST',
+    'MBS':                'WSHOMCB',
+    'Loans & facilities': 'WLCFLL',
+    'Repo':               'WORAL',
+    'Liquidity swaps':    'SWPT',
+}
+LIABILITIES = {
+    'Currency':     'WLFN',
+    'Reserves':     'WRBWFRBL',
+    'TGA':          'WDTGAL',
+    'Reverse repo': 'WLRRAL',
+}
+OTHER_ASSETS = 'Other assets'
+OTHER_LIABILITIES = 'Other liabilities & capital'
+KEYS = [TOTAL, *ASSETS.values(), *LIABILITIES.values()]
+START = '2003-01-01'   # H.4.1 component history on FRED starts Dec 2002
+HORIZONS = {'1w': 1, '4w': 4, '52w': 52}
+
+ASSET_COLORS = ['#4da6ff', '#00ff88', '#ff6b6b', '#ffcc00', '#cc66ff', '#888888']
+LIABILITY_COLORS = ['#66ccff', '#ff9933', '#ff4444', '#33cccc', '#888888']
+
+
+def load(store=None, start=START, workers=8):
+    """{key: frame} for WALCL and every component, fetched concurrently."""
+    from utils.store import SeriesStore
+    store = store or SeriesStore()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(lambda key: store.get(key, start=start), KEYS))
+    return dict(zip(KEYS, frames))
+
+
+def components(frames):
+    """Wednesday-aligned panel in $B: total, assets, liabilities (+ 'other' residuals)."""
+    first = lambda f: f.iloc[:, 0] if isinstance(f, pd.DataFrame) else f
+    raw = pd.concat({k: first(f) for k, f in frames.items()}, axis=1) / 1000
+    # Wednesday calendar; components occasionally miss a week — carry at most one
+    raw = raw.resample('W-WED').last().ffill(limit=1).dropna(subset=[TOTAL])
+    panel = pd.DataFrame({'Total': raw[TOTAL]})
+    for name, key in ASSETS.items():
+        panel[name] = raw[key].fillna(0.0)
+    panel[OTHER_ASSETS] = panel['Total'] - panel[list(ASSETS)].sum(axis=1)
+    for name, key in LIABILITIES.items():
+        panel[name] = raw[key].fillna(0.0)
+    panel[OTHER_LIABILITIES] = panel['Total'] - panel[list(LIABILITIES)].sum(axis=1)
+    return panel
+
+
+def asset_columns():
+    return [*ASSETS, OTHER_ASSETS]
+
+
+def liability_columns():
+    return [*LIABILITIES, OTHER_LIABILITIES]
+
+
+def attribution(panel, horizons=HORIZONS):
+    """Latest level and change over each horizon for every column, plus the
+    share of the 1-week change in total assets each component explains."""
+    values = panel.to_numpy(dtype=float)
+    table = pd.DataFrame({'Level': values[-1]}, index=panel.columns)
+    for label, k in horizons.items():
+        table[f'Δ{label}'] = values[-1] - values[-1 - k] if len(values) > k else np.nan
+    total = table.at['Total', 'Δ1w']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        table['Share of Δ1w'] = np.where(total != 0, table['Δ1w'] / total, np.nan)
+    table.loc['Total', 'Share of Δ1w'] = np.nan
+    return table
+
+
+def weekly_changes(panel, weeks=8):
+    """Last `weeks` week-over-week changes (rows = weeks, columns = components)."""
+    return panel.diff().iloc[-weeks:]
+
+
+def format_attribution(panel, table, weeks=8):
+    date = panel.index[-1]
+    lines = [f"=== FED BALANCE SHEET — week of {date:%b %d, %Y} ($B) ===",
+             f"{'Component':<28} {'Level':>10} {'Δ1w':>9} {'Δ4w':>9} {'Δ52w':>10} {'Share':>7}"]
+    for side, cols in (('ASSETS', asset_columns()), ('LIABILITIES', liability_columns())):
+        lines.append(side)
+        for name in cols:
+            r = table.loc[name]
+            share = f"{r['Share of Δ1w']:>7.0%}" if np.isfinite(r['Share of Δ1w']) else f"{'—':>7}"
+            lines.append(f"  {name:<26} {r['Level']:>10,.1f} {r['Δ1w']:>+9,.1f} {r['Δ4w']:>+9,.1f} "
+                         f"{r['Δ52w']:>+10,.1f} {share}")
+    r = table.loc['Total']
+    lines.append(f"{'TOTAL (WALCL)':<28} {r['Level']:>10,.1f} {r['Δ1w']:>+9,.1f} {r['Δ4w']:>+9,.1f} {r['Δ52w']:>+10,.1f}")
+
+    recent = weekly_changes(panel, weeks)
+    lines += ["", f"=== LAST {weeks} WEEKS: WEEK-OVER-WEEK CHANGE ($B) ===",
+              f"{'Week':<10} {'Total':>8} " + ' '.join(f"{c[:10]:>10}" for c in asset_columns() + liability_columns())]
+    for d, row in recent.iterrows():
+        cells = ' '.join(f"{row[c]:>+10.1f}" for c in asset_columns() + liability_columns())
+        lines.append(f"{d:%Y-%m-%d} {row['Total']:>+8.1f} {cells}")
+    return lines
+
+
+def plot(panel, spans=()):
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    from utils.charts import apply_dark_style, shade_recessions
+
+    apply_dark_style()
+    fig, (ax_a, ax_l) = plt.subplots(2, 1, figsize=(14, 11), sharex=True)
+    lo, hi = panel.index[0], panel.index[-1]
+    spans = [(a, b) for a, b in spans if b >= lo and a <= hi]
+    for ax, cols, colors, side in ((ax_a, asset_columns(), ASSET_COLORS, 'Assets'),
+                                   (ax_l, liability_columns(), LIABILITY_COLORS, 'Liabilities & Capital')):
+        # residual 'other' can dip slightly below zero; stack it clipped, the total line stays exact
+        ax.stackplot(panel.index, panel[cols].clip(lower=0).to_numpy().T, labels=cols,
+                     colors=colors, alpha=0.85, linewidth=0)
+        ax.plot(panel.index, panel['Total'], color='white', linewidth=1.2, label='Total (WALCL)')
+        shade_recessions(ax, spans)
+        ax.set_ylabel(f'{side} (Billions of USD)', color='white')
+        ax.ticklabel_format(style='plain', axis='y')
+        ax.legend(loc='upper left', framealpha=0.95, fontsize=9)
+        ax.grid(True, alpha=0.3)
+    d1 = panel['Total'].diff().iloc[-1]
+    ax_a.set_title(f'Federal Reserve Balance Sheet ({lo.year}–Now)\n'
+                   f'Latest: ${panel["Total"].iloc[-1]:,.1f} Billion ({d1:+,.1f} B w/w, {hi:%b %d, %Y})',
+                   color='white', fontsize=14, pad=20, fontweight='bold')
+    ax_l.set_xlim(lo, hi)
+    ax_l.set_xlabel('Year', color='white')
+    ax_l.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
+    ax_l.xaxis.set_major_locator(mdates.YearLocator(2))
+    ax_l.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    return fig
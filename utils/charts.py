@@ -0,0 +1,225 @@
+"""
+===============================================================================
+CHART HELPERS | Dark mode style, recession spans, live (blitted) charts
+===============================================================================
+
+WHAT IT HAS
+  DARK_STYLE / apply_dark_style()  – the rcParams every chart script uses
+  recession_spans() / shade_recessions() – USREC → (start, end) spans, drawn once
+  recession_verts() / recession_layer()   – the same spans as one collection,
+              built once and added to any number of date axes
+  LiveChart – figure + style built once; later updates only touch line data and
+              the title, redrawn with blitting (works on Agg for frame dumps)
+===============================================================================
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import matplotlib
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
+
+# ———————————————— DARK MODE STYLE ————————————————
+DARK_STYLE = {
+    'figure.facecolor': '#0a0a0a',
+    'axes.facecolor':   '#0a0a0a',
+    'axes.edgecolor':   '#333333',
+    'axes.labelcolor':  'white',
+    'text.color':       'white',
+    'xtick.color':      'white',
+    'ytick.color':      'white',
+    'grid.color':       '#2a2a2a',
+    'grid.alpha':       0.3,
+    'font.size':        11,
+    'legend.facecolor': '#1a1a1a',
+    'legend.edgecolor': '#333333',
+    'legend.fontsize':  10,
+}
+
+RECESSION_COLOR = '#cc4444'
+
+_style_applied = False
+
+
+def apply_dark_style(force=False):
+    """Apply the dark-mode rcParams once per process."""
+    global _style_applied
+    if _style_applied and not force:
+        return
+    plt.style.use('dark_background')
+    plt.rcParams.update(DARK_STYLE)
+    _style_applied = True
+
+
+# ———————————————— RECESSIONS ————————————————
+def recession_spans(recession, end=None, column='USREC'):
+    """(start, end) pairs for every run of USREC == 1, found in one vectorized pass.
+
+    A span ends on the first month back at 0 (same as the scripts' loops);
+    an ongoing recession runs to `end` (default: last observation).
+    """
+    flag = recession[column] if isinstance(recession, pd.DataFrame) else recession
+    flag = flag.dropna()
+    if flag.empty:
+        return []
+    on = (flag.to_numpy() == 1).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], on, [0])))
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    idx = flag.index
+    last = pd.Timestamp(end) if end is not None else idx[-1]
+    return [(idx[a], idx[b] if b < len(idx) else last) for a, b in zip(starts, stops)]
+
+
+def shade_recessions(ax, spans, color=RECESSION_COLOR, alpha=0.25, label='Recession'):
+    """Shade precomputed recession spans; only the first one gets a legend label."""
+    for i, (a, b) in enumerate(spans):
+        ax.axvspan(a, b, color=color, alpha=alpha, label=label if i == 0 else "")
+
+
+def recession_verts(spans):
+    """(n, 4, 2) rectangles: x in date numbers, y spanning the axes (0 → 1)."""
+    if not spans:
+        return np.empty((0, 4, 2))
+    x = mdates.date2num(pd.DatetimeIndex([t for span in spans for t in span])).reshape(-1, 2)
+    verts = np.empty((len(x), 4, 2))
+    verts[:, :, 0] = x[:, [0, 0, 1, 1]]
+    verts[:, :, 1] = [0, 1, 1, 0]
+    return verts
+
+
+def recession_layer(ax, verts, color=RECESSION_COLOR, alpha=0.25, label='Recession'):
+    """Every recession as a single artist (vs. one axvspan per span)."""
+    layer = PolyCollection(verts, transform=ax.get_xaxis_transform(), facecolors=color,
+                           edgecolors='none', alpha=alpha, label=label if len(verts) else None)
+    ax.add_collection(layer, autolim=False)
+    return layer
+
+
+# ———————————————— LIVE CHART ————————————————
+class LiveChart:
+    """A chart that is built once and then updated in place.
+
+    Lines and the title are animated artists: the static parts (axes, grid,
+    ticks, shading) are rendered once into a background that is restored on
+    every update, so appending a point redraws only a few artists. A full
+    redraw only happens when new data falls outside the current axis limits.
+    """
+
+    def __init__(self, lines, title='', xlabel='Date', ylabel='', figsize=(14, 7),
+                 date_format='%m-%d', headroom=0.10, frame_dir=None):
+        apply_dark_style()
+        self.fig, self.ax = plt.subplots(figsize=figsize)
+        self.headroom = headroom
+        self.frame_dir = frame_dir
+        self.frames = 0
+        self.full_redraws = 0
+        self._xy = {}
+        self.lines = {}
+        for name, kw in lines.items():
+            line, = self.ax.plot([], [], animated=True, **kw)
+            self.lines[name] = line
+            self._xy[name] = (np.empty(0), np.empty(0))
+        self.title = self.ax.set_title(title, color='white', fontsize=14, pad=20,
+                                       fontweight='bold')
+        self.title.set_animated(True)
+        self.ax.set_xlabel(xlabel, color='white')
+        self.ax.set_ylabel(ylabel, color='white')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.xaxis_date()
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
+        self.ax.tick_params(axis='x', labelrotation=45)
+        if any(kw.get('label') for kw in lines.values()):
+            self.ax.legend(handles=list(self.lines.values()), loc='upper left',
+                           framealpha=0.95)
+        self.fig.tight_layout()
+        self._background = None
+        if matplotlib.get_backend().lower() != 'agg':
+            plt.show(block=False)
+
+    # ———— data ————
+    @staticmethod
+    def _x(x):
+        x = np.asarray(x)
+        if np.issubdtype(x.dtype, np.number):
+            return x.astype(float)
+        return mdates.date2num(pd.to_datetime(x))
+
+    def set_data(self, name, x, y):
+        xs, ys = self._x(x), np.asarray(y, dtype=float)
+        self._xy[name] = (xs, ys)
+        self.lines[name].set_data(xs, ys)
+
+    def append(self, name, x, y):
+        xs, ys = self._xy[name]
+        self.set_data(name, np.append(xs, self._x(np.atleast_1d(x))),
+                      np.append(ys, np.atleast_1d(y)))
+
+    def set_title(self, text):
+        self.title.set_text(text)
+
+    # ———— drawing ————
+    def _fits(self):
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        for xs, ys in self._xy.values():
+            if len(xs) and (xs.min() < x0 or xs.max() > x1):
+                return False
+            ys = ys[np.isfinite(ys)]
+            if len(ys) and (ys.min() < y0 or ys.max() > y1):
+                return False
+        return True
+
+    def _rescale(self):
+        xs = np.concatenate([xy[0] for xy in self._xy.values()])
+        ys = np.concatenate([xy[1] for xy in self._xy.values()])
+        ys = ys[np.isfinite(ys)]
+        if len(xs):
+            lo, hi = xs.min(), xs.max()
+            pad = max((hi - lo) * self.headroom, 0.5)
+            self.ax.set_xlim(lo - pad * 0.1, hi + pad)
+        if len(ys):
+            lo, hi = ys.min(), ys.max()
+            pad = max((hi - lo) * self.headroom, 1e-6 + abs(hi) * 0.01)
+            self.ax.set_ylim(lo - pad, hi + pad)
+
+    def full_redraw(self):
+        """Re-render the static background (after a limit change or resize)."""
+        self._rescale()
+        canvas = self.fig.canvas
+        canvas.draw()
+        self._background = canvas.copy_from_bbox(self.fig.bbox)
+        self.full_redraws += 1
+
+    def redraw(self):
+        """Blit the animated artists over the cached background."""
+        canvas = self.fig.canvas
+        if self._background is None or not self._fits():
+            self.full_redraw()
+        canvas.restore_region(self._background)
+        for line in self.lines.values():
+            self.ax.draw_artist(line)
+        self.fig.draw_artist(self.title)
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+        self.frames += 1
+        if self.frame_dir is not None:
+            self.save_frame(f"{self.frame_dir}/frame_{self.frames:05d}.png")
+
+    def save_frame(self, path):
+        """Dump exactly what is on the canvas (animated artists included)."""
+        import matplotlib.image as mimage
+        mimage.imsave(path, np.asarray(self.fig.canvas.buffer_rgba()))
+
+    def pause(self, seconds):
+        """Wait for the next update while keeping a GUI window responsive."""
+        if matplotlib.get_backend().lower() == 'agg':
+            time.sleep(seconds)
+        else:
+            self.fig.canvas.start_event_loop(seconds)
+
+    def close(self):
+        plt.close(self.fig)
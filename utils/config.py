@@ -0,0 +1,20 @@
+"""
+Shared settings for the utils modules.
+
+CACHE_ROOT: where cached series, renders, fixtures, etc. live on disk.
+            Override with the MACRO_CACHE_DIR environment variable.
+"""
+
+import os
+
+CACHE_ROOT = os.environ.get(
+    'MACRO_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'projectmacro'),
+)
+
+
+def cache_dir(*parts):
+    """Path under CACHE_ROOT, created on first use."""
+    path = os.path.join(CACHE_ROOT, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,124 @@
+"""
+===============================================================================
+CHUNKED DOWNLOADS | Long histories fetched in parallel, resumable pieces
+===============================================================================
+
+WHAT IT DOES
+  Splits [start, end] into CHUNK_YEARS-long ranges and fetches them on a small
+  thread pool. Yahoo chunks ('yahoo:' names) go one at a time: yf.download
+  keeps results in module-global state keyed by ticker, so concurrent calls
+  for one ticker overwrite each other. Each finished chunk is pickled under
+  CACHE_ROOT/downloads/<name> straight away, so after a failure the next run
+  only fetches what's missing.
+  Every chunk retries on its own with exponential back-off — a transient error
+  costs one chunk's retry, never the whole history.
+
+  If a chunk still fails after its retries, DownloadError is raised listing the
+  missing ranges; the chunks that did arrive stay on disk (and are attached as
+  .partial) for the next attempt. Once everything is in, the checkpoints are
+  removed — the caller (usually the SeriesStore) keeps the assembled frame.
+
+USAGE
+  df = download('T10Y2Y', '1976-06-01', datetime.now(), fetch)   # fetch(key, start, end)
+===============================================================================
+"""
+
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from utils.config import cache_dir
+
+CHUNK_YEARS = 5
+WORKERS = 4
+SERIAL_PREFIXES = ('yahoo:',)   # names whose fetch isn't thread-safe (yfinance)
+RETRIES = 3
+BACKOFF = 2.0   # seconds, doubled after each failed attempt
+
+
+class DownloadError(RuntimeError):
+    """Some chunks failed after retries; .partial holds what did arrive."""
+
+    def __init__(self, name, failed, partial):
+        ranges = ', '.join(f"{s:%Y-%m-%d}→{e:%Y-%m-%d}" for s, e in failed)
+        super().__init__(f"{name}: {len(failed)} chunk(s) failed ({ranges}) — rerun to resume")
+        self.failed = failed
+        self.partial = partial
+
+
+def chunk_ranges(start, end, years=CHUNK_YEARS):
+    """[(chunk_start, chunk_end)], aligned to calendar years so checkpoints line up across runs."""
+    start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+    edges = [start]
+    year = (start.year // years + 1) * years
+    while pd.Timestamp(year=year, month=1, day=1) < end:
+        edges.append(pd.Timestamp(year=year, month=1, day=1))
+        year += years
+    edges.append(end)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _checkpoint_dir(name):
+    return cache_dir('downloads', name.replace(':', '_').replace('/', '_').replace('^', ''))
+
+
+def _fetch_chunk(fetch, key, start, end, path, retries, backoff):
+    for attempt in range(retries + 1):
+        try:
+            df = fetch(key, start, end)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            df.to_pickle(tmp)
+            os.replace(tmp, path)
+            return df
+        except Exception as e:
+            if attempt == retries:
+                raise
+            print(f"  {key} {start:%Y}–{end:%Y} attempt {attempt + 1} failed: {e}")
+            time.sleep(backoff * 2 ** attempt)
+
+
+def download(key, start, end, fetch, years=CHUNK_YEARS, workers=WORKERS,
+             retries=RETRIES, backoff=BACKOFF, name=None):
+    """Whole [start, end] history of key via fetch(key, start, end), chunk by chunk."""
+    name = name or str(key)
+    ranges = chunk_ranges(start, end, years)
+    if len(ranges) == 1:
+        return fetch(key, *ranges[0])
+
+    root = _checkpoint_dir(name)
+    today = pd.Timestamp.now().normalize()
+    parts, todo = {}, []
+    for s, e in ranges:
+        path = os.path.join(root, f"{s:%Y%m%d}_{e:%Y%m%d}.pkl")
+        # the chunk reaching today is never reused — it grows every day
+        if e < today and os.path.exists(path):
+            parts[s] = pd.read_pickle(path)
+        else:
+            todo.append((s, e, path))
+
+    if name.startswith(SERIAL_PREFIXES):
+        workers = 1
+    failed = []
+    if todo:
+        with ThreadPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            futures = {pool.submit(_fetch_chunk, fetch, key, s, e, path, retries, backoff): (s, e)
+                       for s, e, path in todo}
+            for fut in as_completed(futures):
+                s, e = futures[fut]
+                try:
+                    parts[s] = fut.result()
+                except Exception as exc:
+                    print(f"  {key} {s:%Y}–{e:%Y} gave up: {exc}")
+                    failed.append((s, e))
+
+    frames = [parts[s] for s in sorted(parts) if parts[s] is not None and not parts[s].empty]
+    df = pd.concat(frames) if frames else next(iter(parts.values()), pd.DataFrame())
+    if not df.empty:
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+    if failed:
+        raise DownloadError(name, sorted(failed), df)
+    shutil.rmtree(root, ignore_errors=True)
+    return df
@@ -0,0 +1,104 @@
+"""
+===============================================================================
+DOWNSAMPLE | Shape-preserving point reduction before plotting long series
+===============================================================================
+
+WHAT IT DOES
+  A 14-inch chart is ~1,400 pixels wide, but 45 years of daily T10Y2Y is
+  ~11,500 points, so most of what ax.plot draws lands on the same pixels. Both
+  methods return a subset of the original rows, in order:
+
+    minmax   the time axis is cut into `points` / 4 equal-width buckets (about
+             one per pixel column); each keeps its first, last, lowest and
+             highest point. Every local extreme that can be seen survives
+             exactly: the deepest inversion, each repo spike.
+    lttb     Largest-Triangle-Three-Buckets: one point per bucket, the one
+             that forms the largest triangle with the point kept before it
+             and the average of the next bucket. It keeps the visual shape
+             with fewer points. The global min / max are always added back.
+
+  NaNs are dropped first, so a gap is drawn as a straight segment. Series
+  shorter than `points` are returned as they are.
+
+USAGE
+  line = downsample(ratio)                        # Series or DataFrame, 'minmax'
+  line = downsample(yield_curve, 'lttb', points=1500)
+  ax.plot(line.index, line, ...)
+  DOWNSAMPLE = None                               # per-chart toggle: every point
+===============================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+POINTS = 2000          # output budget; ~1.5 points per pixel of a 14-inch chart
+METHODS = ('minmax', 'lttb')
+
+
+def _axis(index):
+    """Index as float positions for bucketing (datetimes → ns)."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.as_unit('ns').asi8.astype(float)
+    return np.asarray(index, dtype=float)
+
+
+def minmax_rows(x, y, buckets):
+    """Row numbers of the first / last / min / max point of each equal-width x bucket."""
+    n = len(y)
+    span = x[-1] - x[0]
+    if span <= 0:
+        return np.array([0, n - 1]) if n > 1 else np.arange(n)
+    b = np.minimum(((x - x[0]) / span * buckets).astype(np.int64), buckets - 1)
+    first = np.flatnonzero(np.concatenate(([True], b[1:] != b[:-1])))
+    last = np.concatenate((first[1:] - 1, [n - 1]))
+    group = np.repeat(np.arange(len(first)), np.diff(np.append(first, n)))
+    lo = np.minimum.reduceat(y, first)
+    hi = np.maximum.reduceat(y, first)
+    at_lo = np.flatnonzero(y == lo[group])
+    at_hi = np.flatnonzero(y == hi[group])
+    # first occurrence per bucket
+    at_lo = at_lo[np.unique(group[at_lo], return_index=True)[1]]
+    at_hi = at_hi[np.unique(group[at_hi], return_index=True)[1]]
+    return np.unique(np.concatenate((first, last, at_lo, at_hi)))
+
+
+def lttb_rows(x, y, points):
+    """Row numbers chosen by Largest-Triangle-Three-Buckets (first and last always kept)."""
+    n = len(y)
+    if points >= n or points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)    # points - 2 inner buckets
+    counts = np.diff(np.append(edges, n))
+    mean_x = np.add.reduceat(x, edges) / counts
+    mean_y = np.add.reduceat(y, edges) / counts
+    mean_x[-1], mean_y[-1] = x[-1], y[-1]                          # the last "bucket" is the last point
+    rows = np.empty(points, dtype=np.int64)
+    rows[0], rows[-1] = 0, n - 1
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        xs, ys = x[lo:hi], y[lo:hi]
+        area = np.abs((x[a] - mean_x[i + 1]) * (ys - y[a]) - (x[a] - xs) * (mean_y[i + 1] - y[a]))
+        a = lo + int(area.argmax())
+        rows[i + 1] = a
+    return np.unique(np.concatenate((rows, [int(y.argmin()), int(y.argmax())])))
+
+
+def downsample(data, how='minmax', points=POINTS, column=None):
+    """Rows of a Series / DataFrame reduced to about `points`, keeping the visible shape.
+
+    how: 'minmax' | 'lttb' | None (no-op). A DataFrame is reduced on `column`
+    (default: its first) and every column keeps the same rows.
+    """
+    if not how or data is None or len(data) <= points:
+        return data
+    if how not in METHODS:
+        raise ValueError(f"unknown downsampling method {how!r} (choose from {', '.join(METHODS)})")
+    values = data[column or data.columns[0]] if isinstance(data, pd.DataFrame) else data
+    finite = np.isfinite(values.to_numpy(dtype=float))
+    data, values = data[finite], values[finite]
+    if len(values) <= points:
+        return data
+    x, y = _axis(values.index), values.to_numpy(dtype=float)
+    rows = minmax_rows(x, y, max(points // 4, 1)) if how == 'minmax' else lttb_rows(x, y, points)
+    return data.iloc[rows]
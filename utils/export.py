@@ -0,0 +1,159 @@
+"""
+===============================================================================
+EXPORT | Every computed indicator + its inputs to Parquet / CSV / NDJSON
+===============================================================================
+
+WHAT IT WRITES (one set per indicator, under --out)
+  <name>.csv | <name>.ndjson      date + derived columns + raw input columns
+  <name>/part-NNNNN.parquet       same, as a Parquet dataset (one part per run)
+  <name>.meta.json                title, script, inputs, units, columns,
+                                  rows, last exported date, FINAL SUMMARY record
+
+STREAMING
+  The indicator's panel is built once, then written CHUNK rows at a time
+  (csv/ndjson append to an open file, parquet goes through one ParquetWriter)
+  so no second full-size copy — a string dump or an Arrow table — ever exists.
+
+INCREMENTAL (default)
+  Append-only, keyed by the last exported date in <out>/export_state.json:
+  a rerun writes only rows dated after it. Revisions to rows already exported
+  are not rewritten — use --full to rewrite everything.
+
+Parquet needs pyarrow (pip install pyarrow); csv and ndjson need nothing extra.
+===============================================================================
+"""
+
+import json
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from utils.indicators import INDICATORS, compute, load_inputs, summarize
+from utils.store import column_name
+
+FORMATS = ('parquet', 'csv', 'ndjson')
+CHUNK = 50_000
+STATE_FILE = 'export_state.json'
+
+
+def panel(name, inputs):
+    """Derived columns followed by any raw input column not already among them."""
+    derived = compute(name, inputs)
+    raw = {}
+    for key in INDICATORS[name]['inputs']:
+        col = column_name(key)
+        if col not in derived.columns:
+            f = inputs[key]
+            raw[col] = (f.iloc[:, 0] if isinstance(f, pd.DataFrame) else f).reindex(derived.index)
+    out = derived.assign(**raw) if raw else derived
+    out.index.name = 'date'
+    return out
+
+
+# ———————————————— STATE ————————————————
+def load_state(out_dir):
+    try:
+        with open(os.path.join(out_dir, STATE_FILE)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(out_dir, state):
+    path = os.path.join(out_dir, STATE_FILE)
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+# ———————————————— WRITERS ————————————————
+def _chunks(frame, size):
+    for i in range(0, len(frame), size):
+        yield frame.iloc[i:i + size]
+
+
+def write_csv(frame, path, append, chunk=CHUNK):
+    header = not (append and os.path.exists(path))
+    with open(path, 'a' if append else 'w', newline='') as f:
+        for part in _chunks(frame, chunk):
+            part.to_csv(f, header=header, date_format='%Y-%m-%d')
+            header = False
+
+
+def write_ndjson(frame, path, append, chunk=CHUNK):
+    with open(path, 'a' if append else 'w') as f:
+        for part in _chunks(frame, chunk):
+            text = part.reset_index().to_json(orient='records', lines=True, date_format='iso', date_unit='s')
+            f.write(text if text.endswith('\n') else text + '\n')
+
+
+def write_parquet(frame, directory, append, chunk=CHUNK, metadata=None):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Parquet export needs pyarrow: pip install pyarrow (or use --format csv/ndjson)")
+
+    if not append and os.path.isdir(directory):
+        for old in os.listdir(directory):
+            if old.endswith('.parquet'):
+                os.remove(os.path.join(directory, old))
+    os.makedirs(directory, exist_ok=True)
+    n = len([p for p in os.listdir(directory) if p.endswith('.parquet')])
+    path = os.path.join(directory, f"part-{n:05d}.parquet")
+
+    schema = pa.Schema.from_pandas(frame.iloc[:0])
+    if metadata:
+        schema = schema.with_metadata({**(schema.metadata or {}), b'macro': json.dumps(metadata).encode()})
+    with pq.ParquetWriter(path, schema) as writer:
+        for part in _chunks(frame, chunk):
+            writer.write_table(pa.Table.from_pandas(part, schema=schema))
+
+
+# ———————————————— EXPORT ————————————————
+def export(names=None, out_dir='exports', fmt='csv', store=None, full=False, chunk=CHUNK):
+    """Write each indicator's new rows; returns {name: rows written}."""
+    from utils.store import SeriesStore
+
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+    names = list(names or INDICATORS)
+    unknown = set(names) - set(INDICATORS)
+    if unknown:
+        raise KeyError(f"unknown indicator(s): {', '.join(sorted(unknown))}")
+    os.makedirs(out_dir, exist_ok=True)
+    store = store or SeriesStore()
+    inputs = load_inputs(store, names)
+    state = load_state(out_dir)
+    written = {}
+
+    for name in names:
+        spec = INDICATORS[name]
+        data = panel(name, inputs)
+        last = None if full else state.get(name, {}).get(fmt)
+        new = data.loc[data.index > pd.Timestamp(last)] if last else data
+        append = last is not None
+        meta = {'indicator': name, 'title': spec['title'], 'script': spec['script'],
+                'inputs': spec['inputs'], 'derived': spec['derived'], 'start': spec['start'],
+                'columns': list(data.columns), 'exported_at': datetime.now().isoformat(timespec='seconds'),
+                'summary': summarize(name, data)}
+
+        if len(new) or not append:
+            if fmt == 'csv':
+                write_csv(new, os.path.join(out_dir, f"{name}.csv"), append, chunk)
+            elif fmt == 'ndjson':
+                write_ndjson(new, os.path.join(out_dir, f"{name}.ndjson"), append, chunk)
+            else:
+                write_parquet(new, os.path.join(out_dir, name), append, chunk, meta)
+
+        end = data.index[-1] if len(data) else None
+        prev = state.get(name, {}).get(f"{fmt}_rows", 0) if append else 0
+        meta.update(rows=prev + len(new), last_date=end.strftime('%Y-%m-%d') if end is not None else last)
+        with open(os.path.join(out_dir, f"{name}.meta.json"), 'w') as f:
+            json.dump(meta, f, indent=1, default=str)
+        state.setdefault(name, {}).update({fmt: meta['last_date'], f"{fmt}_rows": meta['rows']})
+        written[name] = len(new)
+
+    save_state(out_dir, state)
+    return written
@@ -0,0 +1,278 @@
+"""
+===============================================================================
+INDICATORS | The chart scripts' math as importable functions
+===============================================================================
+
+WHAT IT HAS
+  One entry per chart script in INDICATORS:
+    inputs    – store keys the indicator needs (see utils/store.py)
+    start     – first date the script plots
+    compute() – raw input frames → DataFrame of derived columns
+    summary() – derived frame → flat record of the script's FINAL SUMMARY numbers
+    derived   – the column that isn't just a rescaled raw input (None if none)
+
+  Nothing here imports matplotlib, so it is safe for reports, exports and the
+  terminal dashboard alike.
+===============================================================================
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from utils.splice import REPO, FLOOR
+
+SAHM_TRIGGER = 0.5    # pp — Unemployment.py
+SAHM_NEAR    = 0.35   # pp — "Near Trigger"
+REPO_STRESS  = 30     # bp — SOFR-IORB.py stress zone
+GLD_TLT_TREND = 200   # trading days — GLD/TLT above its moving average = Risk-off
+
+
+def _col(frame, name):
+    return frame[name] if isinstance(frame, pd.DataFrame) else frame
+
+
+def _date(ts):
+    return ts.strftime('%Y-%m-%d') if ts is not None and not pd.isna(ts) else None
+
+
+def _record(name, derived, column, unit, status=None, **metrics):
+    s = derived[column].dropna()
+    rec = {
+        'indicator': name,
+        'title': INDICATORS[name]['title'],
+        'column': column,
+        'unit': unit,
+        'latest': float(s.iloc[-1]) if len(s) else None,
+        'latest_date': _date(s.index[-1]) if len(s) else None,
+        'peak': float(s.max()) if len(s) else None,
+        'peak_date': _date(s.idxmax()) if len(s) else None,
+        'trough': float(s.min()) if len(s) else None,
+        'trough_date': _date(s.idxmin()) if len(s) else None,
+        'status': status,
+    }
+    rec.update({k: (float(v) if isinstance(v, (np.floating, np.integer)) else v)
+                for k, v in metrics.items()})
+    return rec
+
+
+# ———————————————— 10Year2Year.py ————————————————
+def yield_curve(inputs):
+    return _col(inputs['T10Y2Y'], 'T10Y2Y').dropna().to_frame('T10Y2Y')
+
+
+def yield_curve_summary(derived):
+    s = derived['T10Y2Y']
+    inverted = s < 0
+    last_inv = s.index[inverted.to_numpy()][-1] if inverted.any() else None
+    status = 'Inverted' if len(s) and s.iloc[-1] < 0 else 'Normal'
+    return _record('yield_curve', derived, 'T10Y2Y', '%', status,
+                   last_inversion=_date(last_inv))
+
+
+# ———————————————— Unemployment.py ————————————————
+def sahm_triggered(rise, threshold=SAHM_TRIGGER):
+    """rise >= threshold, after rounding away the float noise of the moving average
+    (the MA of one-decimal UNRATE is exact to 1e-10), so every caller agrees on 0.5."""
+    return np.round(rise, 10) >= threshold
+
+
+def sahm_rule(unrate, window=3, lookback=12):
+    """3MMA, its prior 12-month low and the Sahm Rule rise (pp)."""
+    df = _col(unrate, 'UNRATE').dropna().to_frame('UNRATE')
+    df['3MMA'] = df['UNRATE'].rolling(window).mean()
+    df['12M_Low'] = df['3MMA'].rolling(lookback).min().shift(1)
+    df['Sahm_Rule'] = df['3MMA'] - df['12M_Low']
+    df['Sahm_Trigger'] = sahm_triggered(df['Sahm_Rule'])
+    return df
+
+
+def sahm_status(value):
+    if value is None or pd.isna(value):
+        return 'n/a'
+    return "TRIGGERED" if sahm_triggered(value) else "Near Trigger" if value >= SAHM_NEAR else "Safe"
+
+
+def unemployment(inputs):
+    return sahm_rule(inputs['UNRATE'])
+
+
+def unemployment_summary(derived):
+    sahm = derived['Sahm_Rule'].iloc[-1]
+    triggers = derived[derived['Sahm_Trigger']]
+    return _record('unemployment', derived, 'UNRATE', '%', sahm_status(sahm),
+                   sahm=None if pd.isna(sahm) else float(sahm),
+                   last_trigger=_date(triggers.index[-1]) if len(triggers) else None)
+
+
+# ———————————————— FedAssets.py ————————————————
+def fed_assets(inputs):
+    return (_col(inputs['WALCL'], 'WALCL').dropna() / 1000).to_frame('Total_Assets')
+
+
+def fed_assets_summary(derived):
+    s = derived['Total_Assets']
+    wow = s.diff().iloc[-1] if len(s) > 1 else np.nan
+    return _record('fed_assets', derived, 'Total_Assets', '$B', None,
+                   week_change=None if pd.isna(wow) else float(wow))
+
+
+# ———————————————— SOFR-IORB.py ————————————————
+def repo_spread(inputs):
+    data = pd.concat([REPO.resolve(inputs), FLOOR.resolve(inputs)], axis=1).dropna()
+    data['Spread_bp'] = (data['Repo'] - data['Floor']) * 100
+    data['MA_30d'] = data['Spread_bp'].rolling(30, min_periods=1).mean()
+    return data
+
+
+def repo_metric(date):
+    return f"{REPO.label_at(date)} – {FLOOR.label_at(date)}"
+
+
+def repo_spread_summary(derived):
+    s = derived['Spread_bp']
+    latest = s.iloc[-1] if len(s) else np.nan
+    status = 'Stress' if latest > REPO_STRESS else 'Ample reserves' if latest < 0 else 'Normal'
+    return _record('repo_spread', derived, 'Spread_bp', 'bp', status,
+                   ma_30d=float(derived['MA_30d'].iloc[-1]) if len(s) else None,
+                   metric=repo_metric(s.index[-1]) if len(s) else None)
+
+
+# ———————————————— GLD_over_TLT.py / SPinGold.py ————————————————
+def price_ratio(num, den, name):
+    """num ÷ den on the dates both trade (the scripts' concat + dropna)."""
+    first = lambda f: f.iloc[:, 0] if isinstance(f, pd.DataFrame) else f
+    data = pd.concat([first(num), first(den)], axis=1).dropna()
+    return (data.iloc[:, 0] / data.iloc[:, 1]).to_frame(name)
+
+
+def gld_tlt(inputs):
+    return price_ratio(inputs['yahoo:GLD'], inputs['yahoo:TLT'], 'GLD_TLT')
+
+
+def gld_tlt_summary(derived):
+    """Status from the trend, not the level: gold outrunning Treasuries (ratio above
+    its 200-day MA) is Risk-off. The ratio's level has no natural threshold."""
+    ratio = derived['GLD_TLT'].dropna()
+    latest = ratio.iloc[-1] if len(ratio) else np.nan
+    trend = ratio.rolling(GLD_TLT_TREND).mean().iloc[-1] if len(ratio) else np.nan
+    status = 'n/a' if pd.isna(latest) or pd.isna(trend) else 'Risk-off' if latest > trend else 'Risk-on'
+    return _record('gld_tlt', derived, 'GLD_TLT', 'x', status)
+
+
+def spx_in_gold(inputs):
+    return price_ratio(inputs['yahoo:^GSPC'], inputs['yahoo:GLD'], 'SPX_in_Gold')
+
+
+def spx_in_gold_summary(derived):
+    return _record('spx_in_gold', derived, 'SPX_in_Gold', 'pts/GLD')
+
+
+# ———————————————— fluff/CreditCardDebt.py ————————————————
+def revolving_debt(inputs):
+    debt = _col(inputs['REVOLSL'], 'REVOLSL').dropna() / 1_000_000   # trillions
+    cpi = _col(inputs['CPIAUCSL'], 'CPIAUCSL').dropna()
+    data = debt.to_frame('Nominal')
+    data['Real'] = debt * (cpi.iloc[-1] / cpi.reindex(debt.index))
+    return data
+
+
+def revolving_debt_summary(derived):
+    real = derived['Real'].dropna()
+    yoy = real.pct_change(12).iloc[-1] * 100 if len(real) > 12 else np.nan
+    return _record('revolving_debt', derived, 'Nominal', '$T', None,
+                   real=float(real.iloc[-1]) if len(real) else None,
+                   real_yoy_pct=None if pd.isna(yoy) else float(yoy))
+
+
+# ———————————————— REGISTRY ————————————————
+INDICATORS = {
+    'yield_curve': dict(
+        title='10Y - 2Y Treasury Spread', script='10Year2Year.py',
+        inputs=['T10Y2Y'], start='1980-01-01',
+        compute=yield_curve, summary=yield_curve_summary,
+        derived=None),
+    'unemployment': dict(
+        title='Unemployment Rate + Sahm Rule', script='Unemployment.py',
+        inputs=['UNRATE'], start='1950-01-01',
+        compute=unemployment, summary=unemployment_summary,
+        derived='Sahm_Rule'),
+    'fed_assets': dict(
+        title='Federal Reserve Total Assets', script='FedAssets.py',
+        inputs=['WALCL'], start='2005-01-01',
+        compute=fed_assets, summary=fed_assets_summary,
+        derived=None),
+    'repo_spread': dict(
+        title='Repo Spread vs. Fed Floor Rate', script='SOFR-IORB.py',
+        inputs=['OBFR', 'SOFR', 'IOER', 'IORB'], start='2016-01-01',
+        compute=repo_spread, summary=repo_spread_summary,
+        derived='Spread_bp'),
+    'gld_tlt': dict(
+        title='GLD / TLT Ratio', script='GLD_over_TLT.py',
+        inputs=['yahoo:GLD', 'yahoo:TLT'], start='2004-11-18',
+        compute=gld_tlt, summary=gld_tlt_summary,
+        derived='GLD_TLT'),
+    'spx_in_gold': dict(
+        title='S&P 500 Priced in Gold', script='SPinGold.py',
+        inputs=['yahoo:^GSPC', 'yahoo:GLD'], start='2004-11-18',
+        compute=spx_in_gold, summary=spx_in_gold_summary,
+        derived='SPX_in_Gold'),
+    'revolving_debt': dict(
+        title='US Credit Card / Revolving Debt', script='fluff/CreditCardDebt.py',
+        inputs=['REVOLSL', 'CPIAUCSL'], start='2000-01-01',
+        compute=revolving_debt, summary=revolving_debt_summary,
+        derived='Real'),
+}
+
+RECESSION_KEY = 'USREC'
+
+
+def required_inputs(names=None):
+    """Every distinct store key the given indicators need (USREC included)."""
+    keys = {RECESSION_KEY}
+    for name in names or INDICATORS:
+        keys.update(INDICATORS[name]['inputs'])
+    return sorted(keys)
+
+
+def input_starts(names=None):
+    """key → earliest start any of the given indicators needs it from (USREC included)."""
+    starts = {}
+    for name in names or INDICATORS:
+        for key in INDICATORS[name]['inputs']:
+            s = pd.Timestamp(INDICATORS[name]['start'])
+            starts[key] = min(starts.get(key, s), s)
+    starts[RECESSION_KEY] = min(starts.values(), default=pd.Timestamp('1950-01-01'))
+    return starts
+
+
+def load_inputs(store, names=None):
+    """Fetch/refresh each distinct input exactly once."""
+    starts = input_starts(names)
+    return {key: store.get(key, start=starts[key]) for key in sorted(starts)}
+
+
+@lru_cache(maxsize=None)
+def code_version():
+    """Short hash of the code every derived frame comes from (this file and
+    utils/splice.py), so report / query caches go stale when the math changes."""
+    h = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ('indicators.py', 'splice.py'):
+        with open(os.path.join(here, name), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()[:12]
+
+
+def compute(name, inputs):
+    """Derived frame for one indicator, clipped to its start date."""
+    spec = INDICATORS[name]
+    derived = spec['compute']({k: inputs[k] for k in spec['inputs']})
+    return derived.loc[pd.Timestamp(spec['start']):]
+
+
+def summarize(name, derived):
+    return INDICATORS[name]['summary'](derived)
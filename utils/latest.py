@@ -0,0 +1,143 @@
+"""
+===============================================================================
+LATEST | Newest observation(s) of many series, without their histories
+===============================================================================
+
+WHAT IT DOES
+  Fetches only the last N observations of each series, all series at once on
+  a thread pool, and returns a compact table (series, date, value, previous,
+  change). The status check moves kilobytes instead of decades of history.
+
+SOURCES
+  FRED, with FRED_API_KEY set:
+    api.stlouisfed.org/fred/series/observations?sort_order=desc&limit=N
+  FRED, without a key:
+    fredgraph.csv?id=…&cosd=<start>  — start is just far enough back to cover
+    N observations at the series' release frequency (utils/releases.py)
+  Yahoo ('yahoo:GLD'): one chart-API call per ticker, range=5d
+
+DERIVED
+  GLD/TLT, SPX in gold and the repo spread (SOFR − IORB, bp) are computed from
+  the fetched rows, so every script's headline number is in the table.
+===============================================================================
+"""
+
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import quote, urlencode
+
+import numpy as np
+import pandas as pd
+
+from utils.releases import spec_for
+from utils.store import column_name, is_yahoo
+
+FRED_API = 'https://api.stlouisfed.org/fred/series/observations'
+FRED_CSV = 'https://fred.stlouisfed.org/graph/fredgraph.csv'
+YAHOO_CHART = 'https://query1.finance.yahoo.com/v8/finance/chart/'
+DEFAULT_KEYS = ['T10Y2Y', 'UNRATE', 'WALCL', 'SOFR', 'IORB', 'REVOLSL', 'CPIAUCSL',
+                'yahoo:GLD', 'yahoo:TLT', 'yahoo:^GSPC']
+WORKERS = 8
+# calendar days per observation, for sizing the keyless CSV window
+SPACING = {'daily': 3, 'weekly': 8, 'monthly': 32}
+
+
+def _get(url):
+    """(body text, bytes on the wire) via the active data provider."""
+    from utils.providers import get_url
+    return get_url(url)
+
+
+def fred_window(key, n):
+    """Start date that covers the last n observations (plus the publication lag)."""
+    spec = spec_for(key) or {'freq': 'daily'}
+    lag = 31 * spec.get('months_after', 0) + 14
+    return (datetime.now() - timedelta(days=SPACING[spec['freq']] * (n + 2) + lag)).date()
+
+
+def fetch_fred_latest(key, n=2, api_key=None):
+    api_key = api_key or os.environ.get('FRED_API_KEY')
+    if api_key:
+        text, size = _get(f"{FRED_API}?" + urlencode({
+            'series_id': key, 'api_key': api_key, 'file_type': 'json',
+            'sort_order': 'desc', 'limit': n + 3}))   # a few spare for '.' (missing) rows
+        obs = [(o['date'], o['value']) for o in json.loads(text)['observations']]
+        s = pd.Series({pd.Timestamp(d): float(v) for d, v in obs if v != '.'}, dtype=float)
+    else:
+        text, size = _get(f"{FRED_CSV}?" + urlencode({'id': key, 'cosd': fred_window(key, n)}))
+        df = pd.read_csv(io.StringIO(text), index_col=0, parse_dates=True, na_values='.')
+        s = df.iloc[:, 0].astype(float)
+    return s.dropna().sort_index().tail(n), size
+
+
+def fetch_yahoo_latest(ticker, n=2):
+    text, size = _get(f"{YAHOO_CHART}{quote(ticker)}?range=5d&interval=1d")
+    result = json.loads(text)['chart']['result'][0]
+    close = result['indicators']['adjclose'][0]['adjclose'] if 'adjclose' in result['indicators'] \
+        else result['indicators']['quote'][0]['close']
+    index = pd.to_datetime(result['timestamp'], unit='s').normalize()
+    return pd.Series(close, index=index, dtype=float).dropna().tail(n), size
+
+
+def fetch_latest(key, n=2):
+    if is_yahoo(key):
+        return fetch_yahoo_latest(column_name(key), n)
+    return fetch_fred_latest(key, n)
+
+
+def _row(key, s, size, error=None):
+    last = s.iloc[-1] if len(s) else np.nan
+    prev = s.iloc[-2] if len(s) > 1 else np.nan
+    return {'series': key, 'date': s.index[-1] if len(s) else pd.NaT, 'value': last,
+            'prev_date': s.index[-2] if len(s) > 1 else pd.NaT, 'prev': prev,
+            'change': last - prev, 'bytes': size, 'error': error}
+
+
+def latest(keys=None, n=2, workers=WORKERS):
+    """Compact table of the newest observations, fetched concurrently."""
+    keys = list(keys or DEFAULT_KEYS)
+
+    def one(key):
+        try:
+            return key, *fetch_latest(key, n), None
+        except Exception as e:
+            return key, pd.Series(dtype=float), 0, f"{type(e).__name__}: {e}"
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(keys))) as pool:
+        results = list(pool.map(one, keys))
+    series = {key: s for key, s, _, _ in results}
+    table = pd.DataFrame([_row(key, s, size, err) for key, s, size, err in results])
+    derived = derived_latest(series)
+    return pd.concat([table, derived], ignore_index=True) if len(derived) else table
+
+
+def derived_latest(series):
+    """Ratio / spread rows from whichever inputs were fetched (same-date values only)."""
+    pairs = [('GLD/TLT', 'yahoo:GLD', 'yahoo:TLT', lambda a, b: a / b),
+             ('SPX/GLD', 'yahoo:^GSPC', 'yahoo:GLD', lambda a, b: a / b),
+             ('SOFR-IORB (bp)', 'SOFR', 'IORB', lambda a, b: (a - b) * 100)]
+    rows = []
+    for name, a, b, op in pairs:
+        if a in series and b in series:
+            both = pd.concat([series[a], series[b]], axis=1).dropna()
+            if len(both):
+                rows.append(_row(name, op(both.iloc[:, 0], both.iloc[:, 1]), 0))
+    return pd.DataFrame(rows)
+
+
+def format_latest(table):
+    lines = ["=== LATEST OBSERVATIONS ===",
+             f"{'Series':<16} {'Date':<10} {'Value':>12} {'Change':>10}  {'Previous':<10}"]
+    for _, r in table.iterrows():
+        if r['error']:
+            lines.append(f"{r['series']:<16} {'—':<10} {'—':>12} {'—':>10}  {r['error']}")
+            continue
+        date = f"{r['date']:%Y-%m-%d}" if pd.notna(r['date']) else '—'
+        prev = f"{r['prev_date']:%Y-%m-%d}" if pd.notna(r['prev_date']) else '—'
+        change = f"{r['change']:+10.3f}" if pd.notna(r['change']) else f"{'—':>10}"
+        lines.append(f"{r['series']:<16} {date:<10} {r['value']:>12.3f} {change}  {prev:<10}")
+    lines.append(f"({table['bytes'].sum() / 1024:.1f} KB transferred)")
+    return lines
@@ -0,0 +1,182 @@
+"""
+===============================================================================
+LEAD / LAG MATRIX | Which indicator leads which, and by how much?
+===============================================================================
+
+WHAT IT DOES
+  1. Aligns every series to one frequency (monthly by default) and turns it
+     into a stationary change (12-period log change for positive levels,
+     12-period difference for rates/spreads), then standardizes it.
+  2. Computes corr(x_t, y_{t+k}) for every pair and every lag |k| <= max_lag
+     with FFTs: rffts of each series, its square and its validity mask, then
+     conj(F_a)·F_b → irfft per pair block (upper triangle only). Missing data
+     is zero-filled, and the sums Σx, Σy, Σxy, Σx², Σy² and the count all run
+     over the overlapping samples only, so each value is the Pearson
+     correlation of exactly the pairs that exist at that lag. The count is an
+     interval intersection, or the mask FFT when a series has interior gaps.
+  3. Picks each pair's lag with the largest |corr|.
+     k > 0  →  x leads y by k periods.
+
+  Cost is O(N² · T log T) for N series of length T — independent of the lag
+  range, vs. O(N² · T · L) for shift-and-correlate loops.
+
+USAGE
+  ./macro.py leadlag [--freq M] [--max-lag 24] [--top 15] [--plot]
+===============================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.deviations import DIFF_SERIES
+
+FREQS = {'M': ('MS', 12), 'W': ('W-WED', 52), 'Q': ('QS', 4)}
+MIN_OVERLAP = 36   # lagged pairs needed before a correlation is trusted
+BLOCK = 32         # rows of the pair matrix computed per FFT batch
+
+
+def align(series, freq='M', change=True):
+    """Common-frequency panel of standardized changes (columns = series)."""
+    rule, periods = FREQS[freq]
+    raw = {}
+    for name, obj in series.items():
+        s = obj.iloc[:, 0] if isinstance(obj, pd.DataFrame) else obj
+        s = s.dropna().astype(float)
+        if not s.empty:
+            raw[name] = s[~s.index.duplicated(keep='last')]
+    if not raw:
+        return pd.DataFrame()
+    panel = pd.concat(raw, axis=1).sort_index().resample(rule).mean()   # one resample for all
+    if change:
+        positive = (panel > 0) | panel.isna()
+        logs = [c for c in panel.columns
+                if c.split(':')[-1] not in DIFF_SERIES and positive[c].all()]
+        panel[logs] = np.log(panel[logs])
+        panel = panel.diff(periods)
+    panel = panel.dropna(how='all')
+    return (panel - panel.mean()) / panel.std()
+
+
+def _overlap_counts(mask, lags):
+    """Valid (x_i[t], x_j[t + k]) pairs per lag when every series is one
+    contiguous run (the usual case): interval overlap, no FFT needed."""
+    T = mask.shape[1]
+    first = np.argmax(mask, axis=1)
+    last = T - 1 - np.argmax(mask[:, ::-1], axis=1)
+    for i, (a, b) in enumerate(zip(first, last)):
+        if not mask[i, a:b + 1].all():
+            return None
+    k = lags[None, None, :]
+    lo = np.maximum(first[:, None, None], first[None, :, None] - k)
+    hi = np.minimum(last[:, None, None], last[None, :, None] - k)
+    return np.maximum(hi - lo + 1, 0).astype(float)
+
+
+def cross_correlations(panel, max_lag=24, min_overlap=MIN_OVERLAP):
+    """(N, N, 2·max_lag + 1) array; [i, j, max_lag + k] = corr(x_i[t], x_j[t + k])."""
+    X = panel.to_numpy(dtype=float).T                 # (N, T)
+    mask = np.isfinite(X)
+    X = np.where(mask, X, 0.0)
+    n, T = X.shape
+    L = 1 << int(np.ceil(np.log2(T + max_lag)))       # enough zero-padding for |k| <= max_lag
+    FX = np.fft.rfft(X, n=L)
+    FX2 = np.fft.rfft(X * X, n=L)
+    FM = np.fft.rfft(mask.astype(float), n=L)
+    lags = np.arange(-max_lag, max_lag + 1)
+    pick = lags % L                                    # negative lags wrap to the end
+    counts = _overlap_counts(mask, lags)
+
+    out = np.full((n, n, len(lags)), np.nan)
+    for a in range(0, n, BLOCK):
+        b = min(a + BLOCK, n)
+
+        def lagged(FA, FB):
+            """Σ_t A_i[t]·B_j[t + k] for rows a..b of A against columns a..n of B."""
+            return np.fft.irfft(np.conj(FA[a:b, None, :]) * FB[None, a:, :], n=L)[..., pick]
+
+        # upper triangle only (columns a..n); the rest follows by symmetry
+        cnt = counts[a:b, a:] if counts is not None else np.rint(lagged(FM, FM))
+        sx, sy = lagged(FX, FM), lagged(FM, FX)        # Σ x over the overlap, Σ y over the overlap
+        sxx, syy = lagged(FX2, FM), lagged(FM, FX2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = lagged(FX, FX) - sx * sy / cnt
+            corr = cov / np.sqrt((sxx - sx * sx / cnt) * (syy - sy * sy / cnt))
+        out[a:b, a:] = np.where(cnt >= min_overlap, corr, np.nan)
+    lower = np.tril_indices(n, -1)
+    out[lower] = out.transpose(1, 0, 2)[lower][:, ::-1]   # corr_ji(k) = corr_ij(−k)
+    return np.clip(out, -1.0, 1.0), lags
+
+
+def best_lags(panel, cc, lags):
+    """Per pair: the lag with the largest |corr| and that corr (diagonal excluded)."""
+    names = list(panel.columns)
+    filled = np.where(np.isfinite(cc), np.abs(cc), -1.0)
+    idx = np.argmax(filled, axis=-1)
+    corr = np.take_along_axis(cc, idx[..., None], axis=-1)[..., 0]
+    lag = lags[idx].astype(float)
+    lag[~np.isfinite(corr)] = np.nan
+    np.fill_diagonal(lag, np.nan)
+    np.fill_diagonal(corr, np.nan)
+    return (pd.DataFrame(lag, index=names, columns=names),
+            pd.DataFrame(corr, index=names, columns=names))
+
+
+def top_leads(lag, corr, top=15, min_corr=0.2):
+    """Strongest 'x leads y by k' relationships (k > 0 only, each pair once)."""
+    L, C = lag.to_numpy(), corr.to_numpy()
+    with np.errstate(invalid='ignore'):
+        i, j = np.nonzero((L > 0) & (np.abs(C) >= min_corr))
+    order = np.argsort(-np.abs(C[i, j]))[:top]
+    i, j = i[order], j[order]
+    return pd.DataFrame({'leader': lag.index[i], 'follower': lag.columns[j],
+                         'lag': L[i, j].astype(int), 'corr': C[i, j]})
+
+
+def analyze(series, freq='M', max_lag=24):
+    panel = align(series, freq)
+    cc, lags = cross_correlations(panel, max_lag)
+    lag, corr = best_lags(panel, cc, lags)
+    return panel, lag, corr
+
+
+# ———————————————— OUTPUT ————————————————
+def format_leads(leads, freq='M'):
+    unit = {'M': 'mo', 'W': 'wk', 'Q': 'qtr'}[freq]
+    lines = ["=== TOP LEAD RELATIONSHIPS (leader → follower) ===",
+             f"{'Leader':<26} {'Follower':<26} {'Lead':>7} {'Corr':>6}"]
+    for _, r in leads.iterrows():
+        lines.append(f"{r['leader']:<26} {r['follower']:<26} {r['lag']:>4} {unit} {r['corr']:>+6.2f}")
+    if leads.empty:
+        lines.append("(no lead relationships above the correlation floor)")
+    return lines
+
+
+def plot_heatmap(lag, corr, freq='M', max_lag=24):
+    import matplotlib.pyplot as plt
+    from utils.charts import apply_dark_style
+
+    apply_dark_style()
+    n = len(lag)
+    size = max(8, min(0.45 * n + 4, 40))
+    fig, ax = plt.subplots(figsize=(size, size * 0.8))
+    # color = lead in periods, faded where the correlation is weak
+    rgba = plt.get_cmap('coolwarm')((np.nan_to_num(lag.to_numpy()) + max_lag) / (2 * max_lag))
+    rgba[..., 3] = np.clip(np.nan_to_num(np.abs(corr.to_numpy())) * 1.5, 0.08, 1.0)
+    ax.imshow(rgba, interpolation='nearest')
+    if n <= 30:
+        for i in range(n):
+            for j in range(n):
+                if np.isfinite(lag.iat[i, j]):
+                    ax.text(j, i, f"{int(lag.iat[i, j])}\n{corr.iat[i, j]:+.2f}", ha='center',
+                            va='center', fontsize=7, color='white')
+    ax.set_xticks(range(n), lag.columns, rotation=90, fontsize=8)
+    ax.set_yticks(range(n), lag.index, fontsize=8)
+    ax.set_xlabel('Follower (y)', color='white')
+    ax.set_ylabel('Leader (x)', color='white')
+    sm = plt.cm.ScalarMappable(cmap='coolwarm', norm=plt.Normalize(-max_lag, max_lag))
+    fig.colorbar(sm, ax=ax, fraction=0.046, pad=0.04).set_label(
+        f'Lag of max |corr| ({freq}; > 0 = row leads column)', color='white')
+    ax.set_title('Lead / Lag Matrix (FFT cross-correlation of standardized changes)',
+                 color='white', fontsize=14, pad=20, fontweight='bold')
+    fig.tight_layout()
+    return fig
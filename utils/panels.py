@@ -0,0 +1,175 @@
+"""
+===============================================================================
+PANELS | Per-indicator drawing on an existing Axes (dark mode)
+===============================================================================
+
+Each function draws one indicator's derived frame (utils/indicators.py) onto
+`ax` the way its script does — same colors, reference lines and labels — with
+recession spans passed in precomputed, so callers shade from one USREC pass.
+Daily lines go through utils/downsample.py first (DOWNSAMPLE), so a 20-year
+panel draws ~2k points with every visible extreme intact.
+
+  draw_panel(name, ax, derived, spans)
+  render_figure(name, derived, spans) → standalone 14x7 Figure with title
+  render_dashboard(names, derived, spans) → every indicator on one wall-monitor
+      figure: shared date axis, recession rectangles built once for all panels
+===============================================================================
+"""
+
+import math
+from datetime import datetime
+
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from utils.charts import apply_dark_style, recession_layer, recession_verts, shade_recessions
+from utils.downsample import downsample
+from utils.indicators import INDICATORS, sahm_status
+
+DOWNSAMPLE = 'minmax'   # daily lines: None = every point | 'minmax' | 'lttb' (utils/downsample.py)
+
+
+def _line(ax, s, **kw):
+    """ax.plot of a long series, reduced to its visible shape first."""
+    s = downsample(s, DOWNSAMPLE)
+    return ax.plot(s.index, s, **kw)
+
+
+def _yield_curve(ax, d):
+    _line(ax, d['T10Y2Y'], color='#cccccc', linewidth=1.4, label='10Y - 2Y Spread')
+    ax.axhline(0, color='#ff6b6b', linestyle='--', linewidth=1.3, alpha=0.8, label='Inversion (0%)')
+    ax.set_ylabel('Spread (%)', color='white')
+    return f"Last: {d['T10Y2Y'].iloc[-1]:.2f}%"
+
+
+def _unemployment(ax, d):
+    ax.plot(d.index, d['UNRATE'], color='#4da6ff', linewidth=1.4, label='Unemployment Rate')
+    ax.set_ylabel('Unemployment Rate (%)', color='white')
+    sahm = d['Sahm_Rule'].iloc[-1]
+    return f"Latest: {d['UNRATE'].iloc[-1]:.2f}% | Sahm: {sahm:.2f} pp → {sahm_status(sahm)}"
+
+
+def _fed_assets(ax, d):
+    ax.plot(d.index, d['Total_Assets'], color='#4da6ff', linewidth=2.0, label='FED Total Assets')
+    ax.ticklabel_format(style='plain', axis='y')
+    ax.set_ylabel('Total Assets (Billions of USD)', color='white')
+    return f"Latest: ${d['Total_Assets'].iloc[-1]:,.2f} Billion"
+
+
+def _repo_spread(ax, d):
+    _line(ax, d['Spread_bp'], color='#4da6ff', linewidth=1.4, label='Daily Spread')
+    ax.plot(d.index, d['MA_30d'], color='#cc5555', linewidth=2.8, label='30-Day MA')
+    top = max(d['Spread_bp'].max(), 31)
+    ax.fill_between(d.index, 30, top, color='#ff6b6b', alpha=0.12, label='Stress (>30 bp)')
+    ax.axhline(0, color='#888888', linestyle='--', linewidth=1.2, alpha=0.6)
+    ax.set_ylabel('Spread (basis points)', color='white')
+    return f"Latest: {d['Spread_bp'].iloc[-1]:.1f} bp | 30d MA: {d['MA_30d'].iloc[-1]:.1f} bp"
+
+
+def _gld_tlt(ax, d):
+    _line(ax, d['GLD_TLT'], color='#ffcc00', linewidth=2, label='GLD / TLT Ratio')
+    ax.axhline(1.0, color='white', linestyle='--', linewidth=1.2, alpha=0.7)
+    ax.set_ylabel('GLD / TLT', color='white')
+    return f"Latest: {d['GLD_TLT'].iloc[-1]:.3f}"
+
+
+def _spx_in_gold(ax, d):
+    _line(ax, d['SPX_in_Gold'], color='#4da6ff', linewidth=1.6, label='S&P 500 Priced in Gold')
+    ax.set_ylabel('SPX / GLD (points per share)', color='white')
+    return f"Latest: {d['SPX_in_Gold'].iloc[-1]:.1f} SPX points per GLD share"
+
+
+def _revolving_debt(ax, d):
+    ax.plot(d.index, d['Nominal'], color='#4da6ff', linewidth=1.6, label='Nominal Debt')
+    ax.plot(d.index, d['Real'], color='#00ff88', linewidth=1.6, label='Real Debt (latest $)')
+    ax.set_ylabel('Outstanding Debt (Trillions $)', color='white')
+    return f"Latest: ${d['Nominal'].iloc[-1]:.3f} trillion (Nominal + Real)"
+
+
+PANELS = {
+    'yield_curve':    _yield_curve,
+    'unemployment':   _unemployment,
+    'fed_assets':     _fed_assets,
+    'repo_spread':    _repo_spread,
+    'gld_tlt':        _gld_tlt,
+    'spx_in_gold':    _spx_in_gold,
+    'revolving_debt': _revolving_debt,
+}
+
+
+def draw_panel(name, ax, derived, spans, legend=True, verts=None):
+    """Draw one indicator on ax; returns its one-line 'Latest: ...' subtitle.
+
+    With verts (recession_verts(spans)) the shading is one shared collection and
+    the x-limits are left to the caller (shared date axis).
+    """
+    subtitle = PANELS[name](ax, derived)
+    if verts is not None:
+        recession_layer(ax, verts)
+    elif len(derived):
+        lo, hi = derived.index[0], derived.index[-1]
+        shade_recessions(ax, [(a, b) for a, b in spans if b >= lo and a <= hi])
+        ax.set_xlim(lo, hi)
+    ax.grid(True, alpha=0.3)
+    if legend:
+        ax.legend(loc='upper left', framealpha=0.95)
+    return subtitle
+
+
+def render_figure(name, derived, spans, figsize=(14, 7)):
+    """Standalone chart in the scripts' layout."""
+    apply_dark_style()
+    fig, ax = plt.subplots(figsize=figsize)
+    subtitle = draw_panel(name, ax, derived, spans)
+    start = derived.index[0].year if len(derived) else ''
+    ax.set_title(f"{INDICATORS[name]['title']} ({start}–Now)\n{subtitle}",
+                 color='white', fontsize=14, pad=20, fontweight='bold')
+    ax.set_xlabel('Year', color='white')
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
+    ax.xaxis.set_major_locator(mdates.YearLocator(2))
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    return fig
+
+
+DASHBOARD_SINCE = '2005-01-01'   # GLD's first full year; every panel has data from here
+
+
+def render_dashboard(names, derived, spans, since=DASHBOARD_SINCE, figsize=(24, 13.5)):
+    """All selected indicators as subplots of one figure sharing the date axis.
+
+    derived: {name: derived frame}. Frames are clipped to `since` before
+    drawing; the recession rectangles are computed once and reused by every panel.
+    """
+    apply_dark_style()
+    names = list(names)
+    since = pd.Timestamp(since) if since else min(derived[n].index[0] for n in names)
+    ncols = 1 if len(names) <= 3 else 2
+    nrows = math.ceil(len(names) / ncols)
+    fig, axes = plt.subplots(nrows, ncols, figsize=figsize, sharex=True, squeeze=False)
+    end = max(derived[n].index[-1] for n in names)
+    verts = recession_verts([(a, b) for a, b in spans if b >= since])
+
+    for ax, name in zip(axes.flat, names):
+        d = derived[name].loc[since:]
+        subtitle = draw_panel(name, ax, d, spans, legend=False, verts=verts) if len(d) else 'no data'
+        ax.set_title(f"{INDICATORS[name]['title']} — {subtitle}", color='white', fontsize=11,
+                     loc='left', fontweight='bold')
+        ax.yaxis.label.set_size(9)
+        ax.legend(loc='upper left', fontsize=8, framealpha=0.9)
+    for ax in axes.flat[len(names):]:
+        ax.set_visible(False)
+    # a panel sitting above an empty slot is the bottom of its column
+    for i in range(len(names), nrows * ncols):
+        axes.flat[i - ncols].xaxis.set_tick_params(labelbottom=True)
+
+    axes[0, 0].set_xlim(since, end)
+    axes[0, 0].xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
+    axes[0, 0].xaxis.set_major_locator(mdates.YearLocator(2))
+    for ax in axes.flat:
+        ax.tick_params(axis='x', labelrotation=45, labelsize=9)
+    fig.suptitle(f"Macro Dashboard ({since.year}–Now) — {datetime.now():%Y-%m-%d}",
+                 color='white', fontsize=16, fontweight='bold')
+    fig.tight_layout()
+    return fig
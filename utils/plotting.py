@@ -28,8 +28,10 @@ ZOOM: Set START_YEAR | Toggle INFLATION_ADJUSTED
 ===============================================================================
 """
 
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))   # repo root, for utils/
 import pandas as pd
-import pandas_datareader.data as web
+from utils.providers import web
 import matplotlib.pyplot as plt
 from datetime import datetime
 
@@ -0,0 +1,228 @@
+"""
+===============================================================================
+DATA PROVIDERS | Live, record and replay behind the calls the scripts make
+===============================================================================
+
+WHAT IT DOES
+  Every network read in the repo goes through one of three calls:
+    web.DataReader(name, 'fred', start, end)      (pandas_datareader)
+    yf.download(tickers, start=…, end=…, …)       (yfinance)
+    get_url(url)                                  (plain HTTP, utils/latest.py)
+  `web` and `yf` here are drop-in stand-ins that forward to the active provider:
+
+    live    – the real libraries (default)
+    record  – live, and every response is also saved as a fixture
+    replay  – fixtures only, held in memory after first use; never touches the
+              network. A missing fixture raises LookupError naming the call.
+
+SELECTING A MODE
+  MACRO_DATA_MODE=record|replay   (or set_provider(...) in code)
+  MACRO_FIXTURES=<dir>            (default: CACHE_ROOT/fixtures)
+
+  Fixtures are keyed by the call (series / tickers / interval …) but not by its
+  dates: replay slices the recorded frame to the requested [start, end], so a
+  script asking for "15 years up to today" replays tomorrow too. Recording the
+  same call again merges the new rows in.
+
+  Point MACRO_CACHE_DIR at an empty directory for replay runs so the
+  SeriesStore is rebuilt from fixtures rather than from a live cache.
+===============================================================================
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from urllib.request import Request, urlopen
+
+import pandas as pd
+
+from utils.config import cache_dir
+
+MODES = ('live', 'record', 'replay')
+IGNORED_KWARGS = {'start', 'end', 'progress', 'timeout'}   # don't change what is returned
+IGNORED_PARAMS = {'api_key', 'cosd', 'coed'}                # secrets / rolling date windows
+URL_TIMEOUT = 20
+
+
+class LiveProvider:
+    """The real libraries, imported on first use."""
+
+    mode = 'live'
+
+    def DataReader(self, name, data_source=None, start=None, end=None, **kwargs):
+        import pandas_datareader.data as web
+        return web.DataReader(name, data_source, start, end, **kwargs)
+
+    def download(self, tickers, start=None, end=None, **kwargs):
+        import yfinance as yf
+        return yf.download(tickers, start=start, end=end, **kwargs)
+
+    def get_url(self, url):
+        """(body text, bytes on the wire)."""
+        req = Request(url, headers={'Accept-Encoding': 'gzip', 'User-Agent': 'Mozilla/5.0 projectmacro'})
+        with urlopen(req, timeout=URL_TIMEOUT) as resp:
+            raw = resp.read()
+            body = gzip.decompress(raw) if resp.headers.get('Content-Encoding') == 'gzip' else raw
+        return body.decode(), len(raw)
+
+
+# ———————————————— FIXTURES ————————————————
+def _call_key(fn, name, kwargs):
+    kw = ','.join(f"{k}={kwargs[k]!r}" for k in sorted(kwargs) if k not in IGNORED_KWARGS)
+    name = ','.join(name) if isinstance(name, (list, tuple)) else str(name)
+    text = f"{fn}({name}{';' + kw if kw else ''})"
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', name)[:40].strip('_')
+    return text, f"{fn}-{slug}-{hashlib.sha1(text.encode()).hexdigest()[:10]}"
+
+
+def _url_key(url):
+    parts = urlsplit(url)
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query) if k not in IGNORED_PARAMS))
+    text = urlunsplit(parts._replace(query=query))
+    return text, f"url-{hashlib.sha1(text.encode()).hexdigest()[:16]}"
+
+
+def _slice(frame, start, end):
+    if not isinstance(frame, pd.DataFrame) or not isinstance(frame.index, pd.DatetimeIndex):
+        return frame
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    return frame.loc[start:end]
+
+
+class RecordingProvider(LiveProvider):
+    """Live calls whose results are also written to the fixture directory."""
+
+    mode = 'record'
+
+    def __init__(self, root=None, live=None):
+        self.root = root or os.environ.get('MACRO_FIXTURES') or cache_dir('fixtures')
+        os.makedirs(self.root, exist_ok=True)
+        self.live = live or LiveProvider()
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, path):
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def _save(self, key, result):
+        # download() fetches chunks of one series from several threads, and every
+        # chunk maps to the same fixture: merge them one at a time.
+        path = os.path.join(self.root, f"{key}.pkl")
+        with self._lock(path):
+            if isinstance(result, pd.DataFrame) and os.path.exists(path):
+                old = pd.read_pickle(path)
+                if isinstance(old, pd.DataFrame) and not old.empty and not result.empty:
+                    result = result.combine_first(old)   # widen, newest values win
+            fd, tmp = tempfile.mkstemp(dir=self.root, prefix=f"{key}.", suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pd.to_pickle(result, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.remove(tmp)
+                raise
+
+    def DataReader(self, name, data_source=None, start=None, end=None, **kwargs):
+        df = self.live.DataReader(name, data_source, start, end, **kwargs)
+        self._save(_call_key('fred', name, {'source': data_source, **kwargs})[1], df)
+        return df
+
+    def download(self, tickers, start=None, end=None, **kwargs):
+        df = self.live.download(tickers, start=start, end=end, **kwargs)
+        self._save(_call_key('yahoo', tickers, kwargs)[1], df)
+        return df
+
+    def get_url(self, url):
+        result = self.live.get_url(url)
+        self._save(_url_key(url)[1], result)
+        return result
+
+
+class ReplayProvider:
+    """Serves recorded fixtures from memory; never touches the network."""
+
+    mode = 'replay'
+
+    def __init__(self, root=None):
+        self.root = root or os.environ.get('MACRO_FIXTURES') or cache_dir('fixtures')
+        self._memory = {}
+
+    def _load(self, text, key):
+        if key not in self._memory:
+            path = os.path.join(self.root, f"{key}.pkl")
+            if not os.path.exists(path):
+                raise LookupError(f"no fixture for {text} in {self.root} "
+                                  f"(record it with MACRO_DATA_MODE=record)")
+            self._memory[key] = pd.read_pickle(path)
+        return self._memory[key]
+
+    def DataReader(self, name, data_source=None, start=None, end=None, **kwargs):
+        df = self._load(*_call_key('fred', name, {'source': data_source, **kwargs}))
+        return _slice(df, start, end).copy()
+
+    def download(self, tickers, start=None, end=None, **kwargs):
+        df = self._load(*_call_key('yahoo', tickers, kwargs))
+        return _slice(df, start, end).copy()
+
+    def get_url(self, url):
+        return self._load(*_url_key(url))
+
+
+# ———————————————— ACTIVE PROVIDER ————————————————
+_provider = None
+
+
+def make_provider(mode=None, root=None):
+    mode = mode or os.environ.get('MACRO_DATA_MODE', 'live')
+    if mode not in MODES:
+        raise ValueError(f"MACRO_DATA_MODE must be one of {', '.join(MODES)}, not {mode!r}")
+    if mode == 'record':
+        return RecordingProvider(root)
+    if mode == 'replay':
+        return ReplayProvider(root)
+    return LiveProvider()
+
+
+def get_provider():
+    global _provider
+    if _provider is None:
+        _provider = make_provider()
+    return _provider
+
+
+def set_provider(provider):
+    """Install a provider (object or mode name); returns the previous one."""
+    global _provider
+    previous = _provider
+    _provider = make_provider(provider) if isinstance(provider, str) or provider is None else provider
+    return previous
+
+
+class _Web:
+    """Stand-in for `pandas_datareader.data as web`."""
+
+    @staticmethod
+    def DataReader(name, data_source=None, start=None, end=None, **kwargs):
+        return get_provider().DataReader(name, data_source, start, end, **kwargs)
+
+
+class _Yahoo:
+    """Stand-in for `yfinance as yf` (download only)."""
+
+    @staticmethod
+    def download(tickers, start=None, end=None, **kwargs):
+        return get_provider().download(tickers, start=start, end=end, **kwargs)
+
+
+web = _Web()
+yf = _Yahoo()
+
+
+def get_url(url):
+    return get_provider().get_url(url)
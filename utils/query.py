@@ -0,0 +1,280 @@
+"""
+===============================================================================
+QUERY | SQL over every cached series and derived indicator (no network)
+===============================================================================
+
+WHAT IT DOES
+  Mirrors the SeriesStore into one SQLite file (cache_dir('query')) so ad-hoc
+  questions are a query, not an edited START_YEAR. Only the store's cached
+  pickles are read, never the network. A table is rebuilt only when its
+  source pickles change, so a warm query costs milliseconds.
+
+TABLES
+  <series>      one per cached series, named after its column (T10Y2Y, UNRATE,
+                GLD, GSPC, BTC_USD, ...): date + the value column
+  <indicator>   one per derived indicator (yield_curve, unemployment,
+                repo_spread, ...): date + derived + raw input columns, as in
+                ./macro.py export
+  monthly       month + the monthly mean of every column above (one row per
+                month), for questions that mix daily and monthly series
+
+  Every table carries precomputed date keys: date ('YYYY-MM-DD', the clustered
+  primary key of a WITHOUT ROWID table), month ('YYYY-MM', indexed), quarter
+  ('YYYY-Qn', indexed) and year. SQLite ≥ 3.25 has window functions (LAG,
+  AVG(...) OVER, ...). With DuckDB installed, engine='duckdb' runs the same SQL
+  as columnar scans over the frames instead.
+
+USAGE
+  ./macro.py query "SELECT month, Sahm_Rule, T10Y2Y FROM monthly WHERE Sahm_Rule > 0.35 AND T10Y2Y < 0"
+  ./macro.py query "SELECT quarter, MAX(Spread_bp) AS max_bp FROM repo_spread GROUP BY quarter"
+  ./macro.py query --tables
+  df = query("SELECT date, T10Y2Y FROM T10Y2Y WHERE date >= ?", ['2022-01-01'])
+  with MacroDB() as db: db.query(...), db.tables()
+===============================================================================
+"""
+
+import os
+import re
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from utils.config import cache_dir
+
+QUERY_VERSION = 1            # bump when the table layout changes (indicator code is hashed into the stamps)
+DB_FILE = 'macro.sqlite'
+ENGINES = ('sqlite', 'duckdb')
+DATE_KEYS = ('date', 'month', 'quarter', 'year')
+EXAMPLES = {
+    'Sahm near trigger while the curve is inverted':
+        "SELECT month, Sahm_Rule, T10Y2Y FROM monthly WHERE Sahm_Rule > 0.35 AND T10Y2Y < 0",
+    'Max repo spread per quarter':
+        "SELECT quarter, MAX(Spread_bp) AS max_bp FROM repo_spread GROUP BY quarter ORDER BY quarter",
+    'Longest inversion streaks (window functions)':
+        "SELECT MIN(date) AS start, MAX(date) AS last, COUNT(*) AS days FROM ("
+        " SELECT date, T10Y2Y, SUM(T10Y2Y >= 0) OVER (ORDER BY date) AS run FROM T10Y2Y)"
+        " WHERE T10Y2Y < 0 GROUP BY run ORDER BY days DESC LIMIT 5",
+}
+
+
+def identifier(name):
+    """'^GSPC' → 'GSPC', 'BTC-USD' → 'BTC_USD': usable in SQL without quoting (mostly)."""
+    return re.sub(r'\W+', '_', str(name)).strip('_')
+
+
+def table_name(key):
+    """'yahoo:^GSPC' → 'GSPC', 'yahoo:BTC-USD' → 'BTC_USD', 'T10Y2Y' → 'T10Y2Y'."""
+    from utils.store import column_name
+    return identifier(column_name(key))
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def date_keys(index):
+    """date / month / quarter / year arrays for a DatetimeIndex (vectorized, no strftime)."""
+    days = pd.DatetimeIndex(index).values.astype('datetime64[D]')
+    months = days.astype('datetime64[M]').astype(np.int64)
+    year = months // 12 + 1970
+    quarter = np.char.add(np.char.add(year.astype(str), '-Q'), (months % 12 // 3 + 1).astype(str))
+    return days.astype(str), days.astype('datetime64[M]').astype(str), quarter, year
+
+
+def with_date_keys(frame):
+    """Frame with its DatetimeIndex moved into the date / month / quarter / year columns."""
+    date, month, quarter, year = date_keys(frame.index)
+    cols = {c: frame[c].to_numpy() for c in frame.columns if c not in DATE_KEYS}
+    return pd.DataFrame({'date': date, 'month': month, 'quarter': quarter, 'year': year, **cols})
+
+
+# ———————————————— SOURCES ————————————————
+class Sources:
+    """Raw and derived frames from the store's cached pickles, each built at most once."""
+
+    def __init__(self, store):
+        from utils.indicators import INDICATORS, code_version
+        self.code = code_version()
+        self.store = store
+        self.keys = store.keys()
+        self.raw_tables = {table_name(k): k for k in self.keys}
+        self.indicators = {name: spec for name, spec in INDICATORS.items()
+                           if all(k in self.keys for k in spec['inputs'])}
+        self._frames = {}
+
+    def stamp(self, key):
+        st = os.stat(self.store._path(key, 'pkl'))
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def stamps(self):
+        """table → fingerprint of the pickles it is built from."""
+        out = {t: f"{QUERY_VERSION}|{self.stamp(k)}" for t, k in self.raw_tables.items()}
+        for name, spec in self.indicators.items():
+            out[name] = (f"{QUERY_VERSION}|{self.code}|{spec['start']}|"
+                         + '|'.join(self.stamp(k) for k in spec['inputs']))
+        out['monthly'] = f"{QUERY_VERSION}|" + '|'.join(out[t] for t in sorted(out))
+        return out
+
+    def frame(self, table):
+        """DatetimeIndex-ed frame behind a table."""
+        if table not in self._frames:
+            if table in self.raw_tables:
+                df = self.store.load(self.raw_tables[table])
+                self._frames[table] = df.rename(columns={df.columns[0]: table})
+            elif table in self.indicators:
+                from utils.export import panel
+                inputs = {k: self.store.load(k) for k in self.indicators[table]['inputs']}
+                self._frames[table] = panel(table, inputs).rename(columns=identifier)
+            elif table == 'monthly':
+                self._frames[table] = self.monthly()
+            else:
+                raise KeyError(table)
+        return self._frames[table]
+
+    def monthly(self):
+        """Monthly mean of every numeric column, raw series first, one column per name."""
+        cols = {}
+        for table in list(self.raw_tables) + list(self.indicators):
+            df = self.frame(table)
+            for col in df.columns:
+                if col not in cols and pd.api.types.is_numeric_dtype(df[col]):
+                    cols[col] = df[col].resample('MS').mean()
+        return pd.DataFrame(cols).sort_index() if cols else pd.DataFrame(index=pd.DatetimeIndex([]))
+
+    def tables(self):
+        return list(self.raw_tables) + list(self.indicators) + ['monthly']
+
+
+# ———————————————— SQLITE ————————————————
+def _sql_type(series):
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return 'INTEGER'
+    return 'REAL' if pd.api.types.is_numeric_dtype(series) else 'TEXT'
+
+
+def write_table(con, table, frame):
+    """(Re)create one table from a DatetimeIndex-ed frame, keyed and indexed by date."""
+    rows = with_date_keys(frame)
+    if table == 'monthly':
+        rows = rows.drop(columns='date')
+    key = 'month' if table == 'monthly' else 'date'
+    types = {'date': 'TEXT', 'month': 'TEXT', 'quarter': 'TEXT', 'year': 'INTEGER'}
+    defs = [f"{_quote(c)} {types.get(c) or _sql_type(rows[c])}" + (' PRIMARY KEY' if c == key else '')
+            for c in rows.columns]
+    q = _quote(table)
+    con.execute(f"DROP TABLE IF EXISTS {q}")
+    con.execute(f"CREATE TABLE {q} ({', '.join(defs)}) WITHOUT ROWID")
+    columns = []
+    for c in rows.columns:
+        values = rows[c].to_numpy()
+        if values.dtype.kind == 'f':
+            columns.append([None if v != v else v for v in values.tolist()])      # NaN → NULL
+        else:
+            columns.append([None if v is None or v != v else v for v in rows[c].tolist()])
+    marks = ', '.join('?' * len(rows.columns))
+    con.executemany(f"INSERT INTO {q} VALUES ({marks})", zip(*columns))
+    for c in ('month', 'quarter'):
+        if c != key:
+            con.execute(f"CREATE INDEX {_quote(f'{table}_{c}')} ON {q} ({c})")
+    return len(rows)
+
+
+class MacroDB:
+    """SQLite mirror of the SeriesStore; tables are refreshed from changed pickles on open."""
+
+    def __init__(self, store=None, path=None, engine='sqlite', sync=True):
+        from utils.store import SeriesStore
+        if engine not in ENGINES:
+            raise ValueError(f"unknown engine {engine!r} (choose from {', '.join(ENGINES)})")
+        self.store = store or SeriesStore(offline=True)
+        self.path = path or os.path.join(cache_dir('query'), DB_FILE)
+        self.engine = engine
+        self.rebuilt = {}                       # table → rows written by the last sync
+        self.sources = Sources(self.store)
+        self.con = self._duckdb() if engine == 'duckdb' else sqlite3.connect(self.path)
+        if sync and engine == 'sqlite':
+            self.sync()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.con.close()
+
+    def sync(self):
+        """Rebuild the tables whose source pickles changed; drop tables whose series are gone."""
+        if self.engine != 'sqlite':
+            return self.rebuilt
+        con = self.con
+        con.execute("CREATE TABLE IF NOT EXISTS _sources (name TEXT PRIMARY KEY, stamp TEXT)")
+        have = dict(con.execute("SELECT name, stamp FROM _sources"))
+        stamps = self.sources.stamps()
+        stale = [t for t in self.sources.tables() if have.get(t) != stamps[t]]
+        gone = set(have) - set(stamps)
+        if not stale and not gone:
+            return self.rebuilt
+        with con:
+            for table in gone:
+                con.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+                con.execute("DELETE FROM _sources WHERE name = ?", (table,))
+            for table in stale:
+                self.rebuilt[table] = write_table(con, table, self.sources.frame(table))
+                con.execute("INSERT OR REPLACE INTO _sources VALUES (?, ?)", (table, stamps[table]))
+        return self.rebuilt
+
+    def _duckdb(self):
+        try:
+            import duckdb
+        except ImportError:
+            raise SystemExit("engine='duckdb' needs duckdb (pip install duckdb); the default sqlite engine needs nothing extra")
+        con = duckdb.connect()
+        for table in self.sources.tables():
+            frame = with_date_keys(self.sources.frame(table))
+            con.register(table, frame.drop(columns='date') if table == 'monthly' else frame)
+        return con
+
+    def query(self, sql, params=None):
+        """Result as a DataFrame ('date' parsed back to datetimes)."""
+        if self.engine == 'duckdb':
+            df = self.con.execute(sql, params or []).df()
+        else:
+            df = pd.read_sql_query(sql, self.con, params=params)
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'])
+        return df
+
+    def tables(self):
+        """table → column names."""
+        out = {}
+        for table in self.sources.tables():
+            if self.engine == 'duckdb':
+                out[table] = list(self.con.execute(f"SELECT * FROM {_quote(table)} LIMIT 0").df().columns)
+            else:
+                out[table] = [r[1] for r in self.con.execute(f"PRAGMA table_info({_quote(table)})")]
+        return out
+
+
+def query(sql, params=None, store=None, engine='sqlite'):
+    """One-shot: open (syncing if needed), run, close."""
+    with MacroDB(store, engine=engine) as db:
+        return db.query(sql, params)
+
+
+def format_result(df, max_rows=50, elapsed=None):
+    lines = [df.to_string(index=False, max_rows=max_rows) if len(df.columns) else '(no columns)']
+    lines.append(f"{len(df):,} row{'s' if len(df) != 1 else ''}"
+                 + (f" in {elapsed * 1000:.1f} ms" if elapsed is not None else ''))
+    return lines
+
+
+def format_tables(tables):
+    lines = [f"=== TABLES ({len(tables)}) ==="]
+    for table, cols in tables.items():
+        lines.append(f"{table:<16} " + ', '.join(c for c in cols if c not in DATE_KEYS))
+    lines.append(f"every table also has: {', '.join(DATE_KEYS)} (monthly: month, quarter, year)")
+    lines += ['', 'Examples:'] + [f"  -- {k}\n  {v}" for k, v in EXAMPLES.items()]
+    return lines
@@ -0,0 +1,231 @@
+"""
+===============================================================================
+RATIO MATRIX | Every pairwise price ratio of a ticker universe at once
+===============================================================================
+
+WHAT IT DOES
+  GLD_over_TLT.py and SPinGold.py generalized: for N tickers,
+    • prices come from one batched yfinance call (only for tickers whose cache
+      is missing or due) and are written back to the SeriesStore through the
+      same validation gate as refresh()
+    • any pair's ratio is exp(lp[:, i] − lp[:, j]) of one (T, N) log-price array
+    • ratio momentum over `window` days for all N² pairs is one broadcast:
+      exp(Δlog A − Δlog B) − 1
+    • rolling correlation of daily log returns for every pair, from running
+      sums over a few matrix rows at a time (CORR_BLOCK) so memory stays
+      (T, block, N); pairs with different trading calendars, e.g. BTC-USD
+      vs. ETFs, only use the days both traded
+  Any pair can then be charted in the dark style without another fetch.
+
+USAGE
+  ./macro.py ratios --tickers GLD,TLT,SPY,UUP,BTC-USD --window 63 --top 15
+  ./macro.py ratios --pair GLD/TLT --save gld_tlt.png
+===============================================================================
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from utils.store import REFETCH_OVERLAP, YAHOO_PREFIX
+
+UNIVERSE = ['GLD', 'TLT', 'SPY', '^GSPC', 'UUP', 'BTC-USD', 'IEF', 'SHY', 'HYG', 'LQD',
+            'XLE', 'XLF', 'XLK', 'XLU', 'XLV', 'XLI', 'XLY', 'XLP', 'XLB', 'XLRE']
+DEFAULT_START = '2004-11-18'   # GLD's first day
+WINDOW = 63                    # ~3 months of trading days
+CORR_BLOCK = 4                 # matrix rows per pass of rolling_corr (bounds the running-sum memory)
+
+
+# ———————————————— PRICES ————————————————
+def fetch_batch(tickers, start, end):
+    """Adj Close for all tickers in a single yfinance request."""
+    from utils.providers import yf
+    df = yf.download(tickers=list(tickers), start=start, end=end, auto_adjust=False,
+                     progress=False, timeout=60, group_by='column')
+    if df.empty:
+        return pd.DataFrame(columns=list(tickers), dtype=float)
+    close = df['Adj Close']
+    if isinstance(close, pd.Series):
+        close = close.to_frame(tickers[0])
+    return close.reindex(columns=list(tickers))
+
+
+def load_prices(tickers, start=DEFAULT_START, store=None, fetch=fetch_batch):
+    """Price panel (columns = tickers); at most one download for the whole universe."""
+    from utils.store import SeriesStore
+    store = store or SeriesStore()
+    start = pd.Timestamp(start)
+    keys = {t: YAHOO_PREFIX + t for t in tickers}
+    cached = {t: store.load(k) for t, k in keys.items()}
+
+    full = [t for t in tickers if cached[t] is None or cached[t].empty
+            or pd.Timestamp(store.meta(keys[t]).get('start', '2100-01-01')) > start]
+    tail = [t for t in tickers if t not in full and store.is_stale(keys[t], cached[t])]
+    batch = full + tail
+    if batch and not store.offline:
+        since = start if full else min(cached[t].index[-1] for t in tail) - REFETCH_OVERLAP
+        fresh = fetch(batch, since, datetime.now())
+        store.fetches += 1
+        for t in batch:
+            new = fresh[t].dropna().to_frame(t) if t in fresh else pd.DataFrame(columns=[t], dtype=float)
+            old = cached[t]
+            new, report = store._ingest(keys[t], new, None if t in full else old)
+            df = pd.concat([old, new]) if old is not None and not old.empty else new
+            meta = {'fetched': time.time(), 'validation': report}
+            if t in full:
+                meta['start'] = str(start.date())
+            cached[t] = store.save(keys[t], df, **meta)
+
+    cols = {t: cached[t].iloc[:, 0] for t in tickers if cached[t] is not None and not cached[t].empty}
+    return pd.concat(cols, axis=1).sort_index().loc[start:]
+
+
+# ———————————————— MATRIX ————————————————
+class RatioMatrix:
+    """All pairwise ratios, momentum and rolling correlations of a price panel."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.tickers = list(prices.columns)
+        self.index = prices.index
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.logp = np.log(prices.to_numpy(dtype=float))            # (T, N)
+
+    def _pos(self, ticker):
+        return self.tickers.index(ticker)
+
+    def ratio(self, a, b):
+        """One pair as a Series (dates where both trade), ready to chart."""
+        r = np.exp(self.logp[:, self._pos(a)] - self.logp[:, self._pos(b)])
+        return pd.Series(r, index=self.index, name=f"{a}/{b}").dropna()
+
+    def momentum(self, window=WINDOW):
+        """(N, N) latest ratio change over `window` trading days of each ticker."""
+        change = np.full(len(self.tickers), np.nan)
+        for i in range(len(self.tickers)):
+            lp = self.logp[:, i]
+            lp = lp[np.isfinite(lp)]
+            if len(lp) > window:
+                change[i] = lp[-1] - lp[-1 - window]
+        m = np.expm1(change[:, None] - change[None, :])
+        return pd.DataFrame(m, index=self.tickers, columns=self.tickers)
+
+    def returns(self):
+        """(T, N) daily log returns, each ticker's since its own previous trading day."""
+        lp = pd.DataFrame(self.logp)
+        return (lp - lp.ffill().shift(1)).to_numpy()
+
+    @staticmethod
+    def _corr(ri, rj, window, min_periods):
+        """(T, I, J) rolling correlation of the columns of ri against those of rj, over
+        the last `window` days on which both have a return (running sums, no pair loop
+        for the arithmetic; the per-pair window start is one searchsorted each)."""
+        T, I, J = len(ri), ri.shape[1], rj.shape[1]
+        mi, mj = np.isfinite(ri).astype(float), np.isfinite(rj).astype(float)
+        xi, xj = np.where(mi > 0, ri, 0.0), np.where(mj > 0, rj, 0.0)
+
+        def cumulative(a):
+            return np.concatenate((np.zeros((1, I * J)), np.cumsum(a.reshape(T, I * J), axis=0)))
+
+        both = mi[:, :, None] * mj[:, None, :]
+        joint = cumulative(both)
+        start = np.empty((T, I * J), dtype=np.int64)      # first cumulative row inside the window
+        for k in range(I * J):
+            start[:, k] = np.searchsorted(joint[:, k], joint[1:, k] - window, side='left')
+
+        def rolling(a):
+            c = cumulative(a)
+            return (c[1:] - np.take_along_axis(c, start, axis=0)).reshape(T, I, J)
+
+        n = rolling(both)
+        sx = rolling(xi[:, :, None] * mj[:, None, :])     # Σ x_i over days j also traded
+        sy = rolling(mi[:, :, None] * xj[:, None, :])
+        sxy = rolling(xi[:, :, None] * xj[:, None, :])
+        sxx = rolling((xi * xi)[:, :, None] * mj[:, None, :])
+        syy = rolling(mi[:, :, None] * (xj * xj)[:, None, :])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = sxy - sx * sy / n
+            corr = cov / np.sqrt((sxx - sx * sx / n) * (syy - sy * sy / n))
+        corr[n < min_periods] = np.nan
+        return np.clip(corr, -1.0, 1.0)
+
+    def rolling_corr(self, window=WINDOW, min_periods=None, block=CORR_BLOCK):
+        """(T, N, N) correlation of daily log returns over the last `window` days on
+        which both tickers have a return (not calendar rows: BTC-USD's weekends
+        don't shorten an ETF pair's window). Built `block` rows of the matrix at a
+        time, so the running sums never hold more than (T, block, N)."""
+        min_periods = min_periods or window // 2
+        r = self.returns()
+        N = r.shape[1]
+        out = np.empty((len(r), N, N))
+        for lo in range(0, N, block):
+            out[:, lo:lo + block] = self._corr(r[:, lo:lo + block], r, window, min_periods)
+        return out
+
+    def latest_corr(self, window=WINDOW):
+        # only the last window is needed: from where every ticker still has window + 1 prices
+        rows = [np.flatnonzero(self.prices[t].notna().to_numpy()) for t in self.tickers]
+        start = min((r[-(window + 1)] if len(r) > window else 0) for r in rows) if rows else 0
+        tail = RatioMatrix(self.prices.iloc[start:])
+        return pd.DataFrame(tail.rolling_corr(window)[-1], index=self.tickers, columns=self.tickers)
+
+    def pair_corr(self, a, b, window=WINDOW, min_periods=None):
+        """One pair's rolling correlation, from its two columns only."""
+        r = self.returns()
+        corr = self._corr(r[:, [self._pos(a)]], r[:, [self._pos(b)]], window, min_periods or window // 2)
+        return pd.Series(corr[:, 0, 0], index=self.index, name=f"corr({a},{b})")
+
+
+def top_pairs(matrix, window=WINDOW, top=15):
+    """Strongest ratio trends (each unordered pair once, shown in its rising direction)."""
+    mom = matrix.momentum(window).to_numpy()
+    corr = matrix.latest_corr(window).to_numpy()
+    with np.errstate(invalid='ignore'):
+        i, j = np.nonzero(mom > 0)
+    order = np.argsort(-mom[i, j])[:top]
+    i, j = i[order], j[order]
+    t = matrix.tickers
+    return pd.DataFrame({'pair': [f"{t[a]}/{t[b]}" for a, b in zip(i, j)],
+                         'ratio': [matrix.ratio(t[a], t[b]).iloc[-1] for a, b in zip(i, j)],
+                         'momentum': mom[i, j], 'corr': corr[i, j]})
+
+
+def format_pairs(pairs, window=WINDOW):
+    lines = [f"=== TOP RATIO MOMENTUM ({window}-day) ===",
+             f"{'Pair':<18} {'Ratio':>10} {'Momentum':>9} {'Corr':>6}"]
+    for _, r in pairs.iterrows():
+        lines.append(f"{r['pair']:<18} {r['ratio']:>10.4f} {r['momentum']:>+9.1%} {r['corr']:>+6.2f}")
+    return lines
+
+
+# ———————————————— CHART ————————————————
+def plot_pair(matrix, a, b, spans=(), window=WINDOW):
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    from utils.charts import apply_dark_style, shade_recessions
+
+    apply_dark_style()
+    ratio = matrix.ratio(a, b)
+    corr = matrix.pair_corr(a, b, window).reindex(ratio.index)
+    fig, (ax, cax) = plt.subplots(2, 1, figsize=(14, 9), sharex=True, height_ratios=[3, 1])
+    ax.plot(ratio.index, ratio, color='#ffcc00', linewidth=1.6, label=f'{a} / {b}')
+    lo, hi = ratio.index[0], ratio.index[-1]
+    shade_recessions(ax, [(s, e) for s, e in spans if e >= lo and s <= hi])
+    ax.set_ylabel(f'{a} / {b}', color='white')
+    ax.legend(loc='upper left', framealpha=0.95)
+    ax.grid(True, alpha=0.3)
+    ax.set_title(f'{a} / {b} Ratio\nLatest: {ratio.iloc[-1]:.4f} ({ratio.index[-1]:%Y-%m-%d})',
+                 color='white', fontsize=14, pad=20, fontweight='bold')
+    cax.plot(corr.index, corr, color='#4da6ff', linewidth=1.2)
+    cax.axhline(0, color='#888888', linestyle='--', linewidth=1)
+    cax.set_ylim(-1, 1)
+    cax.set_ylabel(f'{window}d corr', color='white')
+    cax.grid(True, alpha=0.3)
+    cax.set_xlim(lo, hi)
+    cax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
+    cax.xaxis.set_major_locator(mdates.YearLocator(2))
+    cax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    return fig
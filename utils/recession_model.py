@@ -0,0 +1,272 @@
+"""
+===============================================================================
+RECESSION PROBABILITY MODEL | Logit / probit on the repo's own indicators
+===============================================================================
+
+WHAT IT SHOWS
+  P(NBER recession within the next HORIZON months), fitted on monthly features
+  built from the inputs the chart scripts already use, with lags.
+
+FEATURES (monthly; each at lags 0 / 3 / 6 / 12)
+  T10Y2Y      10Y-2Y spread, monthly mean                (1976–)
+  SAHM        Sahm Rule value (pp)                       (1950–)
+  REVOLSL_RG  Real revolving debt, 12-month growth (%)   (1969–)
+  WALCL_G     Fed total assets, 12-month log growth (%)  (2003–)
+  GLD_TLT     GLD/TLT ratio, 12-month log change (%)     (2005–)
+  REPO_BP     Repo spread vs. floor, monthly mean (bp)   (2016–)
+
+  Rows are only used where every selected feature exists, so the default set
+  is the long-history one; the short ones (repo: a single recession so far)
+  can be added with --features.
+
+TARGET
+  1 if USREC == 1 in any of the next HORIZON months (unknown for the last
+  HORIZON months — those rows are predicted, not fitted).
+
+SPEED
+  The feature matrix is cached and only its tail is recomputed when new data
+  arrives; refits warm-start Newton–Raphson from the last coefficients, so a
+  daily update is one or two iterations on a ~900×13 matrix.
+===============================================================================
+"""
+
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.config import cache_dir
+
+HORIZON = 12
+LAGS = (0, 3, 6, 12)
+DEFAULT_FEATURES = ('T10Y2Y', 'SAHM', 'REVOLSL_RG')
+ALL_FEATURES = ('T10Y2Y', 'SAHM', 'REVOLSL_RG', 'WALCL_G', 'GLD_TLT', 'REPO_BP')
+INPUT_KEYS = ['T10Y2Y', 'UNRATE', 'REVOLSL', 'CPIAUCSL', 'WALCL', 'yahoo:GLD',
+              'yahoo:TLT', 'OBFR', 'SOFR', 'IOER', 'IORB', 'USREC']
+REVISE_MONTHS = 6     # cached rows this recent are always recomputed (FRED revisions)
+WARMUP_MONTHS = 36    # history needed before the first recomputed row (lags + 12m windows)
+RIDGE = 1e-4
+
+
+# ———————————————— FEATURES ————————————————
+def _monthly(frame, how='mean'):
+    s = frame.iloc[:, 0] if isinstance(frame, pd.DataFrame) else frame
+    s = s.dropna()
+    return getattr(s.resample('MS'), how)()
+
+
+def monthly_base(inputs):
+    """Un-lagged monthly features + USREC from raw store frames."""
+    from utils.indicators import price_ratio, repo_spread, sahm_rule
+
+    base = pd.DataFrame({
+        'T10Y2Y': _monthly(inputs['T10Y2Y']),
+        'SAHM': sahm_rule(_monthly(inputs['UNRATE'], 'last'))['Sahm_Rule'],
+        'USREC': _monthly(inputs['USREC'], 'max'),
+    })
+    debt = _monthly(inputs['REVOLSL'], 'last')
+    cpi = _monthly(inputs['CPIAUCSL'], 'last').reindex(debt.index)
+    base['REVOLSL_RG'] = (debt / cpi).pct_change(12, fill_method=None) * 100
+    base['WALCL_G'] = np.log(_monthly(inputs['WALCL'])).diff(12) * 100
+    ratio = price_ratio(inputs['yahoo:GLD'], inputs['yahoo:TLT'], 'r')['r']
+    base['GLD_TLT'] = np.log(_monthly(ratio)).diff(12) * 100
+    repo = {k: inputs[k] for k in ('OBFR', 'SOFR', 'IOER', 'IORB')}
+    base['REPO_BP'] = _monthly(repo_spread(repo)['Spread_bp'])
+    return base.sort_index()
+
+
+def add_lags(base, features=ALL_FEATURES, lags=LAGS, horizon=HORIZON):
+    cols = {}
+    for f in features:
+        for lag in lags:
+            cols[f"{f}_L{lag}"] = base[f].shift(lag)
+    out = pd.DataFrame(cols, index=base.index)
+    # forward target: any recession month in t+1 … t+horizon
+    rec = base['USREC'].to_numpy(dtype=float)
+    n = len(rec)
+    fwd = np.full(n, np.nan)
+    if n > horizon:
+        windows = np.lib.stride_tricks.sliding_window_view(rec[1:], horizon)
+        fwd[:len(windows)] = np.max(windows, axis=1)
+    out['TARGET'] = fwd
+    out['USREC'] = base['USREC']
+    return out
+
+
+class FeatureCache:
+    """Feature matrix on disk; update() only recomputes the tail."""
+
+    def __init__(self, horizon=HORIZON, root=None):
+        self.horizon = horizon
+        self.root = root or cache_dir('recession')
+        self.path = os.path.join(self.root, f'features_h{horizon}.pkl')
+        self.recomputed_rows = 0
+
+    def load(self):
+        try:
+            return pd.read_pickle(self.path)
+        except FileNotFoundError:
+            return None
+
+    def update(self, inputs):
+        cached = self.load()
+        if cached is None or cached.empty:
+            matrix = add_lags(monthly_base(inputs), horizon=self.horizon)
+            self.recomputed_rows = len(matrix)
+        else:
+            # rows whose target could still change + recent rows FRED may revise
+            redo_from = cached.index[-1] - pd.DateOffset(months=max(REVISE_MONTHS, self.horizon))
+            cut = redo_from - pd.DateOffset(months=WARMUP_MONTHS)
+            recent = {k: v.loc[cut:] for k, v in inputs.items()}
+            tail = add_lags(monthly_base(recent), horizon=self.horizon).loc[redo_from:]
+            # the target needs USREC beyond each row; keep what the tail can't see
+            matrix = pd.concat([cached.loc[:redo_from - pd.DateOffset(days=1)], tail])
+            self.recomputed_rows = len(tail)
+        matrix.to_pickle(self.path)
+        return matrix
+
+
+# ———————————————— MODEL ————————————————
+_erf = np.vectorize(math.erf, otypes=[float])
+
+
+def _norm_cdf(x):
+    return 0.5 * (1.0 + _erf(x / math.sqrt(2.0)))
+
+
+def _norm_pdf(x):
+    return np.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+def predict(X, beta, link='logit'):
+    eta = X @ beta
+    if link == 'probit':
+        return _norm_cdf(eta)
+    return 1.0 / (1.0 + np.exp(-eta))
+
+
+def fit(X, y, link='logit', beta0=None, tol=1e-8, max_iter=50):
+    """Newton–Raphson (IRLS) with a tiny ridge; returns (beta, iterations)."""
+    n, k = X.shape
+    beta = np.zeros(k) if beta0 is None or len(beta0) != k else np.asarray(beta0, float)
+    penalty = RIDGE * np.eye(k)
+    penalty[0, 0] = 0.0   # don't shrink the intercept
+    for it in range(1, max_iter + 1):
+        eta = X @ beta
+        if link == 'probit':
+            p = np.clip(_norm_cdf(eta), 1e-10, 1 - 1e-10)
+            phi = _norm_pdf(eta)
+            grad = X.T @ ((y - p) * phi / (p * (1 - p))) - penalty @ beta
+            w = phi ** 2 / (p * (1 - p))
+        else:
+            p = 1.0 / (1.0 + np.exp(-eta))
+            grad = X.T @ (y - p) - penalty @ beta
+            w = p * (1 - p)
+        hess = (X * w[:, None]).T @ X + penalty
+        step = np.linalg.solve(hess, grad)
+        beta = beta + step
+        if np.max(np.abs(step)) < tol:
+            return beta, it
+    return beta, max_iter
+
+
+class RecessionModel:
+    """Standardized-feature logit/probit with warm-started refits."""
+
+    def __init__(self, features=DEFAULT_FEATURES, link='logit', horizon=HORIZON, root=None):
+        self.features = tuple(features)
+        self.link = link
+        self.horizon = horizon
+        self.root = root or cache_dir('recession')
+        self.columns = [f"{f}_L{lag}" for f in self.features for lag in LAGS]
+        tag = '-'.join(self.features)
+        self.state_path = os.path.join(self.root, f'model_{link}_h{horizon}_{tag}.json')
+        self.beta = self.mean = self.std = None
+        self.iterations = 0
+        self._load_state()
+
+    def _load_state(self):
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if state.get('columns') == self.columns:
+            self.beta = np.array(state['beta'])
+            self.mean = np.array(state['mean'])
+            self.std = np.array(state['std'])
+
+    def _save_state(self):
+        with open(self.state_path, 'w') as f:
+            json.dump({'columns': self.columns, 'beta': self.beta.tolist(),
+                       'mean': self.mean.tolist(), 'std': self.std.tolist(),
+                       'iterations': self.iterations}, f, indent=1)
+
+    def _design(self, matrix):
+        Z = (matrix[self.columns].to_numpy(float) - self.mean) / self.std
+        return np.column_stack([np.ones(len(Z)), Z])
+
+    def fit(self, matrix):
+        rows = matrix.dropna(subset=self.columns + ['TARGET'])
+        raw = rows[self.columns].to_numpy(float)
+        mean, std = raw.mean(axis=0), raw.std(axis=0)
+        std[std == 0] = 1.0
+        warm = None
+        if self.beta is not None:
+            # re-express the old coefficients in the new standardization
+            slopes = self.beta[1:] / self.std * std
+            intercept = self.beta[0] - np.sum(self.beta[1:] * self.mean / self.std) + np.sum(slopes * mean / std)
+            warm = np.concatenate([[intercept], slopes])
+        self.mean, self.std = mean, std
+        X = self._design(rows)
+        self.beta, self.iterations = fit(X, rows['TARGET'].to_numpy(float), self.link, warm)
+        self.n_obs = len(rows)
+        self._save_state()
+        return self
+
+    def probability(self, matrix):
+        rows = matrix.dropna(subset=self.columns)
+        return pd.Series(predict(self._design(rows), self.beta, self.link),
+                         index=rows.index, name='P_recession')
+
+    def coefficients(self):
+        return pd.Series(self.beta, index=['const'] + self.columns)
+
+
+def run(store=None, features=DEFAULT_FEATURES, link='logit', horizon=HORIZON):
+    """Update the cached matrix, warm-start refit, return (model, probabilities, matrix)."""
+    from utils.store import SeriesStore
+    store = store or SeriesStore()
+    inputs = {k: store.get(k) for k in INPUT_KEYS}
+    matrix = FeatureCache(horizon).update(inputs)
+    model = RecessionModel(features, link, horizon).fit(matrix)
+    return model, model.probability(matrix), matrix
+
+
+# ———————————————— CHART ————————————————
+def plot(prob, usrec, horizon=HORIZON, link='logit'):
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    from utils.charts import apply_dark_style, recession_spans, shade_recessions
+
+    apply_dark_style()
+    fig, ax = plt.subplots(figsize=(14, 7))
+    ax.plot(prob.index, prob * 100, color='#ffcc00', linewidth=1.6,
+            label=f'P(recession within {horizon}m)')
+    shade_recessions(ax, recession_spans(usrec.loc[prob.index[0]:]))
+    ax.axhline(50, color='#ff6b6b', linestyle='--', linewidth=1.2, alpha=0.7, label='50%')
+    ax.set_ylim(0, 100)
+    ax.set_title(f'Recession Probability ({link}, {horizon}-month horizon)\n'
+                 f'Latest: {prob.iloc[-1]:.1%} ({prob.index[-1]:%b %Y})',
+                 color='white', fontsize=14, pad=20, fontweight='bold')
+    ax.set_xlabel('Year', color='white')
+    ax.set_ylabel('Probability (%)', color='white')
+    ax.legend(loc='upper left', framealpha=0.95)
+    ax.grid(True, alpha=0.3)
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
+    ax.xaxis.set_major_locator(mdates.YearLocator(4))
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    return fig
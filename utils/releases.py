@@ -0,0 +1,214 @@
+"""
+===============================================================================
+RELEASE CALENDAR | When is the next observation of each series due?
+===============================================================================
+
+WHAT IT DOES
+  Holds the publication schedule every script's docstring describes, in a
+  machine-readable form, and answers three questions per series:
+    • which observation comes next, and when should it be published (ET)?
+    • is a fetch due now (release time passed and not backing off)?
+    • SLA status: fresh / due / late / discontinued
+
+  The SeriesStore asks is_due() before refreshing, so a series is only
+  re-downloaded once its next release time has passed — roughly one request
+  per actual release instead of one per run.
+
+LATE RELEASES
+  If a fetch after the expected time brings nothing new (holiday, FRED lag,
+  delayed release), the next check backs off: 15 min, 30 min, 1 h, 2 h, 4 h,
+  then every 8 h, resetting as soon as a new observation arrives.
+
+SCHEDULE RULES
+  daily    next business day; published lag_days business days later at `time`
+  weekly   obs + 7 days (e.g. Wednesday level); published lag_days later at `time`
+  monthly  obs = 1st of month; published `months_after` months later on
+           'first_friday', calendar `day`, or the `day`-th business day
+  Federal holidays are not modelled — the back-off absorbs them.
+===============================================================================
+"""
+
+from datetime import datetime, time as dtime, timedelta
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+ET = ZoneInfo('America/New_York')
+
+RELEASES = {
+    # 10Year2Year.py — "T10Y2Y updated ~3:30 PM ET"
+    'T10Y2Y':   dict(freq='daily', time='15:30', lag_days=0),
+    # SOFR-IORB.py — repo rates ~8–9 AM ET for the prior business day
+    'SOFR':     dict(freq='daily', time='09:00', lag_days=1),
+    'OBFR':     dict(freq='daily', time='09:00', lag_days=1),
+    # … floor rates ~4:30 PM ET
+    'IORB':     dict(freq='daily', time='16:30', lag_days=0),
+    'IOER':     dict(freq='daily', time='16:30', lag_days=0, discontinued='2021-07-28'),
+    # Unemployment.py — BLS 1st Friday 8:30 AM ET, FRED +1–3 days
+    'UNRATE':   dict(freq='monthly', rule='first_friday', months_after=1, time='08:30', lag_days=1),
+    # FedAssets.py — H.4.1, Wednesday level, released Thursday 4:30 PM ET
+    'WALCL':    dict(freq='weekly', time='16:30', lag_days=1),
+    # fluff/Jobless.py — week ending Saturday, released Thursday 8:30 AM ET
+    'ICSA':     dict(freq='weekly', time='08:30', lag_days=5),
+    # fluff/CreditCardDebt.py — G.19 ~5th business day, two months after
+    'REVOLSL':  dict(freq='monthly', rule='business_day', day=5, months_after=2, time='15:00'),
+    'CPIAUCSL': dict(freq='monthly', rule='day', day=13, months_after=1, time='08:30', lag_days=1),
+    # fluff/IndustrialProd.py — G.17 mid-month
+    'INDPRO':   dict(freq='monthly', rule='day', day=16, months_after=1, time='09:15'),
+    # NBER-dated; FRED refreshes it early each month
+    'USREC':    dict(freq='monthly', rule='day', day=3, months_after=1, time='12:00'),
+}
+# H.4.1 components (utils/balance_sheet.py) — same Wednesday level / Thursday release
+RELEASES.update(dict.fromkeys(('TREAST', 'WSHOMCB', 'WLCFLL', 'WORAL', 'SWPT',
+                               'WLFN', 'WRBWFRBL', 'WDTGAL', 'WLRRAL'), RELEASES['WALCL']))
+# Yahoo Finance closes (GLD_over_TLT.py — "updated ~4:00 PM ET")
+YAHOO_RELEASE = dict(freq='daily', time='16:30', lag_days=0)
+
+BACKOFF = [timedelta(minutes=m) for m in (15, 30, 60, 120, 240, 480)]
+SLA_GRACE = {'daily': pd.offsets.BDay(1), 'weekly': pd.offsets.BDay(2), 'monthly': pd.offsets.BDay(5)}
+
+
+def spec_for(key):
+    if key.startswith('yahoo:'):
+        return YAHOO_RELEASE
+    return RELEASES.get(key)
+
+
+def _at(day, hhmm):
+    h, m = map(int, hhmm.split(':'))
+    return datetime.combine(pd.Timestamp(day).date(), dtime(h, m), tzinfo=ET)
+
+
+def _business_days_after(day, n):
+    return (pd.Timestamp(day) + pd.offsets.BDay(n)) if n else pd.Timestamp(day)
+
+
+def next_observation(spec, last_obs):
+    last_obs = pd.Timestamp(last_obs).normalize()
+    if spec['freq'] == 'daily':
+        return last_obs + pd.offsets.BDay(1)
+    if spec['freq'] == 'weekly':
+        return last_obs + pd.Timedelta(days=7)
+    return (last_obs + pd.offsets.MonthBegin(1)).normalize()
+
+
+def release_time(spec, obs):
+    """Expected publication datetime (ET) of the observation dated obs."""
+    obs = pd.Timestamp(obs)
+    lag = spec.get('lag_days', 0)
+    if spec['freq'] == 'daily':
+        return _at(_business_days_after(obs, lag), spec['time'])
+    if spec['freq'] == 'weekly':
+        return _at(obs + pd.Timedelta(days=lag), spec['time'])
+
+    month = (obs + pd.DateOffset(months=spec.get('months_after', 1))).replace(day=1)
+    rule = spec.get('rule', 'day')
+    if rule == 'first_friday':
+        day = month + pd.Timedelta(days=(4 - month.weekday()) % 7)
+    elif rule == 'business_day':
+        first = month if month.weekday() < 5 else month + pd.offsets.BDay(1)
+        day = first + pd.offsets.BDay(spec['day'] - 1)
+    else:
+        day = month.replace(day=spec['day'])
+    return _at(_business_days_after(day, lag) if lag else day, spec['time'])
+
+
+def _now(now=None):
+    if now is None:
+        return datetime.now(ET)
+    now = pd.Timestamp(now)
+    return (now.tz_localize(ET) if now.tzinfo is None else now.tz_convert(ET)).to_pydatetime()
+
+
+def expected(key, last_obs):
+    """(next observation date, its expected release datetime) — or (None, None)."""
+    spec = spec_for(key)
+    if spec is None or spec.get('discontinued') or last_obs is None:
+        return None, None
+    obs = next_observation(spec, last_obs)
+    return obs, release_time(spec, obs)
+
+
+def is_due(key, last_obs, meta=None, now=None):
+    """True when a new observation should be out and we aren't backing off.
+    Returns None for series without a calendar (caller falls back to max-age)."""
+    spec = spec_for(key)
+    if spec is None:
+        return None
+    if spec.get('discontinued'):
+        return False
+    if last_obs is None:
+        return True
+    now = _now(now)
+    next_check = (meta or {}).get('next_check')
+    if next_check and now.timestamp() < next_check:
+        return False
+    _, release = expected(key, last_obs)
+    return now >= release
+
+
+def record_fetch(meta, got_new, now=None):
+    """Update back-off bookkeeping in a store meta dict after a calendar fetch."""
+    now = _now(now)
+    if got_new:
+        meta['misses'] = 0
+        meta.pop('next_check', None)
+    else:
+        misses = meta.get('misses', 0) + 1
+        meta['misses'] = misses
+        meta['next_check'] = (now + BACKOFF[min(misses, len(BACKOFF)) - 1]).timestamp()
+    return meta
+
+
+def status(key, last_obs, meta=None, now=None):
+    """One row of the data-freshness SLA report."""
+    spec = spec_for(key)
+    now = _now(now)
+    row = {'series': key, 'last_obs': None if last_obs is None else pd.Timestamp(last_obs).date(),
+           'next_obs': None, 'expected': None, 'status': 'unscheduled',
+           'misses': (meta or {}).get('misses', 0)}
+    if spec is None:
+        return row
+    if spec.get('discontinued'):
+        row['status'] = 'discontinued'
+        return row
+    obs, release = expected(key, last_obs)
+    if obs is None:                      # nothing cached yet: the next fetch is due now (see is_due)
+        row['status'] = 'due'
+        return row
+    row['next_obs'], row['expected'] = obs.date(), release
+    if now < release:
+        row['status'] = 'fresh'
+    elif now < pd.Timestamp(release) + SLA_GRACE[spec['freq']]:
+        row['status'] = 'due'
+    else:
+        row['status'] = 'late'
+    return row
+
+
+def next_wakeup(store, now=None):
+    """Earliest moment any cached series could need a fetch (for the daemon loop)."""
+    now = _now(now)
+    times = []
+    for key in store.keys():
+        df = store.load(key)
+        meta = store.meta(key)
+        last = df.index[-1] if df is not None and len(df) else None
+        _, release = expected(key, last)
+        if release is None:
+            continue
+        t = max(release, now)
+        if meta.get('next_check'):
+            t = max(t, datetime.fromtimestamp(meta['next_check'], ET))
+        times.append(t)
+    return min(times) if times else now + timedelta(hours=1)
+
+
+def format_status(rows):
+    lines = ["=== DATA FRESHNESS (release calendar) ===",
+             f"{'Series':<14} {'Last obs':<11} {'Next obs':<11} {'Expected (ET)':<17} {'Status':<12} Misses"]
+    for r in rows:
+        exp = r['expected'].strftime('%Y-%m-%d %H:%M') if r['expected'] else '—'
+        lines.append(f"{r['series']:<14} {str(r['last_obs'] or '—'):<11} {str(r['next_obs'] or '—'):<11} "
+                     f"{exp:<17} {r['status']:<12} {r['misses']}")
+    return lines
@@ -0,0 +1,231 @@
+"""
+===============================================================================
+RENDER CACHE | Skip redrawing charts whose inputs haven't changed
+===============================================================================
+
+WHAT IT DOES
+  Content-addressed cache of rendered charts (PNG / SVG / PDF).
+  The key is a SHA-256 of:
+    • the input data (index + values of every Series / DataFrame / array)
+    • the style parameters (e.g. the dark-mode rcParams dict)
+    • the chart options (START_YEAR, toggles, title, ...)
+  Same inputs → same key → the stored file is returned and nothing is drawn.
+
+WHY IT MATTERS
+  T10Y2Y updates daily, UNRATE and REVOLSL monthly — most charts are unchanged
+  most hours, so most of the render CPU in a publishing loop is wasted.
+
+EVICTION
+  By age (max_age seconds since last use) and by total size (least recently
+  used files go first). Runs after every put() and on demand via evict().
+
+  A figure that is already built can be keyed by what it draws instead
+  (figure_inputs): ./macro.py charts runs each script, then only rasterizes
+  the figures whose artists changed since the last run.
+
+USAGE
+  cache = RenderCache()
+  key = cache.key(yield_curve, recession, style=DARK_STYLE, options={'start': 1980})
+  path = cache.render(key, draw_chart, fmt='png')   # draw_chart() → Figure
+  key = cache.key(*figure_inputs(fig), options={'chart': 'Unemployment'})
+===============================================================================
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+import numpy as np
+
+from utils.config import cache_dir
+
+FORMATS = ('png', 'svg', 'pdf')
+ENTRY = re.compile(r'[0-9a-f]{64}\.(?:%s)' % '|'.join(FORMATS))   # <key>.<fmt>; not *.tmp or other state
+
+
+def _feed(h, obj):
+    """Hash one input object into h, deterministically and without pickling."""
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None and isinstance(obj, (pd.Series, pd.DataFrame)):
+        h.update(type(obj).__name__.encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        if isinstance(obj, pd.DataFrame):
+            h.update(json.dumps([str(c) for c in obj.columns]).encode())
+        else:
+            h.update(str(obj.name).encode())
+    elif isinstance(obj, np.ndarray):
+        h.update(str(obj.dtype).encode())
+        h.update(str(obj.shape).encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (bytes, bytearray)):
+        h.update(obj)
+    else:
+        h.update(json.dumps(obj, sort_keys=True, default=str).encode())
+    h.update(b'\x00')
+
+
+def _remove(path):
+    """1 if path was removed, 0 if another process already had."""
+    try:
+        os.remove(path)
+        return 1
+    except FileNotFoundError:
+        return 0
+
+
+def figure_inputs(fig):
+    """What a built Figure plots, as hashable values for key(): size, and per Axes
+    its limits, titles, labels, and the data and colors of its lines, collections,
+    patches, texts and legend. Layout code (ticks, rotation, ...) isn't covered, so
+    pass the drawing code's source in `options` too."""
+    def color(c):
+        return np.asarray(c, dtype=float) if not isinstance(c, str) else c
+
+    out = [fig.get_size_inches(), float(fig.dpi), color(fig.get_facecolor())]
+    out += [t.get_text() for t in fig.texts]
+    for ax in fig.axes:
+        out += [ax.get_position().bounds, ax.get_xlim(), ax.get_ylim(), ax.get_xscale(), ax.get_yscale(),
+                ax.get_title('left'), ax.get_title(), ax.get_title('right'), ax.get_xlabel(), ax.get_ylabel()]
+        for line in ax.lines:
+            out += [line.get_xydata(), color(line.get_color()), line.get_linewidth(), line.get_linestyle(),
+                    str(line.get_marker()), str(line.get_label())]
+        for coll in ax.collections:
+            out += [np.asarray(coll.get_offsets(), dtype=float), coll.get_facecolor(), coll.get_edgecolor()]
+            out += [p.vertices for p in coll.get_paths()]
+        for patch in ax.patches:
+            out += [patch.get_patch_transform().transform(patch.get_path().vertices),
+                    color(patch.get_facecolor()), str(patch.get_label())]
+        for text in ax.texts:
+            out += [text.get_text(), tuple(map(float, text.get_position())), color(text.get_color())]
+        legend = ax.get_legend()
+        if legend is not None:
+            out += [t.get_text() for t in legend.get_texts()]
+    return out
+
+
+class RenderCache:
+    """Rendered-chart cache keyed by a hash of data, style and options."""
+
+    def __init__(self, root=None, max_bytes=256 * 1024**2, max_age=7 * 86400):
+        self.root = root or cache_dir('renders')
+        os.makedirs(self.root, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+    # ———————————————— KEYS ————————————————
+    @staticmethod
+    def key(*data, style=None, options=None):
+        """Hex digest identifying one rendering of the given inputs."""
+        import matplotlib
+        h = hashlib.sha256()
+        h.update(f"mpl={matplotlib.__version__}".encode())
+        for obj in data:
+            _feed(h, obj)
+        _feed(h, style or {})
+        _feed(h, options or {})
+        return h.hexdigest()
+
+    def path(self, key, fmt='png'):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format {fmt!r} (use one of {FORMATS})")
+        return os.path.join(self.root, key[:2], f"{key}.{fmt}")
+
+    # ———————————————— LOOKUP / STORE ————————————————
+    def get(self, key, fmt='png'):
+        """Path of the cached render, or None. A hit refreshes its LRU time."""
+        path = self.path(key, fmt)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            if self.max_age is not None and time.time() - st.st_mtime > self.max_age:
+                os.remove(path)
+                self.misses += 1
+                return None
+            os.utime(path)
+        except FileNotFoundError:       # evicted by another process meanwhile
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key, fig, fmt='png', **savefig_kw):
+        """Save fig under key (atomically) and evict if over budget."""
+        path = self.path(key, fmt)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{key}.{fmt}.", suffix='.tmp')
+        savefig_kw.setdefault('facecolor', fig.get_facecolor())
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                fig.savefig(f, format=fmt, **savefig_kw)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self.evict()
+        return path
+
+    def render(self, key, draw, fmt='png', close=True, **savefig_kw):
+        """Cached path for key; only on a miss is draw() called to build the figure."""
+        path = self.get(key, fmt)
+        if path is not None:
+            return path
+        fig = draw()
+        try:
+            return self.put(key, fig, fmt, **savefig_kw)
+        finally:
+            if close:
+                import matplotlib.pyplot as plt
+                plt.close(fig)
+
+    # ———————————————— EVICTION ————————————————
+    def _entries(self):
+        """(path, size, mtime) of every rendered chart in the shard directories."""
+        shards = (d for d in os.listdir(self.root) if len(d) == 2 and os.path.isdir(os.path.join(self.root, d)))
+        for shard in shards:
+            for name in os.listdir(os.path.join(self.root, shard)):
+                if not ENTRY.fullmatch(name) or name[:2] != shard:
+                    continue
+                path = os.path.join(self.root, shard, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, max_bytes=None, max_age=None):
+        """Drop stale files, then least-recently-used ones until under max_bytes."""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_age = self.max_age if max_age is None else max_age
+        now = time.time()
+        keep, removed = [], 0
+        for path, size, mtime in self._entries():
+            if max_age is not None and now - mtime > max_age:
+                removed += _remove(path)
+            else:
+                keep.append((mtime, size, path))
+        total = sum(size for _, size, _ in keep)
+        if max_bytes is not None and total > max_bytes:
+            for mtime, size, path in sorted(keep):
+                if total <= max_bytes:
+                    break
+                removed += _remove(path)
+                total -= size
+        return removed
+
+    def clear(self):
+        return self.evict(max_bytes=0)
@@ -0,0 +1,237 @@
+"""
+===============================================================================
+AUTOMATED REPORT | Multi-page PDF + self-contained HTML of every indicator
+===============================================================================
+
+WHAT IT DOES
+  1. Loads every distinct input series once from the SeriesStore (USREC too)
+     and computes the recession spans once.
+  2. Fans the per-indicator work (compute → summary record → 14x7 PNG) out to
+     a process pool.
+  3. Assembles report.pdf (summary table + one page per chart), report.html
+     (charts embedded as base64, no external files) and report.json (records).
+
+INCREMENTAL
+  Each indicator is keyed by a hash of its inputs + style + REPORT_VERSION +
+  the indicator code (indicators.code_version(); utils/render_cache.py). Unchanged indicators reuse their last PNG and record
+  without touching the pool, so a rerun after a single monthly release only
+  recomputes what that release feeds.
+===============================================================================
+"""
+
+import base64
+import html
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from utils.config import cache_dir
+from utils.indicators import INDICATORS, RECESSION_KEY, code_version, load_inputs
+from utils.render_cache import RenderCache
+
+REPORT_VERSION = 2   # bump when the chart layout changes (indicator code is hashed into the key)
+DPI = 110
+
+# Statuses worth calling out at the top of the report
+ALERT_STATUSES = {'TRIGGERED', 'Near Trigger', 'Inverted', 'Stress', 'Risk-off'}
+
+
+# ———————————————— WORKER ————————————————
+def _render_indicator(name, inputs, spans, png_path):
+    """Runs in a worker process: derived frame → record, chart → PNG on disk."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from utils.indicators import compute, summarize
+    from utils.panels import render_figure
+
+    derived = compute(name, inputs)
+    record = summarize(name, derived)
+    fig = render_figure(name, derived, spans)
+    tmp = f"{png_path}.{os.getpid()}.tmp"
+    fig.savefig(tmp, format='png', dpi=DPI, facecolor=fig.get_facecolor())
+    plt.close(fig)
+    os.replace(tmp, png_path)
+    return name, record
+
+
+# ———————————————— STATE ————————————————
+def _state_path(cache):
+    return os.path.join(cache.root, 'state.json')
+
+
+def _load_state(cache):
+    try:
+        with open(_state_path(cache)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_state(cache, state):
+    tmp = _state_path(cache) + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=1)
+    os.replace(tmp, _state_path(cache))
+
+
+# ———————————————— BUILD ————————————————
+def build_report(names=None, out_dir='reports', store=None, workers=None, force=False,
+                 extra_sections=None):
+    """Build report.pdf / report.html / report.json in out_dir; returns the records.
+
+    extra_sections: optional list of (heading, html_fragment, text_lines) added
+    after the summary table (used by the scanner / bootstrap summaries).
+    """
+    from utils.charts import DARK_STYLE, recession_spans
+    from utils.store import SeriesStore
+
+    names = list(names or INDICATORS)
+    store = store or SeriesStore()
+    cache = RenderCache(root=cache_dir('reports'), max_age=None)
+
+    # One pass over the shared data
+    inputs = load_inputs(store, names)
+    spans = recession_spans(inputs[RECESSION_KEY])
+
+    state = _load_state(cache)
+    records, pngs, todo = {}, {}, []
+    for name in names:
+        spec = INDICATORS[name]
+        own = {k: inputs[k] for k in spec['inputs']}
+        key = cache.key(*own.values(), inputs[RECESSION_KEY], style=DARK_STYLE,
+                        options={'indicator': name, 'start': spec['start'],
+                                 'dpi': DPI, 'version': REPORT_VERSION, 'code': code_version()})
+        pngs[name] = cache.path(key, 'png')
+        prev = state.get(name, {})
+        if not force and prev.get('key') == key and cache.get(key, 'png'):
+            records[name] = prev['record']
+        else:
+            os.makedirs(os.path.dirname(pngs[name]), exist_ok=True)
+            todo.append((name, key, own))
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_render_indicator, name, own, spans, pngs[name])
+                       for name, _, own in todo]
+            for (name, key, _), fut in zip(todo, futures):
+                _, records[name] = fut.result()
+                state[name] = {'key': key, 'record': records[name]}
+        _save_state(cache, state)
+        cache.evict()
+
+    ordered = [records[n] for n in names]
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, 'report.json'), 'w') as f:
+        json.dump({'generated': datetime.now().isoformat(timespec='seconds'),
+                   'records': ordered}, f, indent=1)
+    write_pdf(os.path.join(out_dir, 'report.pdf'), ordered, [pngs[n] for n in names],
+              extra_sections)
+    write_html(os.path.join(out_dir, 'report.html'), ordered, [pngs[n] for n in names],
+               extra_sections)
+    print(f"Report: {len(names)} indicators ({len(todo)} recomputed, "
+          f"{len(names) - len(todo)} unchanged) → {out_dir}/report.pdf, report.html")
+    return ordered
+
+
+# ———————————————— FORMATTING ————————————————
+def _fmt(value, unit=''):
+    if value is None:
+        return '—'
+    if isinstance(value, float):
+        return f"{value:,.2f}{(' ' + unit) if unit else ''}"
+    return str(value)
+
+
+def _summary_rows(records):
+    return [[r['title'], _fmt(r['latest'], r['unit']), r['latest_date'] or '—',
+             _fmt(r['peak'], r['unit']), r['peak_date'] or '—', r['status'] or '—']
+            for r in records]
+
+
+SUMMARY_HEADER = ['Indicator', 'Latest', 'As of', 'Peak', 'Peak date', 'Status']
+
+
+def write_pdf(path, records, png_paths, extra_sections=None):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.image as mimage
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+    from utils.charts import apply_dark_style
+
+    apply_dark_style()
+    with PdfPages(path) as pdf:
+        fig, ax = plt.subplots(figsize=(14, 7))
+        ax.axis('off')
+        ax.set_title(f"Macro Indicators Report — {datetime.now():%b %d, %Y}",
+                     color='white', fontsize=16, pad=20, fontweight='bold')
+        table = ax.table(cellText=_summary_rows(records), colLabels=SUMMARY_HEADER,
+                         loc='upper center', cellLoc='left')
+        table.auto_set_font_size(False)
+        table.set_fontsize(10)
+        table.scale(1, 1.6)
+        for (row, _), cell in table.get_celld().items():
+            cell.set_edgecolor('#333333')
+            cell.set_facecolor('#1a1a1a' if row == 0 else '#0a0a0a')
+            cell.get_text().set_color('white')
+            if row > 0 and records[row - 1]['status'] in ALERT_STATUSES:
+                cell.get_text().set_color('#ff6b6b')
+        lines = []
+        for heading, _, text_lines in extra_sections or []:
+            lines += ['', heading] + list(text_lines)
+        if lines:
+            ax.text(0.0, 0.35, '\n'.join(lines), transform=ax.transAxes, va='top',
+                    family='monospace', fontsize=9, color='white')
+        pdf.savefig(fig, facecolor=fig.get_facecolor())
+        plt.close(fig)
+
+        for png in png_paths:
+            img = mimage.imread(png)
+            h, w = img.shape[:2]
+            fig = plt.figure(figsize=(w / DPI, h / DPI), dpi=DPI)
+            fig.figimage(img, 0, 0)
+            pdf.savefig(fig, dpi=DPI)
+            plt.close(fig)
+
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ background:#0a0a0a; color:#fff; font-family:-apple-system,Helvetica,Arial,sans-serif; margin:2em; }}
+table {{ border-collapse:collapse; margin-bottom:2em; }}
+th, td {{ border:1px solid #333; padding:6px 12px; text-align:left; }}
+th {{ background:#1a1a1a; }}
+tr.alert td {{ color:#ff6b6b; font-weight:bold; }}
+img {{ max-width:100%; margin:1em 0 2em 0; }}
+h2 {{ border-bottom:1px solid #333; padding-bottom:4px; }}
+</style></head><body>
+<h1>{title}</h1>
+<table><tr>{header}</tr>
+{rows}
+</table>
+{sections}
+{charts}
+</body></html>
+"""
+
+
+def write_html(path, records, png_paths, extra_sections=None):
+    title = f"Macro Indicators Report — {datetime.now():%b %d, %Y}"
+    header = ''.join(f"<th>{h}</th>" for h in SUMMARY_HEADER)
+    rows = []
+    for rec, cells in zip(records, _summary_rows(records)):
+        cls = ' class="alert"' if rec['status'] in ALERT_STATUSES else ''
+        rows.append(f"<tr{cls}>" + ''.join(f"<td>{html.escape(str(c))}</td>" for c in cells) + "</tr>")
+    sections = ''.join(f"<h2>{html.escape(h)}</h2>\n{frag}\n" for h, frag, _ in extra_sections or [])
+    charts = []
+    for rec, png in zip(records, png_paths):
+        with open(png, 'rb') as f:
+            data = base64.b64encode(f.read()).decode('ascii')
+        charts.append(f"<h2>{html.escape(rec['title'])}</h2>\n"
+                      f"<img alt=\"{html.escape(rec['title'])}\" src=\"data:image/png;base64,{data}\">")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(HTML_TEMPLATE.format(title=html.escape(title), header=header,
+                                     rows='\n'.join(rows), sections=sections,
+                                     charts='\n'.join(charts)))
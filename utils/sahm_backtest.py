@@ -0,0 +1,165 @@
+"""
+===============================================================================
+SAHM RULE BACKTEST | How do the window / lookback / threshold choices perform?
+===============================================================================
+
+WHAT IT DOES
+  Unemployment.py uses a 3-month average, a 12-month lookback and a 0.5 pp
+  trigger (0.35 pp "near"). This evaluates a whole grid of those choices
+  against NBER recession starts (USREC 0 → 1):
+    rise[w, L, t] = MA_w[t] − min(MA_w[t−L … t−1])        one array per grid
+    signal        = rise ≥ threshold                     broadcast over thresholds (rise
+                                                         rounded as in indicators.sahm_triggered)
+    event         = first month of each signal run
+
+SCORING (per combination)
+  hit         an event from PRE months before a recession start to POST after
+  lead        start − first event in that window (months; > 0 = early warning)
+  false pos.  events outside every [start − PRE, recession end + POST]
+
+  The "near trigger" band is just a lower threshold in the grid.
+  Large grids are split by window length across a process pool.
+===============================================================================
+"""
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.indicators import SAHM_TRIGGER, sahm_triggered
+
+WINDOWS = tuple(range(1, 7))
+LOOKBACKS = tuple(range(6, 25, 2))
+THRESHOLDS = tuple(np.round(np.arange(0.20, 0.801, 0.05), 2))
+PRE, POST = 12, 6            # months around a recession start that count as a hit
+BASELINE = (3, 12, SAHM_TRIGGER)   # Unemployment.py
+PARALLEL_MIN = 20_000        # combinations before a process pool pays off
+
+
+def parse_grid(spec, cast=float):
+    """'1-6' → 1..6, '0.2:0.8:0.05' → arange (inclusive), '3,6,9' → list."""
+    if spec is None:
+        return None
+    if ':' in spec:
+        lo, hi, step = (float(x) for x in spec.split(':'))
+        return tuple(cast(v) for v in np.round(np.arange(lo, hi + step / 2, step), 6))
+    if '-' in spec and ',' not in spec:
+        lo, hi = (int(x) for x in spec.split('-'))
+        return tuple(cast(v) for v in range(lo, hi + 1))
+    return tuple(cast(v) for v in spec.split(','))
+
+
+def recessions(usrec):
+    """(start index, end index) of each USREC run, on the unemployment calendar."""
+    on = np.concatenate(([0], (np.asarray(usrec) == 1).astype(np.int8), [0]))
+    edges = np.diff(on)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+
+def rises(unrate, windows, lookbacks):
+    """(W, L, T) Sahm rise for every window / lookback pair."""
+    u = np.asarray(unrate, dtype=float)
+    T = len(u)
+    out = np.full((len(windows), len(lookbacks), T), np.nan)
+    c = np.concatenate(([0.0], np.cumsum(u)))
+    for i, w in enumerate(windows):
+        ma = np.full(T, np.nan)
+        ma[w - 1:] = (c[w:] - c[:-w]) / w
+        for j, L in enumerate(lookbacks):
+            if T <= L:
+                continue
+            low = np.lib.stride_tricks.sliding_window_view(ma, L).min(axis=-1)   # low[k] = min(ma[k:k+L])
+            out[i, j, L:] = ma[L:] - low[:T - L]                                  # prior L months, shift 1
+    return out
+
+
+def score(events, starts, ends, pre=PRE, post=POST):
+    """events: (C, T) bool → hits, false positives, leads (C, R; NaN where missed)."""
+    C, T = events.shape
+    hit = np.zeros((C, len(starts)), dtype=bool)
+    leads = np.full((C, len(starts)), np.nan)
+    ok = np.zeros(T, dtype=bool)
+    for k, (s, e) in enumerate(zip(starts, ends)):     # a dozen recessions; each a column slice
+        lo = max(s - pre, 0)
+        window = events[:, lo:s + post + 1]
+        hit[:, k] = window.any(axis=1)
+        leads[hit[:, k], k] = s - (lo + window[hit[:, k]].argmax(axis=1))
+        ok[lo:e + post + 1] = True
+    false_pos = events[:, ~ok].sum(axis=1)
+    return hit, false_pos, leads
+
+
+def _evaluate(unrate, usrec, windows, lookbacks, thresholds, pre, post):
+    rise = rises(unrate, windows, lookbacks)                                         # (W, L, T)
+    thr = np.asarray(thresholds, dtype=float)
+    with np.errstate(invalid='ignore'):
+        sig = sahm_triggered(rise[:, :, None, :], thr[None, None, :, None])           # (W, L, H, T)
+    events = sig & ~np.concatenate([np.zeros_like(sig[..., :1]), sig[..., :-1]], axis=-1)
+    W, L, H, T = events.shape
+    starts, ends = recessions(usrec)
+    hit, false_pos, leads = score(events.reshape(-1, T), starts, ends, pre, post)
+    grid = np.array(np.meshgrid(windows, lookbacks, thresholds, indexing='ij')).reshape(3, -1)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)      # all-NaN rows: no hits at all
+        mean_lead = np.nanmean(leads, axis=1) if leads.size else np.full(len(hit), np.nan)
+        median_lead = np.nanmedian(leads, axis=1) if leads.size else np.full(len(hit), np.nan)
+        worst_lead = np.nanmin(leads, axis=1) if leads.size else np.full(len(hit), np.nan)
+    return pd.DataFrame({
+        'window': grid[0].astype(int), 'lookback': grid[1].astype(int), 'threshold': grid[2],
+        'hits': hit.sum(axis=1), 'recessions': len(starts),
+        'hit_rate': hit.mean(axis=1) if len(starts) else np.nan,
+        'false_pos': false_pos, 'mean_lead': mean_lead, 'median_lead': median_lead,
+        'worst_lead': worst_lead,
+    })
+
+
+def backtest(unrate, usrec, windows=WINDOWS, lookbacks=LOOKBACKS, thresholds=THRESHOLDS,
+             pre=PRE, post=POST, workers=None):
+    """One row per (window, lookback, threshold), best first.
+
+    unrate / usrec: monthly Series (USREC is aligned to the unemployment dates).
+    """
+    u = (unrate.iloc[:, 0] if isinstance(unrate, pd.DataFrame) else unrate).dropna()
+    r = (usrec.iloc[:, 0] if isinstance(usrec, pd.DataFrame) else usrec)
+    r = r.reindex(u.index, method='ffill').fillna(0).to_numpy()
+    u = u.to_numpy(dtype=float)
+    windows, lookbacks, thresholds = tuple(windows), tuple(lookbacks), tuple(thresholds)
+
+    size = len(windows) * len(lookbacks) * len(thresholds)
+    if workers == 1 or (workers is None and size < PARALLEL_MIN) or len(windows) == 1:
+        result = _evaluate(u, r, windows, lookbacks, thresholds, pre, post)
+    else:
+        chunks = [windows[i::workers or 4] for i in range(min(workers or 4, len(windows)))]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            parts = pool.map(_evaluate, *zip(*[(u, r, c, lookbacks, thresholds, pre, post) for c in chunks]))
+            result = pd.concat(list(parts), ignore_index=True)
+    return result.sort_values(['hit_rate', 'false_pos', 'mean_lead'],
+                              ascending=[False, True, False]).reset_index(drop=True)
+
+
+def baseline(result, params=BASELINE):
+    w, L, h = params
+    row = result[(result['window'] == w) & (result['lookback'] == L) & np.isclose(result['threshold'], h)]
+    return row.iloc[0] if len(row) else None
+
+
+def format_results(result, top=20, pre=PRE, post=POST):
+    lines = [f"=== SAHM RULE BACKTEST ({len(result):,} combinations) ===",
+             f"{'Window':>6} {'Lookback':>8} {'Thresh':>7} {'Hits':>7} {'FalsePos':>8} "
+             f"{'MeanLead':>9} {'Worst':>6}"]
+
+    def fmt(r, tag=''):
+        lead = f"{r['mean_lead']:>+8.1f}m" if np.isfinite(r['mean_lead']) else f"{'—':>9}"
+        worst = f"{r['worst_lead']:>+5.0f}m" if np.isfinite(r['worst_lead']) else f"{'—':>6}"
+        return (f"{int(r['window']):>6} {int(r['lookback']):>8} {r['threshold']:>7.2f} "
+                f"{int(r['hits']):>3}/{int(r['recessions']):<3} {int(r['false_pos']):>8} {lead} {worst}{tag}")
+
+    lines += [fmt(r) for _, r in result.head(top).iterrows()]
+    base = baseline(result)
+    if base is not None:
+        rank = int(base.name) + 1
+        lines += ['', fmt(base, f"  ← Unemployment.py (rank {rank:,})")]
+    lines.append(f"(lead > 0: signal before the NBER start; hit window {pre}m before to {post}m after)")
+    return lines
@@ -0,0 +1,104 @@
+"""
+===============================================================================
+SPLICED SERIES | One rate built from successive benchmarks (OBFR→SOFR, IOER→IORB)
+===============================================================================
+
+WHAT IT DOES
+  A SplicedSeries is an ordered list of segments (label, series id, cut-over
+  date). On any date exactly one segment is active: the last one whose
+  cut-over is on or before that date. Before the first cut-over (when it
+  isn't None) no segment is active and the value / label is NaN. Values and regime labels are resolved
+  with a single np.searchsorted over the cut-overs — no row-wise max (which
+  picks the wrong series whenever two overlapping rates aren't ordered by
+  value) and no per-row strings (labels are a pandas Categorical).
+
+PREDEFINED
+  REPO  = OBFR (2016–) → SOFR from 2018-04-03
+  FLOOR = IOER (2008–) → IORB from 2021-07-29
+
+  Any other transition is just another list of segments, e.g. LIBOR → SOFR:
+    SplicedSeries('USD Benchmark', [('LIBOR 3M', 'USD3MTD156N', None),
+                                    ('SOFR',     'SOFR',        '2023-07-03')])
+===============================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class SplicedSeries:
+    """Ordered (label, key, cut-over) segments resolved by vectorized lookup."""
+
+    def __init__(self, name, segments):
+        if not segments:
+            raise ValueError("a SplicedSeries needs at least one segment")
+        self.name = name
+        self.labels = [label for label, _, _ in segments]
+        self.keys = [key for _, key, _ in segments]
+        cuts = [pd.Timestamp(c) if c is not None else pd.Timestamp.min for _, _, c in segments]
+        if any(b <= a for a, b in zip(cuts, cuts[1:])):
+            raise ValueError(f"{name}: segment cut-over dates must be strictly increasing")
+        self.cutovers = cuts
+        self._cuts = np.array([c.value for c in cuts], dtype='i8')
+
+    def __repr__(self):
+        parts = [f"{l} ({c.date()})" if c != pd.Timestamp.min else l
+                 for l, c in zip(self.labels, self.cutovers)]
+        return f"SplicedSeries({self.name!r}: {' → '.join(parts)})"
+
+    def transitions(self):
+        """(date, label) for every cut-over after the first segment."""
+        return list(zip(self.cutovers[1:], self.labels[1:]))
+
+    def segment_codes(self, index):
+        """Active segment number for each date in index (-1 before the first cut-over)."""
+        t = pd.DatetimeIndex(index).as_unit('ns').asi8
+        return np.searchsorted(self._cuts, t, side='right') - 1
+
+    def regime(self, index):
+        """Active segment label per date, as a Categorical (one byte per row; NaN
+        before the first cut-over, which from_codes reads from code -1)."""
+        codes = self.segment_codes(index)
+        return pd.Categorical.from_codes(codes, categories=self.labels)
+
+    def label_at(self, date):
+        code = int(self.segment_codes([pd.Timestamp(date)])[0])
+        return self.labels[code] if code >= 0 else None
+
+    def resolve(self, frames, index=None):
+        """Spliced values: on each date, the value of that date's active segment.
+
+        frames: {key: Series/DataFrame} for every segment key. Dates where the
+        active segment has no observation stay NaN (no silent fallback).
+        """
+        cols = []
+        for key in self.keys:
+            f = frames[key]
+            cols.append((f.iloc[:, 0] if isinstance(f, pd.DataFrame) else f).rename(key))
+        panel = pd.concat(cols, axis=1)
+        panel = panel[~panel.index.duplicated(keep='last')].sort_index()
+        if index is not None:
+            panel = panel.reindex(index)
+        codes = self.segment_codes(panel.index)
+        values = panel.to_numpy(dtype=float)[np.arange(len(panel)), np.maximum(codes, 0)]
+        values[codes < 0] = np.nan                     # before the first cut-over
+        return pd.Series(values, index=panel.index, name=self.name)
+
+
+def combined_regime(index, *spliced, sep=' – '):
+    """Categorical of joined labels, e.g. 'SOFR – IORB', for several spliced series."""
+    codes = np.zeros(len(index), dtype='i8')
+    missing = np.zeros(len(index), dtype=bool)
+    labels = ['']
+    for s in spliced:
+        c = s.segment_codes(index)
+        missing |= c < 0
+        codes = codes * len(s.labels) + np.maximum(c, 0)
+        labels = [f"{a}{sep}{b}" if a else b for a in labels for b in s.labels]
+    codes[missing] = -1                                # NaN where any series has no active segment
+    cat = pd.Categorical.from_codes(codes, categories=labels)
+    return cat.remove_unused_categories()
+
+
+REPO  = SplicedSeries('Repo',  [('OBFR', 'OBFR', None), ('SOFR', 'SOFR', '2018-04-03')])
+FLOOR = SplicedSeries('Floor', [('IOER', 'IOER', None), ('IORB', 'IORB', '2021-07-29')])
@@ -0,0 +1,195 @@
+"""
+===============================================================================
+SERIES STORE | Local cache of every raw input series (FRED + Yahoo Finance)
+===============================================================================
+
+WHAT IT DOES
+  One pickle per series under CACHE_ROOT/series, plus a small JSON sidecar
+  (first requested date, last fetch time). The first request downloads the full
+  history in resumable, parallel chunks (utils/download.py); later requests only
+  fetch from the last cached date forward.
+
+  Series with an entry in the release calendar (utils/releases.py) are only
+  refreshed once their next observation is due; everything else falls back
+  to max_age. Late releases back off instead of being re-polled every run.
+
+  Every download passes the data-quality gate (utils/validate.py) before it
+  is cached: duplicate dates and out-of-range values are quarantined to
+  <key>.quarantine.pkl, gaps / NaN runs / jumps are flagged, and the report
+  lands in the meta under 'validation' (and in store.reports).
+
+KEYS
+  FRED series use their FRED id ('T10Y2Y', 'USREC', ...)
+  Yahoo tickers are prefixed: 'yahoo:GLD', 'yahoo:^GSPC' (Adj Close)
+
+USAGE
+  store = SeriesStore()
+  t10y2y = store.get('T10Y2Y', start='1980-01-01')     → DataFrame['T10Y2Y']
+  prices = store.get_many(['yahoo:GLD', 'yahoo:TLT'])  → dict of DataFrames
+===============================================================================
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from utils.config import cache_dir
+
+YAHOO_PREFIX = 'yahoo:'
+DEFAULT_START = datetime(1950, 1, 1)
+DEFAULT_MAX_AGE = 6 * 3600   # seconds before a cached series is refreshed
+REFETCH_OVERLAP = timedelta(days=14)  # re-read recent points (FRED revises)
+
+
+def is_yahoo(key):
+    return key.startswith(YAHOO_PREFIX)
+
+
+def column_name(key):
+    """Column a series is stored under: the FRED id or the bare ticker."""
+    return key[len(YAHOO_PREFIX):] if is_yahoo(key) else key
+
+
+# ———————————————— DOWNLOADERS ————————————————
+def fetch_fred(series_id, start, end):
+    from utils.providers import web
+    return web.DataReader(series_id, 'fred', start, end)
+
+
+def fetch_yahoo(ticker, start, end):
+    from utils.providers import yf
+    df = yf.download(tickers=ticker, start=start, end=end, auto_adjust=False,
+                     progress=False, timeout=60)
+    if df.empty:
+        return pd.DataFrame(columns=[ticker], dtype=float)
+    close = df['Adj Close']
+    if isinstance(close, pd.DataFrame):
+        close = close.iloc[:, 0]
+    return close.rename(ticker).to_frame()
+
+
+def fetch(key, start, end):
+    if is_yahoo(key):
+        return fetch_yahoo(column_name(key), start, end)
+    return fetch_fred(key, start, end)
+
+
+# ———————————————— STORE ————————————————
+class SeriesStore:
+    """Pickled, incrementally refreshed copies of raw input series."""
+
+    def __init__(self, root=None, max_age=DEFAULT_MAX_AGE, offline=False):
+        self.root = root or cache_dir('series')
+        os.makedirs(self.root, exist_ok=True)
+        self.max_age = max_age
+        self.offline = offline   # never touch the network; serve what's cached
+        self.fetches = 0
+        self.reports = {}        # key → validation report of this session's downloads
+
+    def _path(self, key, ext):
+        safe = key.replace(':', '_').replace('/', '_')
+        return os.path.join(self.root, f"{safe}.{ext}")
+
+    def meta(self, key):
+        try:
+            with open(self._path(key, 'json')) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write_meta(self, key, meta):
+        tmp = self._path(key, f'json.{os.getpid()}.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp, self._path(key, 'json'))
+
+    def load(self, key):
+        """Cached frame or None — never fetches."""
+        try:
+            return pd.read_pickle(self._path(key, 'pkl'))
+        except FileNotFoundError:
+            return None
+
+    def save(self, key, df, **meta):
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+        tmp = self._path(key, f'pkl.{os.getpid()}.tmp')
+        df.to_pickle(tmp)
+        os.replace(tmp, self._path(key, 'pkl'))
+        merged = {**self.meta(key), **meta}
+        merged.setdefault('fetched', time.time())
+        self._write_meta(key, merged)
+        return df
+
+    def _ingest(self, key, df, cached=None):
+        """Validation gate: (clean rows, report); rejected rows go to quarantine."""
+        from utils.validate import split
+        clean, rejected, report = split(key, df, previous=cached)
+        if len(rejected):
+            path = self._path(key, 'quarantine.pkl')
+            if os.path.exists(path):
+                rejected = pd.concat([pd.read_pickle(path), rejected])
+            tmp = self._path(key, f'quarantine.pkl.{os.getpid()}.tmp')
+            rejected.to_pickle(tmp)
+            os.replace(tmp, path)
+        self.reports[key] = report
+        return clean, report
+
+    def keys(self):
+        return sorted(name[:-4].replace('yahoo_', YAHOO_PREFIX, 1)
+                      for name in os.listdir(self.root)
+                      if name.endswith('.pkl') and not name.endswith('.quarantine.pkl'))
+
+    def is_stale(self, key, cached=None):
+        from utils.releases import is_due
+        meta = self.meta(key)
+        if cached is None:
+            cached = self.load(key)
+        last = cached.index[-1] if cached is not None and len(cached) else None
+        due = is_due(key, last, meta)
+        if due is not None:
+            return due
+        return time.time() - meta.get('fetched', 0) > self.max_age
+
+    def refresh(self, key, start=None, end=None, force=False):
+        """Bring the cached copy up to date, fetching as little as possible."""
+        start = pd.Timestamp(start or DEFAULT_START)
+        end = pd.Timestamp(end or datetime.now())
+        cached = self.load(key)
+        meta = self.meta(key)
+        have_from = pd.Timestamp(meta['start']) if 'start' in meta else None
+
+        if self.offline:
+            if cached is None:
+                raise LookupError(f"{key} is not cached and the store is offline")
+            return cached
+
+        if cached is None or cached.empty or have_from is None or start < have_from:
+            # Nothing usable (or history requested further back): full download
+            from utils.download import download
+            df, report = self._ingest(key, download(key, start, end, fetch))
+            self.fetches += 1
+            if cached is not None and not cached.empty:
+                df = pd.concat([df, cached[cached.index > df.index.max()]]) if not df.empty else cached
+            return self.save(key, df, start=str(start.date()), fetched=time.time(), validation=report)
+
+        if not force and not self.is_stale(key, cached):
+            return cached
+
+        from utils.releases import record_fetch
+        tail, report = self._ingest(key, fetch(key, max(cached.index[-1] - REFETCH_OVERLAP, start), end), cached)
+        self.fetches += 1
+        df = pd.concat([cached, tail]) if not tail.empty else cached
+        got_new = not tail.empty and tail.index.max() > cached.index[-1]
+        self._write_meta(key, {**record_fetch(meta, got_new), 'fetched': time.time(), 'validation': report})
+        return self.save(key, df)
+
+    def get(self, key, start=None, end=None, force=False):
+        """Series as a one-column DataFrame, sliced to [start, end]."""
+        df = self.refresh(key, start, end, force=force)
+        return df.loc[pd.Timestamp(start or DEFAULT_START):pd.Timestamp(end or datetime.now())]
+
+    def get_many(self, keys, start=None, end=None, force=False):
+        return {key: self.get(key, start, end, force=force) for key in keys}
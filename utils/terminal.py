@@ -0,0 +1,133 @@
+"""
+===============================================================================
+TERMINAL DASHBOARD | Every indicator's latest reading as a live text table
+===============================================================================
+
+WHAT IT SHOWS
+  One row per indicator: latest value, change since the previous observation,
+  status (Sahm, inversion, repo stress, risk-on/off), as-of date and a Unicode
+  sparkline of the last SPARK_DAYS. Alert statuses are red, the rest green.
+
+WHY TEXT
+  Nothing here (or in utils/store.py / utils/indicators.py) imports
+  matplotlib, so it starts in a fraction of a second and runs over SSH on
+  headless hosts. On a TTY the table is redrawn in place every --interval s;
+  piped output prints the table once.
+
+DATA
+  Served from the SeriesStore. Series are only re-downloaded when the release
+  calendar says a new observation is due; --offline never touches the network.
+  A series that can't be loaded (timeout, not cached offline) only turns the
+  rows that need it into "n/a: <error>"; if nothing loads, the last good
+  table stays up and the loop keeps going.
+===============================================================================
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from utils.indicators import INDICATORS, compute, input_starts, summarize
+from utils.report import ALERT_STATUSES
+
+BLOCKS = '▁▂▃▄▅▆▇█'
+SPARK_WIDTH = 30
+SPARK_DAYS = 365
+RED, GREEN, DIM, BOLD, RESET = '\x1b[31m', '\x1b[32m', '\x1b[2m', '\x1b[1m', '\x1b[0m'
+CLEAR = '\x1b[H\x1b[2J'
+
+
+def sparkline(values, width=SPARK_WIDTH):
+    """Bucket-mean the values into `width` cells and map each to a block character."""
+    v = np.asarray(values, dtype=float)
+    v = v[np.isfinite(v)]
+    if v.size == 0:
+        return ''
+    if v.size > width:
+        edges = np.linspace(0, v.size, width + 1).astype(int)
+        v = np.add.reduceat(v, edges[:-1]) / np.diff(edges)
+    lo, hi = v.min(), v.max()
+    if hi == lo:
+        return BLOCKS[len(BLOCKS) // 2] * v.size
+    idx = ((v - lo) / (hi - lo) * (len(BLOCKS) - 1)).round().astype(int)
+    return ''.join(BLOCKS[i] for i in idx)
+
+
+def load_each(store):
+    """(inputs, errors): every input that loaded, and key → error for the ones that didn't."""
+    inputs, errors = {}, {}
+    for key, start in sorted(input_starts().items()):
+        try:
+            inputs[key] = store.get(key, start=start)
+        except Exception as e:
+            errors[key] = f"{type(e).__name__}: {e}"
+    return inputs, errors
+
+
+def rows(inputs, errors=None):
+    """One dict per indicator: summary record + change + sparkline, or its error."""
+    out = []
+    for name, spec in INDICATORS.items():
+        failed = [f"{k}: {errors[k]}" for k in spec['inputs'] if k in (errors or {})]
+        try:
+            if failed:
+                raise LookupError('; '.join(failed))
+            derived = compute(name, inputs)
+            rec = summarize(name, derived)
+        except Exception as e:
+            out.append({'indicator': name, 'error': str(e)})
+            continue
+        s = derived[spec['derived'] or rec['column']].dropna()
+        change = s.iloc[-1] - s.iloc[-2] if len(s) > 1 else np.nan
+        recent = s.loc[s.index[-1] - pd.Timedelta(days=SPARK_DAYS):] if len(s) else s
+        out.append({**rec, 'shown': s.name, 'value': s.iloc[-1] if len(s) else np.nan,
+                    'change': change, 'spark': sparkline(recent.to_numpy())})
+    return out
+
+
+def render(table, color=True, updated=None, note=None):
+    c = (lambda code: code) if color else (lambda code: '')
+    lines = [f"{c(BOLD)}MACRO DASHBOARD{c(RESET)}  {c(DIM)}updated {updated or datetime.now():%Y-%m-%d %H:%M:%S}{c(RESET)}",
+             f"{'Indicator':<32} {'Series':<12} {'Latest':>10} {'Change':>9}  {'Status':<15} {'As of':<10}  1y",
+             '─' * (98 + SPARK_WIDTH)]
+    if note:
+        lines.insert(1, f"{c(RED)}{note}{c(RESET)}")
+    for r in table:
+        title = INDICATORS[r['indicator']]['title'][:32]
+        if 'error' in r:
+            lines.append(f"{title:<32} {c(RED)}{('n/a: ' + r['error'])[:66 + SPARK_WIDTH]}{c(RESET)}")
+            continue
+        status = r['status'] or ''
+        tint = RED if status in ALERT_STATUSES else GREEN
+        status_cell = f"{c(tint)}{status:<15}{c(RESET)}" if status else ' ' * 15
+        change = f"{r['change']:+9.3f}" if np.isfinite(r['change']) else f"{'—':>9}"
+        lines.append(f"{title:<32} {r['shown'][:12]:<12} "
+                     f"{r['value']:>10.3f} {change}  {status_cell} {r['latest_date'] or '—':<10}  {r['spark']}")
+    return '\n'.join(lines)
+
+
+def run(store=None, interval=60, once=False, offline=False, out=sys.stdout):
+    from utils.store import SeriesStore
+    store = store or SeriesStore(offline=offline)
+    live = out.isatty() and not once
+    color = out.isatty() and os.environ.get('NO_COLOR') is None
+    good, updated = None, None
+    try:
+        while True:
+            table, note = rows(*load_each(store)), None
+            if all('error' in r for r in table) and good is not None:
+                note = f"refresh failed at {datetime.now():%H:%M:%S} ({table[0]['error'][:80]}); showing the last good table"
+                table = good
+            else:
+                good, updated = table, datetime.now()
+            out.write((CLEAR if live else '') + render(table, color, updated, note) + '\n')
+            out.flush()
+            if not live:
+                return table
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        out.write('\n')
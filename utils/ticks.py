@@ -0,0 +1,218 @@
+"""
+===============================================================================
+LIVE TICKS | Ring buffers, streaming OHLC bars & live ratios
+===============================================================================
+
+WHAT IT DOES
+  Keeps intraday state for live quotes in constant memory:
+    • RingBuffer   – fixed-capacity NumPy buffer per symbol (ticks or bars)
+    • BarAggregator – streaming 1m / 5m / 1h OHLC bars, updated on every tick
+    • LiveMarket   – ticks + bars + live ratios (GLD/TLT, SPX/GLD) in one place
+
+WHY IT'S BUILT THIS WAY
+  Every buffer is allocated once, so a daemon can run for weeks without growth.
+  Each row is written twice (slot i and i + capacity), which means the latest
+  N rows are always one contiguous slice — latest() returns a view, never a copy.
+
+USAGE
+  market = LiveMarket()
+  market.on_tick('GLD', ts, 243.10)
+  market.on_tick('TLT', ts, 91.85)
+  market.bars('GLD/TLT', '5m', 12)   → last 12 five-minute ratio bars (view)
+===============================================================================
+"""
+
+import numpy as np
+
+TICK_DTYPE = np.dtype([('t', 'i8'), ('price', 'f8'), ('size', 'f8')])
+BAR_DTYPE  = np.dtype([('t', 'i8'), ('open', 'f8'), ('high', 'f8'),
+                       ('low', 'f8'), ('close', 'f8'), ('volume', 'f8'),
+                       ('ticks', 'i8')])
+
+NS_PER_SEC = 1_000_000_000
+
+TIMEFRAMES = {'1m': 60, '5m': 300, '1h': 3600}
+
+RATIOS = {
+    'GLD/TLT': ('GLD', 'TLT'),     # same pair as GLD_over_TLT.py
+    'SPX/GLD': ('^GSPC', 'GLD'),   # same pair as SPinGold.py
+}
+
+
+def to_ns(ts):
+    """Epoch nanoseconds from epoch seconds (int/float) or anything datetime-like."""
+    value = getattr(ts, 'value', None)  # pandas Timestamp, tz-aware or naive
+    if isinstance(value, int):
+        return value
+    if isinstance(ts, (int, np.integer)) and abs(ts) > 10**14:
+        return int(ts)  # already nanoseconds
+    if isinstance(ts, (int, float, np.integer, np.floating)):
+        return int(round(float(ts) * NS_PER_SEC))
+    return int(np.datetime64(ts, 'ns').astype('i8'))
+
+
+# ———————————————— RING BUFFER ————————————————
+class RingBuffer:
+    """Fixed-capacity buffer of structured rows; latest(n) is a zero-copy view."""
+
+    def __init__(self, capacity, dtype=TICK_DTYPE):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._buf = np.zeros(2 * self.capacity, dtype=self.dtype)
+        self._head = 0    # slot the next append goes to, in [0, capacity)
+        self._count = 0
+        self.total = 0    # rows ever appended (for stats / sequence numbers)
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def nbytes(self):
+        return self._buf.nbytes
+
+    def append(self, row):
+        h = self._head
+        self._buf[h] = row
+        self._buf[h + self.capacity] = row
+        self._head = h + 1 if h + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+        self.total += 1
+
+    def _last_slot(self):
+        return (self._head - 1) % self.capacity
+
+    def last(self):
+        """Newest row as a 0-d view (read-only use), or None when empty."""
+        if not self._count:
+            return None
+        return self._buf[self._last_slot() + self.capacity]
+
+    def replace_last(self, row):
+        """Overwrite the newest row in place (both copies)."""
+        if not self._count:
+            raise IndexError("replace_last() on an empty RingBuffer")
+        i = self._last_slot()
+        self._buf[i] = row
+        self._buf[i + self.capacity] = row
+
+    def latest(self, n=None):
+        """The newest n rows (oldest first) as a contiguous, read-only view."""
+        n = self._count if n is None else max(0, min(int(n), self._count))
+        end = self._head + self.capacity
+        view = self._buf[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+
+# ———————————————— OHLC BARS ————————————————
+class BarAggregator:
+    """Streaming OHLC bars per symbol and timeframe.
+
+    The bar currently forming is the newest row of each buffer and is updated
+    in place on every tick, so bars(...) always includes it.
+    """
+
+    def __init__(self, timeframes=TIMEFRAMES, capacity=2000):
+        self.timeframes = {k: int(v) * NS_PER_SEC for k, v in dict(timeframes).items()}
+        self.capacity = capacity
+        self._bars = {}   # (symbol, timeframe) -> RingBuffer
+        self._open = {}   # (symbol, timeframe) -> forming bar as a plain list
+
+    def _buffer(self, symbol, tf):
+        key = (symbol, tf)
+        buf = self._bars.get(key)
+        if buf is None:
+            buf = self._bars[key] = RingBuffer(self.capacity, BAR_DTYPE)
+        return buf
+
+    def update(self, symbol, t_ns, price, size=0.0):
+        for tf, width in self.timeframes.items():
+            key = (symbol, tf)
+            bucket = t_ns - (t_ns % width)
+            bar = self._open.get(key)
+            if bar is not None and bar[0] == bucket:
+                if price > bar[2]:
+                    bar[2] = price
+                if price < bar[3]:
+                    bar[3] = price
+                bar[4] = price
+                bar[5] += size
+                bar[6] += 1
+                self._bars[key].replace_last(tuple(bar))
+            elif bar is not None and bucket < bar[0]:
+                continue  # late tick for an already-closed bar; ignore
+            else:
+                bar = self._open[key] = [bucket, price, price, price, price, size, 1]
+                self._buffer(symbol, tf).append(tuple(bar))
+
+    def bars(self, symbol, tf, n=None):
+        buf = self._bars.get((symbol, tf))
+        if buf is None:
+            return np.zeros(0, dtype=BAR_DTYPE)
+        return buf.latest(n)
+
+    def symbols(self):
+        return sorted({s for s, _ in self._bars})
+
+
+# ———————————————— LIVE MARKET ————————————————
+class LiveMarket:
+    """Tick buffers, OHLC bars and live ratios for a set of symbols."""
+
+    def __init__(self, tick_capacity=50_000, bar_capacity=2000,
+                 timeframes=TIMEFRAMES, ratios=RATIOS):
+        self.tick_capacity = tick_capacity
+        self.ratios = dict(ratios)
+        self.aggregator = BarAggregator(timeframes, bar_capacity)
+        self._ticks = {}
+        self._last_price = {}
+        self._ratios_by_leg = {}
+        for name, (num, den) in self.ratios.items():
+            self._ratios_by_leg.setdefault(num, []).append(name)
+            self._ratios_by_leg.setdefault(den, []).append(name)
+
+    def _record(self, symbol, t_ns, price, size):
+        buf = self._ticks.get(symbol)
+        if buf is None:
+            buf = self._ticks[symbol] = RingBuffer(self.tick_capacity, TICK_DTYPE)
+        buf.append((t_ns, price, size))
+        self._last_price[symbol] = price
+        self.aggregator.update(symbol, t_ns, price, size)
+
+    def on_tick(self, symbol, ts, price, size=0.0):
+        """Ingest one quote; every ratio that uses this symbol is updated too."""
+        price = float(price)
+        if not np.isfinite(price) or price <= 0:
+            return
+        t_ns = to_ns(ts)
+        self._record(symbol, t_ns, price, float(size))
+        for name in self._ratios_by_leg.get(symbol, ()):
+            num, den = self.ratios[name]
+            if num in self._last_price and den in self._last_price:
+                self._record(name, t_ns, self._last_price[num] / self._last_price[den], 0.0)
+
+    def ticks(self, symbol, n=None):
+        buf = self._ticks.get(symbol)
+        return buf.latest(n) if buf is not None else np.zeros(0, dtype=TICK_DTYPE)
+
+    def bars(self, symbol, tf='1m', n=None):
+        return self.aggregator.bars(symbol, tf, n)
+
+    def last(self, symbol):
+        return self._last_price.get(symbol)
+
+    def ratio(self, name):
+        return self._last_price.get(name)
+
+    @property
+    def nbytes(self):
+        """Total buffer memory — fixed once every symbol has been seen."""
+        total = sum(b.nbytes for b in self._ticks.values())
+        return total + sum(b.nbytes for b in self.aggregator._bars.values())
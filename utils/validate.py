@@ -0,0 +1,212 @@
+"""
+===============================================================================
+VALIDATE | Data-quality gate for everything entering the SeriesStore
+===============================================================================
+
+WHAT IT DOES
+  One vectorized pass per series, run by the store on every download before
+  the data is cached, so charts never see it unchecked:
+
+    duplicates     repeated dates (the last copy is kept)      → quarantined
+    out_of_range   ±inf, or outside BOUNDS for the series      → quarantined
+    gaps           expected observations missing, against the series'
+                   calendar (business days / weeks / months)   → flagged
+    nan_runs       consecutive NaNs longer than a holiday      → flagged
+    jumps          |change| > JUMP_Z robust z-scores (median / MAD of the
+                   changes; log changes for Yahoo prices)      → flagged
+
+  Quarantined points are dropped from what is cached and kept beside it in
+  <key>.quarantine.pkl; flags only go into the report. The report of the latest
+  ingest is stored in the series' meta under 'validation'.
+
+REPORT (JSON-serializable)
+  {'key', 'rows', 'freq', 'status': ok | flagged | quarantined | empty,
+   'counts': {check: n, ...}, 'quarantined': n,
+   'issues': {check: [first MAX_ITEMS entries], ...}}
+
+USAGE
+  clean, report = check('UNRATE', df)
+  clean, rejected, report = split('UNRATE', df, previous=cached)
+  reports = validate_store(store)          # every cached series, read-only
+===============================================================================
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.releases import spec_for
+
+# Plausible ranges; keys not listed only reject ±inf (Yahoo prices must be > 0)
+BOUNDS = {
+    'UNRATE': (0, 40), 'USREC': (0, 1), 'T10Y2Y': (-10, 10),
+    'SOFR': (-5, 30), 'OBFR': (-5, 30), 'IORB': (-5, 30), 'IOER': (-5, 30),
+    'CPIAUCSL': (0, None), 'INDPRO': (0, None), 'REVOLSL': (0, None),
+    'ICSA': (0, None), 'WALCL': (0, None),
+}
+YAHOO_BOUNDS = (0, None)                                    # exclusive lower bound
+MISSING_OK = {'daily': 2, 'weekly': 0, 'monthly': 0, 'quarterly': 0}   # holidays
+NAN_RUN_OK = {'daily': 3, 'weekly': 1, 'monthly': 1, 'quarterly': 1}
+JUMP_Z = 15
+JUMP_CONTEXT = 260                                          # cached rows the jump scale is estimated over
+NO_JUMPS = {'USREC'}                                        # 0/1 flags jump by design
+MAX_ITEMS = 20
+CHECKS = ('duplicates', 'out_of_range', 'gaps', 'nan_runs', 'jumps')
+LABELS = dict(zip(CHECKS, ('Dupes', 'Range', 'Gaps', 'NaNRuns', 'Jumps')))
+
+
+def frequency(key, days):
+    """Release-calendar frequency, else inferred from the median spacing (days: datetime64[D])."""
+    spec = spec_for(key)
+    if spec is not None:
+        return spec['freq']
+    if len(days) < 3:
+        return 'daily'
+    days = np.median(np.diff(days[-250:]).astype(float))
+    return 'daily' if days < 4 else 'weekly' if days < 15 else 'monthly' if days < 60 else 'quarterly'
+
+
+def _day(ts):
+    return str(pd.Timestamp(ts).date())
+
+
+def _missing(freq, dates):
+    """Expected observations missing between consecutive dates (datetime64[D])."""
+    if freq == 'daily':
+        return np.busday_count(dates[:-1] + 1, dates[1:])
+    if freq == 'weekly':
+        return np.rint((dates[1:] - dates[:-1]).astype(int) / 7).astype(int) - 1
+    months = dates.astype('datetime64[M]').astype(int)
+    step = 3 if freq == 'quarterly' else 1
+    return (months[1:] - months[:-1]) // step - 1
+
+
+def _runs(mask):
+    """(start, stop) index pairs of every True run."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def check(key, df, previous=None):
+    """(clean frame, report) for newly ingested rows."""
+    clean, _, report = split(key, df, previous)
+    return clean, report
+
+
+def split(key, df, previous=None):
+    """(clean rows, quarantined rows, report).
+
+    previous: the cached frame, if any; its last row before `df` gives the gap
+    and jump checks something to compare the first new point against.
+    """
+    t0 = time.perf_counter()
+    col = df.columns[0] if isinstance(df, pd.DataFrame) and len(df.columns) else None
+    report = dict(key=key, rows=len(df), freq=None, status='ok', quarantined=0,
+                  counts=dict.fromkeys(CHECKS, 0), issues={})
+    if col is None or df.empty:
+        report.update(status='empty', elapsed_ms=0.0)
+        return df, df.iloc[:0], report
+
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind='stable')
+    idx = pd.DatetimeIndex(df.index)
+    days = idx.values.astype('datetime64[D]')
+    values = df[col].to_numpy(dtype=float)
+    freq = report['freq'] = frequency(key, days)
+    issues = {}
+    bad = np.zeros(len(df), dtype=bool)
+
+    # duplicates: keep the last copy
+    dup = idx.duplicated(keep='last')
+    if dup.any():
+        issues['duplicates'] = [_day(d) for d in idx[dup]]
+        bad |= dup
+
+    # out of range
+    lo, hi = YAHOO_BOUNDS if key.startswith('yahoo:') else BOUNDS.get(key, (None, None))
+    with np.errstate(invalid='ignore'):
+        out = np.isinf(values)
+        if lo is not None:
+            out |= (values <= lo) if key.startswith('yahoo:') else (values < lo)
+        if hi is not None:
+            out |= values > hi
+    if out.any():
+        issues['out_of_range'] = [[_day(d), float(v) if np.isfinite(v) else str(v)]
+                                  for d, v in zip(idx[out], values[out])]
+        bad |= out
+
+    keep = ~bad
+    kidx, kval, kdays = (idx[keep], values[keep], days[keep]) if bad.any() else (idx, values, days)
+    context = 0                                     # cached rows prepended for comparison only
+    if previous is not None and len(previous) and len(kidx):
+        before = previous[previous.index < kidx[0]].iloc[-JUMP_CONTEXT:]
+        context = len(before)
+        kidx = pd.DatetimeIndex(before.index).append(kidx)
+        kval = np.concatenate((before.iloc[:, 0].to_numpy(dtype=float), kval))
+        kdays = np.concatenate((before.index.values.astype('datetime64[D]'), kdays))
+
+    # gaps against the expected calendar (new rows, and the first one vs. the cache)
+    first = max(context - 1, 0)
+    if len(kdays) - first > 1:
+        tail = kdays[first:]
+        missing = _missing(freq, tail)
+        gap = np.flatnonzero(missing > MISSING_OK[freq])
+        if len(gap):
+            issues['gaps'] = [[str(tail[i]), str(tail[i + 1]), int(missing[i])] for i in gap]
+
+    # NaN runs
+    starts, stops = _runs(np.isnan(kval[context:]))
+    long = (stops - starts) > NAN_RUN_OK[freq]
+    if long.any():
+        nidx = kidx[context:]
+        issues['nan_runs'] = [[_day(nidx[a]), _day(nidx[b - 1]), int(b - a)]
+                              for a, b in zip(starts[long], stops[long])]
+
+    # jumps: robust z of the changes between finite observations (scale from cache + new)
+    pos = np.flatnonzero(np.isfinite(kval))
+    if key not in NO_JUMPS and len(pos) > 10:
+        fval = np.log(kval[pos]) if key.startswith('yahoo:') else kval[pos]
+        change = np.diff(fval)
+        med = np.median(change)
+        mad = 1.4826 * np.median(np.abs(change - med))
+        if mad > 0:
+            z = np.abs(change - med) / mad
+            at = np.flatnonzero((z > JUMP_Z) & (pos[1:] >= context))
+            if len(at):
+                issues['jumps'] = [[_day(kidx[pos[i + 1]]), float(kval[pos[i + 1]]), round(float(z[i]), 1)]
+                                   for i in at]
+
+    report['counts'] = {c: len(issues.get(c, ())) for c in CHECKS}
+    report['issues'] = {c: v[:MAX_ITEMS] for c, v in issues.items()}
+    report['quarantined'] = int(bad.sum())
+    report['status'] = 'quarantined' if bad.any() else 'flagged' if issues else 'ok'
+    report['elapsed_ms'] = round((time.perf_counter() - t0) * 1000, 3)
+    if not bad.any():
+        return df, df.iloc[:0], report
+    return df[keep], df[bad], report
+
+
+def validate_store(store, keys=None):
+    """Read-only report for every cached series (checks the whole history)."""
+    reports = {}
+    for key in keys or store.keys():
+        df = store.load(key)
+        if df is not None:
+            reports[key] = check(key, df)[1]
+    return reports
+
+
+def format_reports(reports, show_ok=False):
+    lines = [f"=== DATA QUALITY ({len(reports)} series, "
+             f"{sum(r.get('elapsed_ms', 0) for r in reports.values()):.1f} ms) ===",
+             f"{'Series':<16} {'Freq':<8} {'Rows':>7} {'Status':<12} "
+             + ' '.join(f"{LABELS[c]:>7}" for c in CHECKS)]
+    for key, r in sorted(reports.items()):
+        if r['status'] == 'ok' and not show_ok:
+            continue
+        lines.append(f"{key:<16} {r['freq'] or '—':<8} {r['rows']:>7,} {r['status']:<12} "
+                     + ' '.join(f"{r['counts'][c]:>7}" for c in CHECKS))
+    ok = sum(r['status'] == 'ok' for r in reports.values())
+    lines.append(f"{ok} of {len(reports)} series clean")
+    return lines